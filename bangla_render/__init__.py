@@ -24,89 +24,130 @@ Typical usage:
     br.apply_bangla_layout(fig, auto=True)
 """
 
-__version__ = "0.2.0"
+__version__ = "0.2.1"
 
-# ---------------------------------------------------------------------
-# Backend / environment
-# ---------------------------------------------------------------------
-
-from .backend import (
-    init_renderer,
-    ensure_qt_application,
-    get_renderer_status,
-    check_environment,
-    is_headless_environment,
-    is_notebook_environment,
-    is_colab_environment,
-    is_kaggle_environment,
-    reset_renderer_state,
-)
+import importlib
 
 # ---------------------------------------------------------------------
-# Font management
+# Lazy public API
 # ---------------------------------------------------------------------
+#
+# Submodules are imported on first attribute access (PEP 562), so
+# ``import bangla_render`` does not pull in PySide6 or Matplotlib; Qt is
+# loaded when the first render/font function is looked up.
 
-from .fonts import (
-    register_font,
-    register_fonts,
-    list_available_fonts,
-    list_registered_fonts,
-    list_bangla_candidate_fonts,
-    set_default_font,
-    get_default_font,
-    resolve_font,
-    validate_font,
-    find_best_bangla_font,
-    ensure_default_font,
-    font_info,
-)
-
-# ---------------------------------------------------------------------
-# Rendering
-# ---------------------------------------------------------------------
+_LAZY_ATTRS = {
+    # backend / environment
+    "init_renderer": "backend",
+    "ensure_qt_application": "backend",
+    "get_renderer_status": "backend",
+    "check_environment": "backend",
+    "is_headless_environment": "backend",
+    "is_notebook_environment": "backend",
+    "is_colab_environment": "backend",
+    "is_kaggle_environment": "backend",
+    "reset_renderer_state": "backend",
+    # font management
+    "register_font": "fonts",
+    "register_fonts": "fonts",
+    "register_font_directory": "fonts",
+    "list_available_fonts": "fonts",
+    "list_registered_fonts": "fonts",
+    "list_bangla_candidate_fonts": "fonts",
+    "set_default_font": "fonts",
+    "get_default_font": "fonts",
+    "resolve_font": "fonts",
+    "validate_font": "fonts",
+    "find_best_bangla_font": "fonts",
+    "ensure_default_font": "fonts",
+    "font_info": "fonts",
+    "get_font_pool_info": "fonts",
+    "clear_font_pool": "fonts",
+    "set_fallback_fonts": "fonts",
+    "get_fallback_fonts": "fonts",
+    "set_font_validation_cache": "fonts",
+    "clear_font_validation_cache": "fonts",
+    "get_font_validation_cache_info": "fonts",
+    "segment_text": "coverage",
+    "get_font_catalog_info": "font_catalog",
+    "rebuild_font_catalog": "font_catalog",
+    "set_font_catalog": "font_catalog",
+    # rendering
+    "render_text": "renderer",
+    "render_paragraph": "renderer",
+    "render_text_qimage": "renderer",
+    "render_text_array": "renderer",
+    "render_paragraph_qimage": "renderer",
+    "render_paragraph_tiles": "renderer",
+    "measure_text": "renderer",
+    "measure_texts": "renderer",
+    "clear_render_cache": "renderer",
+    "get_render_cache_info": "renderer",
+    "set_render_cache_maxsize": "renderer",
+    "set_render_cache_cold_tier": "renderer",
+    "enable_shared_render_cache": "renderer",
+    "disable_shared_render_cache": "renderer",
+    "get_shared_render_cache_info": "renderer",
+    "save_render_cache": "renderer",
+    "load_render_cache": "renderer",
+    "set_render_defaults": "renderer",
+    "get_render_defaults": "renderer",
+    "available_render_engines": "engines",
+    "set_render_engine": "engines",
+    "get_render_engine": "engines",
+    "RenderExecutor": "executor",
+    "iter_render": "executor",
+    "warm_render_cache": "warmup",
+    "load_vocabulary": "warmup",
+    "style_grid": "warmup",
+    "FigureJob": "pool",
+    "FigurePool": "pool",
+    "render_figures": "pool",
+    "render_text_async": "async_support",
+    "render_texts_async": "async_support",
+    "render_paragraph_async": "async_support",
+    "set_async_executor": "async_support",
+    "get_async_render_stats": "async_support",
+    "RenderServer": "server",
+    "RenderClient": "server",
+    # layout
+    "get_layout_manager": "layout",
+    "clear_layout_manager": "layout",
+    # Matplotlib-facing APIs
+    "to_bangla_numerals": "mpl_support",
+    "text_colormap": "mpl_support",
+    "format_bangla_numbers": "mpl_support",
+    "set_bangla_legend": "mpl_support",
+    "set_bangla_numeric_ticks": "mpl_support",
+    "set_bangla_title": "mpl_support",
+    "set_bangla_xlabel": "mpl_support",
+    "set_bangla_ylabel": "mpl_support",
+    "set_bangla_suptitle": "mpl_support",
+    "set_bangla_xticks": "mpl_support",
+    "set_bangla_yticks": "mpl_support",
+    "add_bangla_in_cell": "mpl_support",
+    "bangla_text": "mpl_support",
+    "annotate_bangla": "mpl_support",
+    "bangla_paragraph": "mpl_support",
+    "apply_bangla_layout": "mpl_support",
+}
 
-from .renderer import (
-    render_text,
-    render_paragraph,
-    render_text_qimage,
-    render_paragraph_qimage,
-    measure_text,
-    clear_render_cache,
-    get_render_cache_info,
-    set_render_cache_maxsize,
-    set_render_defaults,
-    get_render_defaults,
-)
+_SUBMODULES = frozenset(_LAZY_ATTRS.values()) | {"shm_cache"}
 
-# ---------------------------------------------------------------------
-# Layout
-# ---------------------------------------------------------------------
 
-from .layout import (
-    get_layout_manager,
-    clear_layout_manager,
-)
+def __getattr__(name):
+    if name in _SUBMODULES:
+        return importlib.import_module(f".{name}", __name__)
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
 
-# ---------------------------------------------------------------------
-# Matplotlib-facing APIs
-# ---------------------------------------------------------------------
 
-from .mpl_support import (
-    to_bangla_numerals,
-    set_bangla_legend,
-    set_bangla_numeric_ticks,
-    set_bangla_title,
-    set_bangla_xlabel,
-    set_bangla_ylabel,
-    set_bangla_suptitle,
-    set_bangla_xticks,
-    set_bangla_yticks,
-    add_bangla_in_cell,
-    bangla_text,
-    annotate_bangla,
-    bangla_paragraph,
-    apply_bangla_layout,
-)
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
 
 
 def text(ax, *args, **kwargs):
@@ -116,6 +157,8 @@ def text(ax, *args, **kwargs):
         import bangla_render as br
         br.text(ax, 0.5, 0.5, "বাংলা", coord="axes")
     """
+    from .mpl_support import bangla_text
+
     return bangla_text(ax, *args, **kwargs)
 
 
@@ -134,6 +177,7 @@ __all__ = [
     # fonts
     "register_font",
     "register_fonts",
+    "register_font_directory",
     "list_available_fonts",
     "list_registered_fonts",
     "list_bangla_candidate_fonts",
@@ -144,22 +188,62 @@ __all__ = [
     "find_best_bangla_font",
     "ensure_default_font",
     "font_info",
+    "get_font_pool_info",
+    "clear_font_pool",
+    "set_fallback_fonts",
+    "get_fallback_fonts",
+    "set_font_validation_cache",
+    "clear_font_validation_cache",
+    "get_font_validation_cache_info",
+    "segment_text",
+    "get_font_catalog_info",
+    "rebuild_font_catalog",
+    "set_font_catalog",
     # renderer
     "render_text",
     "render_paragraph",
     "render_text_qimage",
+    "render_text_array",
     "render_paragraph_qimage",
+    "render_paragraph_tiles",
     "measure_text",
+    "measure_texts",
     "clear_render_cache",
     "get_render_cache_info",
     "set_render_cache_maxsize",
+    "set_render_cache_cold_tier",
+    "enable_shared_render_cache",
+    "disable_shared_render_cache",
+    "get_shared_render_cache_info",
+    "save_render_cache",
+    "load_render_cache",
     "set_render_defaults",
     "get_render_defaults",
+    "available_render_engines",
+    "set_render_engine",
+    "get_render_engine",
+    "RenderExecutor",
+    "iter_render",
+    "warm_render_cache",
+    "load_vocabulary",
+    "style_grid",
+    "FigureJob",
+    "FigurePool",
+    "render_figures",
+    "render_text_async",
+    "render_texts_async",
+    "render_paragraph_async",
+    "set_async_executor",
+    "get_async_render_stats",
+    "RenderServer",
+    "RenderClient",
     # layout
     "get_layout_manager",
     "clear_layout_manager",
     # mpl support
     "to_bangla_numerals",
+    "text_colormap",
+    "format_bangla_numbers",
     "set_bangla_numeric_ticks",
     "set_bangla_legend",
     "set_bangla_title",
@@ -0,0 +1,165 @@
+# bangla_render/async_support.py
+from __future__ import annotations
+
+import asyncio
+import threading
+import weakref
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from .backend import _existing_app
+from .engines import get_render_engine
+from .executor import RenderExecutor
+from .renderer import (
+    _paragraph_text_cache_key,
+    _single_line_cache_key,
+    render_paragraph_qimage,
+    render_text_qimage,
+)
+
+try:
+    from PySide6.QtGui import QImage
+except Exception:  # pragma: no cover
+    QImage = None
+
+
+# ---------------------------------------------------------------------
+# Managed executor / in-flight table
+# ---------------------------------------------------------------------
+
+_EXECUTOR: Optional[RenderExecutor] = None
+_EXECUTOR_OWNED = False
+_EXECUTOR_LOCK = threading.Lock()
+
+# event loop -> {call key: asyncio.Future}; requests for a key that is
+# already rendering await the same future instead of rendering again.
+_IN_FLIGHT: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+_STATS = {
+    "submitted": 0,
+    "coalesced": 0,
+}
+
+
+def _executor() -> RenderExecutor:
+    global _EXECUTOR, _EXECUTOR_OWNED
+    with _EXECUTOR_LOCK:
+        if _EXECUTOR is None:
+            # Creating the executor creates the Qt application if there is
+            # none yet, and Qt needs that to happen on the main thread.
+            if (
+                threading.current_thread() is not threading.main_thread()
+                and get_render_engine().name == "qt"
+                and _existing_app() is None
+            ):
+                raise RuntimeError(
+                    "Async rendering from an event loop outside the main thread needs the "
+                    "Qt application first: call init_renderer() or "
+                    "set_async_executor(RenderExecutor()) on the main thread."
+                )
+            _EXECUTOR = RenderExecutor()
+            _EXECUTOR_OWNED = True
+        return _EXECUTOR
+
+
+def set_async_executor(executor: Optional[RenderExecutor]) -> None:
+    """
+    Use ``executor`` for async rendering (None restores the lazily created
+    default). A default executor created by this module is shut down;
+    executors passed in by the caller are left to the caller.
+
+    The default executor is created on first use. If the event loop runs
+    outside the main thread, call init_renderer() (or pass an executor
+    created there) on the main thread first.
+    """
+    global _EXECUTOR, _EXECUTOR_OWNED
+    with _EXECUTOR_LOCK:
+        previous, owned = _EXECUTOR, _EXECUTOR_OWNED
+        _EXECUTOR, _EXECUTOR_OWNED = executor, False
+    if owned and previous is not None and previous is not executor:
+        previous.shutdown(wait=False)
+
+
+def get_async_render_stats() -> Dict[str, int]:
+    in_flight = sum(len(table) for table in list(_IN_FLIGHT.values()))
+    return {
+        "submitted": _STATS["submitted"],
+        "coalesced": _STATS["coalesced"],
+        "in_flight": in_flight,
+    }
+
+
+def _call_key(kind: str, text: str, style: Dict[str, Any]) -> Optional[Tuple[Any, ...]]:
+    # The render cache key, so spellings the cache treats as one image
+    # ("k" vs (0, 0, 0), NFC vs NFD text) share one render. Arguments the
+    # key cannot be built from are not coalesced; the render reports them.
+    try:
+        if kind == "paragraph":
+            key = _paragraph_text_cache_key(text, **style)
+        else:
+            key = _single_line_cache_key(get_render_engine(), text, **style)
+        hash(key)
+    except Exception:
+        return None
+    return (kind,) + key
+
+
+async def _render_coalesced(kind: str, fn, text: str, style: Dict[str, Any]):
+    loop = asyncio.get_running_loop()
+    table = _IN_FLIGHT.setdefault(loop, {})
+    executor = _executor()
+    key = _call_key(kind, text, style)
+
+    fut = table.get(key) if key is not None else None
+    if fut is None:
+        _STATS["submitted"] += 1
+        fut = asyncio.wrap_future(executor.submit_call(fn, text, **style), loop=loop)
+        if key is not None:
+            table[key] = fut
+            fut.add_done_callback(lambda _f, k=key: table.pop(k, None))
+    else:
+        _STATS["coalesced"] += 1
+
+    # shield: one cancelled caller must not cancel a render others await
+    qimg = await asyncio.shield(fut)
+    # Coalesced callers get their own (copy-on-write) handle.
+    return QImage(qimg)
+
+
+# ---------------------------------------------------------------------
+# Public API
+# ---------------------------------------------------------------------
+
+async def render_text_async(text: str, **style) -> QImage:
+    """
+    Async counterpart of render_text_qimage().
+
+    Rendering runs on a managed RenderExecutor so the event loop is not
+    blocked. Concurrent requests with the same text and style share one
+    render.
+    """
+    return await _render_coalesced("text", render_text_qimage, text, style)
+
+
+async def render_texts_async(texts: Sequence[str], **style) -> List[QImage]:
+    """
+    Render many single-line texts concurrently; results are in input order.
+    """
+    return list(
+        await asyncio.gather(*(render_text_async(t, **style) for t in texts))
+    )
+
+
+async def render_paragraph_async(text: str, **style) -> QImage:
+    """
+    Async counterpart of render_paragraph_qimage().
+    """
+    return await _render_coalesced("paragraph", render_paragraph_qimage, text, style)
+
+
+__all__ = [
+    "render_text_async",
+    "render_texts_async",
+    "render_paragraph_async",
+    "set_async_executor",
+    "get_async_render_stats",
+]
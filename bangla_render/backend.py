@@ -4,19 +4,46 @@ from __future__ import annotations
 import os
 import sys
 import platform
+import threading
 from dataclasses import dataclass, asdict, field
 from typing import Any, Dict, List, Optional
 
-try:
-    from PySide6.QtGui import QGuiApplication
-    from PySide6.QtWidgets import QApplication
-    QT_AVAILABLE = True
-    QT_IMPORT_ERROR = None
-except Exception as e:  # pragma: no cover
-    QGuiApplication = None
-    QApplication = None
-    QT_AVAILABLE = False
-    QT_IMPORT_ERROR = e
+# PySide6 is imported on first use (see _load_qt) so that importing the
+# package and the environment helpers stays cheap. QT_AVAILABLE is None
+# until then. QtWidgets is only imported for the "widgets" app mode.
+QGuiApplication = None
+QApplication = None
+QT_AVAILABLE: Optional[bool] = None
+QT_IMPORT_ERROR: Optional[BaseException] = None
+
+# "gui": QGuiApplication, all that offscreen font rendering needs.
+# "widgets": QApplication, needed when the same process also shows Qt
+# widgets (e.g. Matplotlib's QtAgg backend).
+APP_MODES = ("gui", "widgets")
+
+
+def _load_qt() -> bool:
+    global QGuiApplication, QT_AVAILABLE, QT_IMPORT_ERROR
+
+    if QT_AVAILABLE is None:
+        try:
+            from PySide6.QtGui import QGuiApplication as _QGuiApplication
+        except Exception as e:  # pragma: no cover
+            QT_AVAILABLE = False
+            QT_IMPORT_ERROR = e
+        else:
+            QGuiApplication = _QGuiApplication
+            QT_AVAILABLE = True
+    return QT_AVAILABLE
+
+
+def _load_qt_widgets():
+    global QApplication
+
+    if QApplication is None:
+        from PySide6.QtWidgets import QApplication as _QApplication
+        QApplication = _QApplication
+    return QApplication
 
 
 # ---------------------------------------------------------------------
@@ -26,14 +53,20 @@ except Exception as e:  # pragma: no cover
 _APP = None
 _INITIALIZED = False
 
+# Serializes initialization so concurrent first renders from worker
+# threads do not race to create the application object.
+_INIT_LOCK = threading.RLock()
+
 
 @dataclass
 class RendererStatus:
-    qt_available: bool = QT_AVAILABLE
+    qt_available: bool = False
     qt_import_error: Optional[str] = None
     initialized: bool = False
     app_created: bool = False
     app_class: Optional[str] = None
+    app_mode: Optional[str] = None
+    backend: str = "qt"
     platform_name: str = field(default_factory=lambda: platform.system())
     python_version: str = field(default_factory=lambda: platform.python_version())
     headless: bool = False
@@ -46,9 +79,7 @@ class RendererStatus:
         return asdict(self)
 
 
-_STATUS = RendererStatus(
-    qt_import_error=str(QT_IMPORT_ERROR) if QT_IMPORT_ERROR else None
-)
+_STATUS = RendererStatus()
 
 
 # ---------------------------------------------------------------------
@@ -131,24 +162,25 @@ def _existing_app():
     """
     Return an existing Qt application instance if one exists.
     """
-    if not QT_AVAILABLE:
+    # No application can exist before PySide6 has been imported.
+    if "PySide6.QtGui" not in sys.modules or not _load_qt():
         return None
 
+    # instance() returns the most derived type, so this also finds a
+    # QApplication created by the host program.
     try:
-        app = QApplication.instance()
-        if app is not None:
-            return app
+        return QGuiApplication.instance()
     except Exception:
-        pass
+        return None
 
-    try:
-        app = QGuiApplication.instance()
-        if app is not None:
-            return app
-    except Exception:
-        pass
 
-    return None
+def _app_mode_of(app) -> Optional[str]:
+    if app is None:
+        return None
+    widgets = sys.modules.get("PySide6.QtWidgets")
+    if widgets is not None and isinstance(app, widgets.QApplication):
+        return "widgets"
+    return "gui"
 
 
 # ---------------------------------------------------------------------
@@ -159,6 +191,8 @@ def init_renderer(
     headless: Optional[bool] = None,
     offscreen: bool = True,
     force: bool = False,
+    app_mode: Optional[str] = None,
+    backend: Optional[str] = None,
 ) -> Any:
     """
     Initialize a Qt application safely for Bengali text rendering.
@@ -172,6 +206,15 @@ def init_renderer(
         Whether to request Qt offscreen mode in headless environments.
     force:
         If True, re-run initialization logic even if already initialized.
+    app_mode:
+        "gui" creates a lean QGuiApplication (QtWidgets is never imported),
+        "widgets" a full QApplication. If None, "gui" is used in headless
+        environments and "widgets" otherwise. An existing application is
+        always reused as-is.
+    backend:
+        Render backend for single-line rendering and measurement: "qt"
+        (default), "harfbuzz" (uharfbuzz + freetype-py) or "pillow"
+        (Pillow built with libraqm). With a non-Qt backend no Qt application is created and None is returned.
 
     Returns
     -------
@@ -185,45 +228,117 @@ def init_renderer(
     """
     global _APP, _INITIALIZED, _STATUS
 
-    if not QT_AVAILABLE:
-        raise RuntimeError(
-            "PySide6 is not available. Install PySide6 to use bangla_render.\n"
-            f"Original import error: {QT_IMPORT_ERROR}"
-        )
+    if app_mode is not None and app_mode not in APP_MODES:
+        raise ValueError(f"app_mode must be one of {APP_MODES}, got {app_mode!r}")
 
-    inferred_headless = is_headless_environment()
-    use_headless = _normalize_bool(headless, inferred_headless)
+    with _INIT_LOCK:
+        if backend is not None:
+            from .engines import set_render_engine
 
-    warnings: List[str] = []
+            _STATUS.backend = set_render_engine(backend).name
+            if _STATUS.backend != "qt":
+                _STATUS.initialized = True
+                _STATUS.headless = _normalize_bool(headless, is_headless_environment())
+                return None
 
-    if _INITIALIZED and not force:
-        _STATUS.headless = use_headless
-        _STATUS.offscreen_requested = bool(offscreen)
-        _STATUS.qt_qpa_platform = os.environ.get("QT_QPA_PLATFORM")
-        _STATUS.offscreen_enabled = (
-            (_STATUS.qt_qpa_platform or "").lower() == "offscreen"
-        )
-        if warnings:
-            _STATUS.warnings.extend(warnings)
-        return _APP
+        if not _load_qt():
+            raise RuntimeError(
+                "PySide6 is not available. Install PySide6 to use bangla_render.\n"
+                f"Original import error: {QT_IMPORT_ERROR}"
+            )
 
-    if use_headless and offscreen:
-        enabled = _ensure_offscreen_env(force=force)
-        if enabled:
-            _STATUS.offscreen_enabled = True
-        else:
-            warnings.append(
-                "Headless mode detected, but QT_QPA_PLATFORM is not set to 'offscreen'."
+        inferred_headless = is_headless_environment()
+        use_headless = _normalize_bool(headless, inferred_headless)
+        if app_mode is None:
+            app_mode = "gui" if use_headless else "widgets"
+
+        warnings: List[str] = []
+
+        if _INITIALIZED and not force:
+            _STATUS.headless = use_headless
+            _STATUS.offscreen_requested = bool(offscreen)
+            _STATUS.qt_qpa_platform = os.environ.get("QT_QPA_PLATFORM")
+            _STATUS.offscreen_enabled = (
+                (_STATUS.qt_qpa_platform or "").lower() == "offscreen"
             )
+            if warnings:
+                _STATUS.warnings.extend(warnings)
+            return _APP
+
+        if use_headless and offscreen:
+            enabled = _ensure_offscreen_env(force=force)
+            if enabled:
+                _STATUS.offscreen_enabled = True
+            else:
+                warnings.append(
+                    "Headless mode detected, but QT_QPA_PLATFORM is not set to 'offscreen'."
+                )
+
+        existing = _existing_app()
+        if existing is not None:
+            _APP = existing
+            _INITIALIZED = True
+
+            _STATUS.initialized = True
+            _STATUS.app_created = True
+            _STATUS.app_class = type(existing).__name__
+            _STATUS.app_mode = _app_mode_of(existing)
+            _STATUS.headless = use_headless
+            _STATUS.offscreen_requested = bool(offscreen)
+            _STATUS.qt_qpa_platform = os.environ.get("QT_QPA_PLATFORM")
+            _STATUS.offscreen_enabled = (
+                (_STATUS.qt_qpa_platform or "").lower() == "offscreen"
+            )
+            _STATUS.warnings = warnings
+            return _APP
+
+        argv = [sys.argv[0] if sys.argv else "bangla_render"]
+
+        try:
+            if app_mode == "widgets":
+                _APP = _load_qt_widgets()(argv)
+            else:
+                _APP = QGuiApplication(argv)
+        except Exception as e:
+            _STATUS.initialized = False
+            _STATUS.app_created = False
+            _STATUS.app_class = None
+            _STATUS.app_mode = None
+            _STATUS.headless = use_headless
+            _STATUS.offscreen_requested = bool(offscreen)
+            _STATUS.qt_qpa_platform = os.environ.get("QT_QPA_PLATFORM")
+            _STATUS.offscreen_enabled = (
+                (_STATUS.qt_qpa_platform or "").lower() == "offscreen"
+            )
+            _STATUS.warnings = warnings
+
+            extra = []
+            if use_headless and offscreen:
+                extra.append(
+                    "This looks like a headless environment. Qt offscreen rendering was requested."
+                )
+            if is_colab_environment():
+                extra.append(
+                    "Detected Google Colab. You may also need to install fonts and keep QT_QPA_PLATFORM=offscreen."
+                )
+            if is_kaggle_environment():
+                extra.append(
+                    "Detected Kaggle. You may also need to install fonts and keep QT_QPA_PLATFORM=offscreen."
+                )
+
+            extra_text = "\n".join(extra)
+            raise RuntimeError(
+                "Failed to initialize Qt for bangla_render.\n"
+                f"Qt error: {e}\n"
+                f"{extra_text}".strip()
+            ) from e
 
-    existing = _existing_app()
-    if existing is not None:
-        _APP = existing
         _INITIALIZED = True
 
         _STATUS.initialized = True
         _STATUS.app_created = True
-        _STATUS.app_class = type(existing).__name__
+        _STATUS.app_class = type(_APP).__name__
+        _STATUS.app_mode = app_mode
         _STATUS.headless = use_headless
         _STATUS.offscreen_requested = bool(offscreen)
         _STATUS.qt_qpa_platform = os.environ.get("QT_QPA_PLATFORM")
@@ -231,70 +346,21 @@ def init_renderer(
             (_STATUS.qt_qpa_platform or "").lower() == "offscreen"
         )
         _STATUS.warnings = warnings
-        return _APP
-
-    argv = [sys.argv[0] if sys.argv else "bangla_render"]
 
-    try:
-        _APP = QApplication(argv)
-    except Exception as e:
-        _STATUS.initialized = False
-        _STATUS.app_created = False
-        _STATUS.app_class = None
-        _STATUS.headless = use_headless
-        _STATUS.offscreen_requested = bool(offscreen)
-        _STATUS.qt_qpa_platform = os.environ.get("QT_QPA_PLATFORM")
-        _STATUS.offscreen_enabled = (
-            (_STATUS.qt_qpa_platform or "").lower() == "offscreen"
-        )
-        _STATUS.warnings = warnings
-
-        extra = []
-        if use_headless and offscreen:
-            extra.append(
-                "This looks like a headless environment. Qt offscreen rendering was requested."
-            )
-        if is_colab_environment():
-            extra.append(
-                "Detected Google Colab. You may also need to install fonts and keep QT_QPA_PLATFORM=offscreen."
+        if use_headless and not _STATUS.offscreen_enabled:
+            _STATUS.warnings.append(
+                "Headless environment detected, but offscreen Qt platform is not active."
             )
-        if is_kaggle_environment():
-            extra.append(
-                "Detected Kaggle. You may also need to install fonts and keep QT_QPA_PLATFORM=offscreen."
-            )
-
-        extra_text = "\n".join(extra)
-        raise RuntimeError(
-            "Failed to initialize Qt for bangla_render.\n"
-            f"Qt error: {e}\n"
-            f"{extra_text}".strip()
-        ) from e
-
-    _INITIALIZED = True
-
-    _STATUS.initialized = True
-    _STATUS.app_created = True
-    _STATUS.app_class = type(_APP).__name__
-    _STATUS.headless = use_headless
-    _STATUS.offscreen_requested = bool(offscreen)
-    _STATUS.qt_qpa_platform = os.environ.get("QT_QPA_PLATFORM")
-    _STATUS.offscreen_enabled = (
-        (_STATUS.qt_qpa_platform or "").lower() == "offscreen"
-    )
-    _STATUS.warnings = warnings
 
-    if use_headless and not _STATUS.offscreen_enabled:
-        _STATUS.warnings.append(
-            "Headless environment detected, but offscreen Qt platform is not active."
-        )
-
-    return _APP
+        return _APP
 
 
 def ensure_qt_application() -> Any:
     """
     Convenience wrapper for lazy initialization with safe defaults.
     """
+    if _INITIALIZED and _APP is not None:
+        return _APP
     return init_renderer(headless=None, offscreen=True, force=False)
 
 
@@ -302,7 +368,7 @@ def get_renderer_status() -> Dict[str, Any]:
     """
     Return backend/Qt initialization status as a plain dictionary.
     """
-    _STATUS.qt_available = QT_AVAILABLE
+    _STATUS.qt_available = _load_qt()
     _STATUS.qt_import_error = str(QT_IMPORT_ERROR) if QT_IMPORT_ERROR else None
     _STATUS.qt_qpa_platform = os.environ.get("QT_QPA_PLATFORM")
     _STATUS.offscreen_enabled = ((_STATUS.qt_qpa_platform or "").lower() == "offscreen")
@@ -319,7 +385,8 @@ def check_environment() -> Dict[str, Any]:
     qt_qpa = os.environ.get("QT_QPA_PLATFORM")
     headless = is_headless_environment()
 
-    if not QT_AVAILABLE:
+    qt_available = _load_qt()
+    if not qt_available:
         warnings.append("PySide6 is not installed or failed to import.")
 
     if headless and (qt_qpa or "").lower() != "offscreen":
@@ -337,9 +404,17 @@ def check_environment() -> Dict[str, Any]:
             "Running in Kaggle. Bengali fonts may need manual installation or registration."
         )
 
+    from .engines import active_render_engine_name, available_render_engines
+
+    backends = available_render_engines()
+    if not any(backends.values()):
+        warnings.append("No render backend is available (install PySide6, uharfbuzz + freetype-py, or Pillow with libraqm).")
+
     return {
-        "qt_available": QT_AVAILABLE,
+        "qt_available": qt_available,
         "qt_import_error": str(QT_IMPORT_ERROR) if QT_IMPORT_ERROR else None,
+        "backend": active_render_engine_name(),
+        "backends": backends,
         "headless": headless,
         "notebook": is_notebook_environment(),
         "colab": is_colab_environment(),
@@ -363,11 +438,13 @@ def reset_renderer_state() -> None:
     _INITIALIZED = existing is not None
 
     _STATUS = RendererStatus(
-        qt_import_error=str(QT_IMPORT_ERROR) if QT_IMPORT_ERROR else None
+        qt_available=bool(QT_AVAILABLE),
+        qt_import_error=str(QT_IMPORT_ERROR) if QT_IMPORT_ERROR else None,
     )
     _STATUS.initialized = _INITIALIZED
     _STATUS.app_created = existing is not None
     _STATUS.app_class = type(existing).__name__ if existing is not None else None
+    _STATUS.app_mode = _app_mode_of(existing)
     _STATUS.qt_qpa_platform = os.environ.get("QT_QPA_PLATFORM")
     _STATUS.offscreen_enabled = (
         ((_STATUS.qt_qpa_platform or "").lower() == "offscreen")
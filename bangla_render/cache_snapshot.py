@@ -0,0 +1,170 @@
+# bangla_render/cache_snapshot.py
+"""
+On-disk snapshots of the render cache.
+
+A snapshot is one file:
+
+    magic     8 bytes   b"BRCSNAP\\0"
+    version   u32 LE    SNAPSHOT_VERSION
+    length    u32 LE    size of the index that follows
+    index     UTF-8 JSON: library version, cache key layout, font
+              fingerprints and one record per entry (cache key, font,
+              kind, geometry, QImage format, offset)
+    blobs     raw pixel rows, each starting on a 64-byte boundary
+
+The blobs are read through a read-only memory map, so loading a snapshot
+costs one parse of the index; pixel pages are faulted in when an entry is
+first used. Views returned by view() keep the map alive, so it is
+unmapped once the last of them is gone.
+"""
+from __future__ import annotations
+
+import json
+import mmap
+import os
+import struct
+import tempfile
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+SNAPSHOT_MAGIC = b"BRCSNAP\0"
+SNAPSHOT_VERSION = 2
+
+_PREAMBLE = struct.Struct("<8sII")
+_ALIGN = 64
+
+_KEY_TYPES = (str, int, float, bool, type(None))
+
+
+def encode_key(key: Tuple[Any, ...]) -> Optional[List[Any]]:
+    """
+    JSON form of a render cache key, or None when it holds anything but
+    plain scalars.
+    """
+    if not all(isinstance(v, _KEY_TYPES) for v in key):
+        return None
+    return list(key)
+
+
+def write_snapshot(
+    path: str,
+    entries: Sequence[Dict[str, Any]],
+    library_version: str,
+    key_layout: int,
+    fonts: Sequence[Tuple[str, Optional[str], str]],
+) -> Dict[str, Any]:
+    """
+    Atomically write ``entries`` to ``path``.
+
+    Each entry is a dict with ``key`` (JSON-encodable list), ``font``
+    (index into ``fonts``), ``kind``, ``fmt``, ``width`` (image width in
+    pixels) and ``pixels`` (a C-contiguous uint8 array); ``fonts`` are
+    ``(family, font_path, fingerprint)`` triples. ``key_layout`` is the
+    version of the cache key layout the keys were built with.
+    """
+    records = []
+    offset = 0
+    for entry in entries:
+        nbytes = int(entry["pixels"].nbytes)
+        records.append({
+            "key": entry["key"],
+            "font": int(entry["font"]),
+            "kind": entry["kind"],
+            "fmt": int(entry["fmt"]),
+            "width": int(entry["width"]),
+            "shape": [int(n) for n in entry["pixels"].shape],
+            "offset": offset,
+            "nbytes": nbytes,
+        })
+        offset += -(-nbytes // _ALIGN) * _ALIGN
+
+    index = json.dumps(
+        {
+            "library": library_version,
+            "key_layout": int(key_layout),
+            "fonts": [list(f) for f in fonts],
+            "entries": records,
+        },
+        ensure_ascii=False,
+        separators=(",", ":"),
+    ).encode("utf-8")
+    head = _PREAMBLE.size + len(index)
+    base = -(-head // _ALIGN) * _ALIGN
+
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(prefix=".snapshot-", dir=directory)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(_PREAMBLE.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, len(index)))
+            f.write(index)
+            f.write(b"\0" * (base - head))
+            for entry, record in zip(entries, records):
+                f.seek(base + record["offset"])
+                f.write(memoryview(entry["pixels"]).cast("B"))
+            f.truncate(base + offset)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+    return {"path": path, "entries": len(records), "bytes": base + offset}
+
+
+class Snapshot:
+    """
+    A snapshot file opened for reading; ``view(record)`` returns a
+    read-only NumPy view of an entry's pixels in the memory map. close()
+    drops the snapshot's own reference to the map.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as f:
+            preamble = f.read(_PREAMBLE.size)
+            if len(preamble) < _PREAMBLE.size:
+                raise ValueError(f"{path!r} is not a render cache snapshot")
+            magic, version, length = _PREAMBLE.unpack(preamble)
+            if magic != SNAPSHOT_MAGIC:
+                raise ValueError(f"{path!r} is not a render cache snapshot")
+            if version != SNAPSHOT_VERSION:
+                raise ValueError(
+                    f"Render cache snapshot {path!r} has format version {version}; "
+                    f"this bangla_render reads version {SNAPSHOT_VERSION}."
+                )
+            index = json.loads(f.read(length).decode("utf-8"))
+            head = _PREAMBLE.size + length
+            self.base = -(-head // _ALIGN) * _ALIGN
+            size = os.fstat(f.fileno()).st_size
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if size > self.base else None
+
+        self.library_version: str = index["library"]
+        self.key_layout: int = index["key_layout"]
+        self.fonts: List[Tuple[str, Optional[str], str]] = [tuple(f) for f in index["fonts"]]
+        self.records: List[Dict[str, Any]] = index["entries"]
+
+    def view(self, record: Dict[str, Any]) -> np.ndarray:
+        if not record["nbytes"]:
+            return np.zeros(record["shape"], dtype=np.uint8)
+        return np.frombuffer(
+            self._mmap,
+            dtype=np.uint8,
+            count=record["nbytes"],
+            offset=self.base + record["offset"],
+        ).reshape(record["shape"])
+
+    def close(self) -> None:
+        self._mmap = None
+
+
+__all__ = [
+    "SNAPSHOT_VERSION",
+    "Snapshot",
+    "encode_key",
+    "write_snapshot",
+]
@@ -0,0 +1,295 @@
+# bangla_render/cold_cache.py
+"""
+Compressed cold tier of the render cache.
+
+Images evicted from the hot LRU (ready-to-use QImages / RGBA arrays) are
+demoted here instead of being dropped, and promoted back on the next hit.
+Rendered labels are single-colour ink on a transparent background, so an
+(H, W, 4) image usually reduces to its alpha plane plus one RGB triple:
+
+- ``alpha`` entries keep the compressed alpha plane, the ink colour and
+  the colour of fully transparent pixels (Qt clears them to 0, the
+  FreeType backends leave the ink colour), as packed 24-bit RGB;
+- anything else (opaque backgrounds, colour glyphs, and the single
+  plane of alpha-mode masks) is stored as ``planes``: the byte planes
+  one after another, which compresses far better than interleaved RGBA.
+
+An entry is only stored as ``alpha`` when the reconstruction is
+bit-identical, so promotion never changes pixels. Compression is zlib,
+a NumPy run-length encoding, or LZ4 when the ``lz4`` package is
+installed; the tier is an LRU bounded by compressed bytes.
+"""
+from __future__ import annotations
+
+import struct
+import threading
+import zlib
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+try:
+    import lz4.frame as _lz4
+    LZ4_AVAILABLE = True
+    LZ4_IMPORT_ERROR = None
+except Exception as e:  # pragma: no cover
+    _lz4 = None
+    LZ4_AVAILABLE = False
+    LZ4_IMPORT_ERROR = e
+
+
+# ---------------------------------------------------------------------
+# Codecs
+# ---------------------------------------------------------------------
+
+_RUNS = struct.Struct("<I")
+
+
+def rle_encode(data: np.ndarray) -> bytes:
+    """
+    Run-length encode a uint8 buffer: run count, run values (uint8), run
+    lengths (uint32).
+    """
+    flat = np.ascontiguousarray(data, dtype=np.uint8).reshape(-1)
+    if flat.size == 0:
+        return _RUNS.pack(0)
+    starts = np.concatenate(([0], np.flatnonzero(flat[1:] != flat[:-1]) + 1))
+    lengths = np.diff(np.append(starts, flat.size)).astype("<u4")
+    return _RUNS.pack(len(starts)) + flat[starts].tobytes() + lengths.tobytes()
+
+
+def rle_decode(payload: bytes) -> np.ndarray:
+    (runs,) = _RUNS.unpack_from(payload)
+    values = np.frombuffer(payload, np.uint8, runs, _RUNS.size)
+    lengths = np.frombuffer(payload, "<u4", runs, _RUNS.size + runs)
+    return np.repeat(values, lengths)
+
+
+CODECS = ("zlib", "rle", "lz4")
+
+
+def resolve_codec(codec: str) -> str:
+    """
+    Validate ``codec``; "auto" is LZ4 when installed, zlib otherwise.
+    """
+    if codec == "auto":
+        return "lz4" if LZ4_AVAILABLE else "zlib"
+    if codec not in CODECS:
+        raise ValueError(f"Unknown codec {codec!r}; choose from {('auto',) + CODECS}.")
+    if codec == "lz4" and not LZ4_AVAILABLE:
+        raise RuntimeError(
+            "The lz4 codec needs the 'lz4' package. "
+            f"Original import error: {LZ4_IMPORT_ERROR}"
+        )
+    return codec
+
+
+def compress(data: np.ndarray, codec: str) -> bytes:
+    if codec == "rle":
+        return rle_encode(data)
+    raw = np.ascontiguousarray(data).tobytes()
+    if codec == "lz4":
+        return _lz4.compress(raw)
+    return zlib.compress(raw, 1)
+
+
+def decompress(payload: bytes, codec: str) -> np.ndarray:
+    if codec == "rle":
+        return rle_decode(payload)
+    if codec == "lz4":
+        raw = _lz4.decompress(payload)
+    else:
+        raw = zlib.decompress(payload)
+    return np.frombuffer(raw, np.uint8)
+
+
+# ---------------------------------------------------------------------
+# Pixel packing
+# ---------------------------------------------------------------------
+
+class ColdEntry:
+    """
+    One compressed image plus what is needed to rebuild the hot value.
+    """
+
+    __slots__ = ("shape", "mode", "ink", "clear", "codec", "payload", "meta")
+
+    def __init__(self, shape, mode, ink, clear, codec, payload, meta):
+        self.shape = shape
+        self.mode = mode
+        self.ink = ink
+        self.clear = clear
+        self.codec = codec
+        self.payload = payload
+        self.meta = meta
+
+    @property
+    def raw_nbytes(self) -> int:
+        h, w, c = self.shape
+        return h * w * c
+
+
+def _rgba_words(pixels: np.ndarray) -> np.ndarray:
+    # (H, W) little-endian uint32 view: A << 24 | B << 16 | G << 8 | R
+    return np.ascontiguousarray(pixels).view("<u4")[..., 0]
+
+
+def pack_pixels(pixels: np.ndarray, codec: str, meta: Any = None) -> ColdEntry:
+    """
+    Compress an (H, W, C) uint8 image; RGBA images as an alpha plane when
+    that is lossless.
+    """
+    if pixels.shape[2] != 4:
+        return ColdEntry(pixels.shape, "planes", None, None, codec, compress(pixels, codec), meta)
+    alpha = pixels[..., 3]
+    ink_mask = alpha > 0
+    first_ink = int(ink_mask.argmax())
+    if ink_mask.flat[first_ink]:
+        rgb = _rgba_words(pixels) & 0xFFFFFF
+        ink = int(rgb.flat[first_ink])
+        first_clear = int((~ink_mask).argmax())
+        clear = int(rgb.flat[first_clear]) if not ink_mask.flat[first_clear] else ink
+        if clear == ink:
+            lossless = bool((rgb == ink).all())
+        else:
+            lossless = np.array_equal(rgb, np.where(ink_mask, np.uint32(ink), np.uint32(clear)))
+        if lossless:
+            return ColdEntry(pixels.shape, "alpha", ink, clear, codec, compress(alpha, codec), meta)
+    planes = np.moveaxis(pixels, -1, 0)
+    return ColdEntry(pixels.shape, "planes", None, None, codec, compress(planes, codec), meta)
+
+
+def unpack_pixels(entry: ColdEntry) -> np.ndarray:
+    h, w, c = entry.shape
+    data = decompress(entry.payload, entry.codec)
+    if entry.mode == "planes":
+        return np.ascontiguousarray(np.moveaxis(data.reshape(c, h, w), 0, -1))
+    alpha = data.reshape(h, w)
+    if entry.ink == entry.clear:
+        words = np.full((h, w), entry.ink, dtype="<u4")
+    else:
+        words = np.where(alpha > 0, np.uint32(entry.ink), np.uint32(entry.clear)).astype("<u4")
+    words |= alpha.astype("<u4") << 24
+    return words.view(np.uint8).reshape(h, w, 4)
+
+
+# ---------------------------------------------------------------------
+# Tier
+# ---------------------------------------------------------------------
+
+class ColdTier:
+    """
+    LRU of ColdEntry objects bounded by total compressed bytes.
+
+    ``put`` and ``pop`` take the tier lock only around the dictionary
+    update; compression and decompression run outside it.
+    """
+
+    def __init__(self, max_bytes: int, codec: str = "auto"):
+        self.max_bytes = int(max_bytes)
+        self.codec = resolve_codec(codec)
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Tuple[Any, ...], ColdEntry]" = OrderedDict()
+        self._bytes = 0
+        self._raw_bytes = 0
+        self.stats = {"demotions": 0, "promotions": 0, "misses": 0, "dropped": 0, "alpha": 0}
+
+    def put(self, key: Tuple[Any, ...], pixels: np.ndarray, meta: Any = None) -> List[Tuple[Any, ...]]:
+        """
+        Compress and store ``pixels``; returns the keys dropped to stay
+        within ``max_bytes`` (including ``key`` itself if it cannot fit).
+        """
+        entry = pack_pixels(pixels, self.codec, meta)
+        size = len(entry.payload)
+        dropped = []
+        with self._lock:
+            # a previous entry for ``key`` is superseded even if the new one
+            # does not fit
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._forget(old)
+            if size > self.max_bytes:
+                return [key]
+            self._entries[key] = entry
+            self._bytes += size
+            self._raw_bytes += entry.raw_nbytes
+            self.stats["demotions"] += 1
+            self.stats["alpha"] += entry.mode == "alpha"
+            while self._bytes > self.max_bytes:
+                k, e = self._entries.popitem(last=False)
+                self._forget(e)
+                self.stats["dropped"] += 1
+                dropped.append(k)
+        return dropped
+
+    def _forget(self, entry: ColdEntry) -> None:
+        self._bytes -= len(entry.payload)
+        self._raw_bytes -= entry.raw_nbytes
+        self.stats["alpha"] -= entry.mode == "alpha"
+
+    def pop(self, key: Tuple[Any, ...]) -> Optional[Tuple[np.ndarray, Any]]:
+        """
+        Remove ``key`` and return its decompressed pixels and meta, or None.
+        """
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is None:
+                self.stats["misses"] += 1
+                return None
+            self._forget(entry)
+            self.stats["promotions"] += 1
+        return unpack_pixels(entry), entry.meta
+
+    def nbytes(self, key: Tuple[Any, ...]) -> Optional[int]:
+        with self._lock:
+            entry = self._entries.get(key)
+            return None if entry is None else len(entry.payload)
+
+    def __contains__(self, key: Tuple[Any, ...]) -> bool:
+        with self._lock:
+            return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def items(self) -> List[Tuple[Tuple[Any, ...], np.ndarray, Any]]:
+        """
+        (key, pixels, meta) for every entry, least recently demoted first.
+        """
+        with self._lock:
+            entries = list(self._entries.items())
+        return [(k, unpack_pixels(e), e.meta) for k, e in entries]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self._raw_bytes = 0
+            self.stats["alpha"] = 0
+
+    def info(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "raw_bytes": self._raw_bytes,
+                "max_bytes": self.max_bytes,
+                "codec": self.codec,
+                **self.stats,
+            }
+
+
+__all__ = [
+    "CODECS",
+    "LZ4_AVAILABLE",
+    "ColdEntry",
+    "ColdTier",
+    "compress",
+    "decompress",
+    "pack_pixels",
+    "unpack_pixels",
+    "resolve_codec",
+    "rle_encode",
+    "rle_decode",
+]
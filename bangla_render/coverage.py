@@ -0,0 +1,371 @@
+# bangla_render/coverage.py
+"""
+Per-codepoint font fallback.
+
+Each font's ``cmap`` table is read once per process and turned into a
+``Coverage`` (a bitmap over the BMP plus a set for the supplementary
+planes). ``segment_text`` then splits a string into runs, each set in the
+first font of the fallback chain that covers it, in a single pass:
+
+- combining marks, ZWJ/ZWNJ and variation selectors stay in the run of the
+  base character they attach to, so conjuncts are never split;
+- spaces and punctuation stay in the current run when its font covers
+  them, so a Latin word inside Bengali text is one run, not one per word;
+- everything else goes to the primary font if it covers it, otherwise to
+  the first fallback that does (or the primary, to show tofu).
+
+Fonts whose cmap cannot be read are treated as covering everything, so an
+unreadable primary disables fallback instead of breaking rendering.
+"""
+from __future__ import annotations
+
+import struct
+import threading
+import unicodedata
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+
+# ---------------------------------------------------------------------
+# sfnt / cmap parsing
+# ---------------------------------------------------------------------
+
+_U16 = struct.Struct(">H")
+_U32 = struct.Struct(">I")
+
+# (platform, encoding) pairs whose subtables map Unicode codepoints
+_UNICODE_ENCODINGS = {(0, 0), (0, 1), (0, 2), (0, 3), (0, 4), (0, 6), (3, 1), (3, 10)}
+
+
+class Coverage:
+    """
+    Set of codepoints a font maps to a real glyph.
+    """
+
+    __slots__ = ("_bmp", "_astral", "_ascii", "count")
+
+    def __init__(self, bmp: bytes, astral: Iterable[int] = ()):
+        self._bmp = bmp
+        self._astral = frozenset(astral)
+        self.count = int(np.unpackbits(np.frombuffer(bmp, dtype=np.uint8)).sum()) + len(self._astral)
+        # printable ASCII fully mapped: plain Latin labels skip the scan
+        self._ascii = all(cp in self for cp in range(0x20, 0x7F))
+
+    def __contains__(self, cp: int) -> bool:
+        if cp < 0x10000:
+            return bool(self._bmp[cp >> 3] >> (cp & 7) & 1)
+        return cp in self._astral
+
+    def __len__(self) -> int:
+        return self.count
+
+    def covers(self, text: str) -> bool:
+        if self._ascii and text.isascii() and text.isprintable():
+            return True
+        return all(map(self.__contains__, map(ord, text)))
+
+
+def sfnt_face_count(data: bytes) -> int:
+    """
+    Number of faces in TrueType/OpenType font data (collections hold many).
+    """
+    if data[:4] == b"ttcf":
+        return _U32.unpack_from(data, 8)[0]
+    return 1
+
+
+def sfnt_table(data: bytes, tag: str, face_index: int = 0) -> Optional[bytes]:
+    """
+    Return table ``tag`` of face ``face_index`` in font file data, or None
+    when the face has no such table.
+    """
+    base = 0
+    if data[:4] == b"ttcf":
+        if not 0 <= face_index < sfnt_face_count(data):
+            return None
+        base = _U32.unpack_from(data, 12 + 4 * face_index)[0]
+
+    num_tables = _U16.unpack_from(data, base + 4)[0]
+    want = tag.encode("ascii")
+    for i in range(num_tables):
+        rec = base + 12 + 16 * i
+        if data[rec:rec + 4] == want:
+            offset, length = struct.unpack_from(">II", data, rec + 8)
+            return data[offset:offset + length]
+    return None
+
+
+def read_font_table(path: str, tag: str, face_index: int = 0) -> Optional[bytes]:
+    """
+    Return the raw bytes of table ``tag`` from a TrueType/OpenType file or
+    collection, or None when the file has no such table.
+    """
+    with open(path, "rb") as f:
+        data = f.read()
+    return sfnt_table(data, tag, face_index)
+
+
+def _cmap_format4(data: bytes, off: int, bmp: np.ndarray) -> None:
+    seg_count = _U16.unpack_from(data, off + 6)[0] // 2
+    ends = np.frombuffer(data, ">u2", seg_count, off + 14)
+    starts_at = off + 16 + 2 * seg_count
+    starts = np.frombuffer(data, ">u2", seg_count, starts_at)
+    deltas = np.frombuffer(data, ">u2", seg_count, starts_at + 2 * seg_count)
+    range_at = starts_at + 4 * seg_count
+    range_offsets = np.frombuffer(data, ">u2", seg_count, range_at)
+
+    for i, (start, end, delta, range_offset) in enumerate(
+        zip(starts.tolist(), ends.tolist(), deltas.tolist(), range_offsets.tolist())
+    ):
+        if start > end or start == 0xFFFF:
+            continue
+        if range_offset == 0:
+            bmp[start:end + 1] = True
+            # the one code whose delta wraps to glyph 0 is unmapped
+            missing = -delta & 0xFFFF
+            if start <= missing <= end:
+                bmp[missing] = False
+            continue
+        # idRangeOffset is relative to its own slot in the array
+        first = range_at + 2 * i + range_offset
+        count = min(end - start + 1, max(0, (len(data) - first) // 2))
+        raw = np.frombuffer(data, ">u2", count, first).astype(np.int64)
+        mapped = (raw != 0) & ((raw + delta) & 0xFFFF != 0)
+        bmp[start + np.flatnonzero(mapped)] = True
+
+
+def _cmap_format12(data: bytes, off: int, bmp: np.ndarray, astral: set) -> None:
+    n_groups = _U32.unpack_from(data, off + 12)[0]
+    groups = np.frombuffer(data, ">u4", 3 * n_groups, off + 16).reshape(-1, 3)
+    for start, end, start_glyph in groups.tolist():
+        end = min(end, 0x10FFFF)
+        if start_glyph == 0:
+            start += 1
+        if start > end:
+            continue
+        if start < 0x10000:
+            bmp[start:min(end, 0xFFFF) + 1] = True
+        if end >= 0x10000:
+            astral.update(range(max(start, 0x10000), end + 1))
+
+
+def _cmap_format0_6(data: bytes, off: int, fmt: int, bmp: np.ndarray) -> None:
+    if fmt == 0:
+        first, count, at = 0, 256, off + 6
+        glyphs = np.frombuffer(data, np.uint8, count, at)
+    else:
+        first, count = struct.unpack_from(">HH", data, off + 6)
+        glyphs = np.frombuffer(data, ">u2", count, off + 10)
+    bmp[first + np.flatnonzero(glyphs)] = True
+
+
+def parse_cmap(table: bytes) -> Coverage:
+    """
+    Build the coverage of a ``cmap`` table from all of its Unicode
+    subtables (formats 0, 4, 6 and 12).
+    """
+    bmp = np.zeros(0x10000, dtype=bool)
+    astral: set = set()
+
+    num_subtables = _U16.unpack_from(table, 2)[0]
+    seen = set()
+    for i in range(num_subtables):
+        platform, encoding, off = struct.unpack_from(">HHI", table, 4 + 8 * i)
+        if (platform, encoding) not in _UNICODE_ENCODINGS or off in seen:
+            continue
+        seen.add(off)
+        fmt = _U16.unpack_from(table, off)[0]
+        if fmt == 4:
+            _cmap_format4(table, off, bmp)
+        elif fmt == 12:
+            _cmap_format12(table, off, bmp, astral)
+        elif fmt in (0, 6):
+            _cmap_format0_6(table, off, fmt, bmp)
+
+    return Coverage(np.packbits(bmp, bitorder="little").tobytes(), astral)
+
+
+# ---------------------------------------------------------------------
+# Segmentation
+# ---------------------------------------------------------------------
+
+_ATTACHING = {0x200C, 0x200D, 0x034F}  # ZWNJ, ZWJ, combining grapheme joiner
+
+
+def _attaches(ch: str) -> bool:
+    cp = ord(ch)
+    return (
+        cp in _ATTACHING
+        or 0xFE00 <= cp <= 0xFE0F
+        or 0xE0100 <= cp <= 0xE01EF
+        or unicodedata.category(ch) in ("Mn", "Mc", "Me")
+    )
+
+
+def _neutral(ch: str) -> bool:
+    return unicodedata.category(ch)[0] in "ZPC"
+
+
+class CoverageIndex:
+    """
+    Process-lifetime family -> Coverage map and fallback chains for one
+    render engine.
+    """
+
+    def __init__(self, engine):
+        self.engine = engine
+        self._lock = threading.RLock()
+        self._coverage: Dict[str, Optional[Coverage]] = {}
+        self._chains: Dict[str, List[str]] = {}
+
+    def coverage(self, family: str) -> Optional[Coverage]:
+        """
+        Coverage of ``family``, or None when its cmap cannot be read.
+        """
+        with self._lock:
+            if family in self._coverage:
+                return self._coverage[family]
+        try:
+            table = self.engine.font_table(family, "cmap")
+            cov = parse_cmap(table) if table else None
+        except Exception:
+            cov = None
+        with self._lock:
+            self._coverage[family] = cov
+        return cov
+
+    def chain(self, font_family: str) -> List[str]:
+        """
+        ``font_family`` followed by the installed fallback families.
+        """
+        with self._lock:
+            hit = self._chains.get(font_family)
+        if hit is not None:
+            return hit
+
+        from .fonts import get_fallback_fonts
+
+        chain = [font_family]
+        settings = get_fallback_fonts()
+        if settings["enabled"]:
+            for name in settings["families"]:
+                family = self.engine.find_family(name)
+                if family and family not in chain:
+                    chain.append(family)
+        with self._lock:
+            self._chains[font_family] = chain
+        return chain
+
+    def segment(self, text: str, font_family: str) -> List[Tuple[int, int, str]]:
+        """
+        Split ``text`` into ``(start, end, family)`` runs in one pass.
+        """
+        if not text:
+            return []
+        primary = self.coverage(font_family)
+        if primary is None or primary.covers(text):
+            return [(0, len(text), font_family)]
+        chain = self.chain(font_family)
+        if len(chain) == 1:
+            return [(0, len(text), font_family)]
+
+        covers = [primary] + [self.coverage(f) for f in chain[1:]]
+        runs: List[Tuple[int, int, str]] = []
+        current = -1
+        start = 0
+        for i, ch in enumerate(text):
+            cp = ord(ch)
+            if current >= 0 and _attaches(ch):
+                continue
+            if current >= 0 and _neutral(ch) and _has(covers[current], cp):
+                continue
+            if cp in primary:
+                chosen = 0
+            else:
+                chosen = next(
+                    (k for k in range(1, len(covers)) if _has(covers[k], cp)),
+                    current if current >= 0 else 0,
+                )
+            if chosen != current:
+                if current >= 0:
+                    runs.append((start, i, chain[current]))
+                current, start = chosen, i
+        runs.append((start, len(text), chain[current]))
+        return runs
+
+    def clear(self) -> None:
+        with self._lock:
+            self._coverage.clear()
+            self._chains.clear()
+
+    def info(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "engine": self.engine.name,
+                "fonts": {f: (len(c) if c is not None else None) for f, c in self._coverage.items()},
+                "chains": {f: list(c) for f, c in self._chains.items()},
+            }
+
+
+def _has(cov: Optional[Coverage], cp: int) -> bool:
+    return cov is None or cp in cov
+
+
+_INDEXES: Dict[str, CoverageIndex] = {}
+_INDEX_LOCK = threading.Lock()
+
+
+def get_coverage_index(engine=None) -> CoverageIndex:
+    """
+    The coverage index of ``engine`` (default: the active render engine).
+    """
+    if engine is None:
+        from .engines import get_render_engine
+
+        engine = get_render_engine()
+    with _INDEX_LOCK:
+        index = _INDEXES.get(engine.name)
+        if index is None or index.engine is not engine:
+            index = _INDEXES[engine.name] = CoverageIndex(engine)
+        return index
+
+
+def clear_coverage_index() -> None:
+    """
+    Forget all coverage and fallback chains (after fonts are registered or
+    the fallback list changes).
+    """
+    with _INDEX_LOCK:
+        for index in _INDEXES.values():
+            index.clear()
+
+
+def segment_text(
+    text: str,
+    font_family: Optional[str] = None,
+    font_path: Optional[str] = None,
+) -> List[Tuple[str, str]]:
+    """
+    Split ``text`` into ``(substring, family)`` runs as the active render
+    engine will draw them.
+    """
+    from .engines import get_render_engine
+
+    engine = get_render_engine()
+    family = engine.resolve_font(font_family=font_family, font_path=font_path)
+    text = str(text)
+    return [(text[a:b], fam) for a, b, fam in get_coverage_index(engine).segment(text, family)]
+
+
+__all__ = [
+    "Coverage",
+    "CoverageIndex",
+    "read_font_table",
+    "sfnt_table",
+    "sfnt_face_count",
+    "parse_cmap",
+    "get_coverage_index",
+    "clear_coverage_index",
+    "segment_text",
+]
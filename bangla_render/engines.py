@@ -0,0 +1,819 @@
+# bangla_render/engines.py
+"""
+Pluggable shaping/rasterizing engines behind render_text_array(),
+render_text_qimage() and measure_text().
+
+- "qt":       PySide6 (QTextLayout shaping, QPainter rasterization).
+- "harfbuzz": uharfbuzz shaping + freetype-py rasterization; returns NumPy
+              RGBA directly and never touches Qt.
+- "pillow":   PIL.ImageFont with the libraqm layout engine (Pillow must be
+              built with raqm for complex-script shaping).
+
+Select one with ``init_renderer(backend=...)`` or ``set_render_engine()``.
+"""
+from __future__ import annotations
+
+import ctypes
+import math
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .coverage import clear_coverage_index, get_coverage_index, read_font_table
+from .font_catalog import _FONT_EXTENSIONS, _system_font_dirs, get_font_catalog
+
+try:
+    import freetype
+    import uharfbuzz as hb
+    HARFBUZZ_AVAILABLE = True
+    HARFBUZZ_IMPORT_ERROR = None
+except Exception as e:  # pragma: no cover
+    freetype = None
+    hb = None
+    HARFBUZZ_AVAILABLE = False
+    HARFBUZZ_IMPORT_ERROR = e
+
+try:
+    from PIL import Image, ImageDraw, ImageFont, features as pil_features
+    PILLOW_AVAILABLE = True
+    PILLOW_IMPORT_ERROR = None
+except Exception as e:  # pragma: no cover
+    Image = None
+    ImageDraw = None
+    ImageFont = None
+    pil_features = None
+    PILLOW_AVAILABLE = False
+    PILLOW_IMPORT_ERROR = e
+
+
+@dataclass
+class ShapedGlyph:
+    """
+    One positioned glyph, in pixels relative to the pen origin on the
+    baseline (y grows downwards).
+    """
+    glyph_id: int
+    cluster: Optional[int]
+    x: float
+    y: float
+    x_advance: float
+
+
+# ---------------------------------------------------------------------
+# Colour helpers (Qt-free)
+# ---------------------------------------------------------------------
+
+_TRANSPARENT_NAMES = ("", "none", "transparent", "rgba(0,0,0,0)")
+
+_BASIC_COLORS = {
+    "black": (0, 0, 0),
+    "white": (255, 255, 255),
+    "red": (255, 0, 0),
+    "green": (0, 128, 0),
+    "blue": (0, 0, 255),
+    "gray": (128, 128, 128),
+    "grey": (128, 128, 128),
+    "yellow": (255, 255, 0),
+    "orange": (255, 165, 0),
+    "purple": (128, 0, 128),
+}
+
+
+def parse_color(color: Any) -> Optional[Tuple[int, int, int, int]]:
+    """
+    Parse a colour the way QColor does (names, "#rgb", "#rrggbb",
+    "#aarrggbb") into 0..255 RGBA; None when it is not a valid colour.
+    """
+    s = str(color).strip().lower()
+    if s.startswith("#"):
+        h = s[1:]
+        try:
+            if len(h) == 3:
+                r, g, b = (int(c * 2, 16) for c in h)
+                return r, g, b, 255
+            if len(h) == 6:
+                return int(h[0:2], 16), int(h[2:4], 16), int(h[4:6], 16), 255
+            if len(h) == 8:
+                return int(h[2:4], 16), int(h[4:6], 16), int(h[6:8], 16), int(h[0:2], 16)
+        except ValueError:
+            return None
+        return None
+
+    rgb = _BASIC_COLORS.get(s)
+    if rgb is None:
+        try:
+            from matplotlib.colors import CSS4_COLORS
+        except Exception:  # pragma: no cover
+            return None
+        named = CSS4_COLORS.get(s)
+        if named is None:
+            return None
+        return parse_color(named)
+    return rgb + (255,)
+
+
+def colorize_alpha(alpha: np.ndarray, color: Any, bg: Any) -> np.ndarray:
+    """
+    Turn a coverage mask (float 0..1 or uint8) into an (H, W, 4) uint8 RGBA
+    image: ``color`` over ``bg`` with the same fallbacks as the Qt path
+    (invalid colour -> black, invalid/transparent bg -> none).
+    """
+    cov = alpha.astype(np.float32)
+    if alpha.dtype == np.uint8:
+        cov /= 255.0
+
+    fg = parse_color(color) or (0, 0, 0, 255)
+    bgc = None if str(bg).strip().lower() in _TRANSPARENT_NAMES else parse_color(bg)
+
+    fa = cov * (fg[3] / 255.0)
+    out = np.empty(cov.shape + (4,), dtype=np.uint8)
+    if bgc is None:
+        out[..., 0], out[..., 1], out[..., 2] = fg[:3]
+        out[..., 3] = np.rint(fa * 255.0)
+        return out
+
+    ba = bgc[3] / 255.0
+    out_a = fa + ba * (1.0 - fa)
+    safe = np.where(out_a > 0, out_a, 1.0)
+    for c in range(3):
+        out[..., c] = np.rint((fg[c] * fa + bgc[c] * ba * (1.0 - fa)) / safe)
+    out[..., 3] = np.rint(out_a * 255.0)
+    return out
+
+
+# ---------------------------------------------------------------------
+# Interface
+# ---------------------------------------------------------------------
+
+class RenderEngine:
+    """
+    Shaping/rasterizing backend. ``params`` is a renderer.RenderParams whose
+    font_family was returned by this engine's resolve_font().
+    """
+
+    name = "base"
+
+    @classmethod
+    def available(cls) -> bool:
+        return False
+
+    @classmethod
+    def import_error(cls) -> Optional[str]:
+        return None
+
+    def ensure_runtime(self) -> None:
+        """
+        Prepare anything the engine needs before rendering (e.g. the Qt app).
+        """
+
+    def resolve_font(self, font_family: Optional[str] = None, font_path: Optional[str] = None) -> str:
+        raise NotImplementedError
+
+    def find_family(self, name: str) -> Optional[str]:
+        """
+        The engine's spelling of family ``name``, or None if not installed.
+        """
+        return None
+
+    def font_table(self, font_family: str, tag: str) -> Optional[bytes]:
+        """
+        Raw sfnt table ``tag`` (e.g. "cmap") of a resolved family.
+        """
+        return None
+
+    def font_runs(self, text: str, font_family: str) -> List[Tuple[str, str]]:
+        """
+        Split ``text`` into ``(substring, family)`` runs by covering font;
+        one run when ``font_family`` covers the whole string.
+        """
+        spans = get_coverage_index(self).segment(text, font_family)
+        return [(text[a:b], family) for a, b, family in spans]
+
+    def shape(self, text: str, font_family: str, pixel_size: int) -> List[ShapedGlyph]:
+        raise NotImplementedError
+
+    def metrics(self, params) -> Dict[str, Any]:
+        """
+        Same keys as measure_text() returns.
+        """
+        raise NotImplementedError
+
+    def rasterize(self, params) -> np.ndarray:
+        """
+        Untrimmed (H, W, 4) uint8 RGBA image of ``params.text``.
+        """
+        raise NotImplementedError
+
+    def rasterize_alpha(self, params) -> np.ndarray:
+        """
+        Untrimmed (H, W) uint8 coverage mask of ``params.text``; colour is
+        applied later. By default the alpha of an opaque black render.
+        """
+        opaque = replace(params, color="#ff000000", bg="transparent")
+        return np.ascontiguousarray(self.rasterize(opaque)[..., 3])
+
+
+class QtEngine(RenderEngine):
+    name = "qt"
+
+    @classmethod
+    def available(cls) -> bool:
+        from .backend import _load_qt
+
+        return bool(_load_qt())
+
+    @classmethod
+    def import_error(cls) -> Optional[str]:
+        from . import backend
+
+        return str(backend.QT_IMPORT_ERROR) if backend.QT_IMPORT_ERROR else None
+
+    def ensure_runtime(self) -> None:
+        from .backend import ensure_qt_application
+
+        ensure_qt_application()
+
+    def resolve_font(self, font_family: Optional[str] = None, font_path: Optional[str] = None) -> str:
+        from .fonts import resolve_font
+        from .renderer import _ensure_runtime
+
+        _ensure_runtime()
+        return resolve_font(font_family=font_family, font_path=font_path)
+
+    def find_family(self, name: str) -> Optional[str]:
+        from .fonts import _case_insensitive_family_lookup
+
+        return _case_insensitive_family_lookup(name)
+
+    def font_table(self, font_family: str, tag: str) -> Optional[bytes]:
+        from PySide6.QtGui import QRawFont
+        from .fonts import pooled_font
+
+        raw = QRawFont.fromFont(pooled_font(font_family, 16))
+        if not raw.isValid():
+            return None
+        return bytes(raw.fontTable(tag)) or None
+
+    def shape(self, text: str, font_family: str, pixel_size: int) -> List[ShapedGlyph]:
+        from PySide6.QtGui import QTextLayout
+        from .fonts import pooled_font
+
+        layout = QTextLayout(text, pooled_font(font_family, pixel_size))
+        layout.beginLayout()
+        line = layout.createLine()
+        layout.endLayout()
+        if not line.isValid():
+            return []
+
+        glyphs: List[ShapedGlyph] = []
+        for run in line.glyphRuns():
+            ids = run.glyphIndexes()
+            pos = run.positions()
+            advances = run.rawFont().advancesForGlyphIndexes(ids)
+            for gid, p, adv in zip(ids, pos, advances):
+                glyphs.append(ShapedGlyph(int(gid), None, p.x(), p.y() - line.ascent(), adv.x()))
+        return glyphs
+
+    def metrics(self, params) -> Dict[str, Any]:
+        from .renderer import _measure_with_metrics, _metrics_for_render
+
+        fm = _metrics_for_render(params.font_family, params.font_size, params.scale)
+        return _measure_with_metrics(fm, params)
+
+    def rasterize(self, params) -> np.ndarray:
+        from .renderer import _paint_text_qimage, _qimage_to_rgba_uint8
+
+        return _qimage_to_rgba_uint8(_paint_text_qimage(params))
+
+
+# ---------------------------------------------------------------------
+# Font-file based engines
+# ---------------------------------------------------------------------
+
+_REGULAR_STYLES = ("regular", "book", "normal", "roman")
+
+
+class FontFileEngine(RenderEngine):
+    """
+    Base for engines that work from font files rather than Qt's font
+    database: keeps a family -> file map built from registered files and,
+    on first need, a scan of the system font directories.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        # lower-case family -> (family, path, style)
+        self._families: Dict[str, Tuple[str, str, str]] = {}
+        self._path_families: Dict[str, List[str]] = {}
+        self._scanned = False
+
+    def _read_faces(self, path: str) -> List[Tuple[str, str]]:
+        """
+        Return [(family, style)] for a font file.
+        """
+        raise NotImplementedError
+
+    def _add_face(self, family: str, style: str, path: str, override: bool) -> None:
+        key = family.lower()
+        current = self._families.get(key)
+        if (
+            current is None
+            or override
+            or (style.lower() in _REGULAR_STYLES and current[2].lower() not in _REGULAR_STYLES)
+        ):
+            self._families[key] = (family, path, style)
+
+    def register_font_file(self, font_path: str) -> List[str]:
+        path = os.path.abspath(os.path.expanduser(font_path))
+        if not os.path.isfile(path):
+            raise RuntimeError(f"Font file does not exist: {path}")
+        with self._lock:
+            cached = self._path_families.get(path)
+            if cached is not None:
+                return list(cached)
+            try:
+                faces = self._read_faces(path)
+            except Exception as e:
+                raise RuntimeError(f"Could not read font file '{path}': {e}") from e
+            families: List[str] = []
+            for family, style in faces:
+                # explicitly registered files win over scanned ones
+                self._add_face(family, style, path, override=True)
+                if family not in families:
+                    families.append(family)
+            self._path_families[path] = families
+        # the file may now provide a family that was resolved elsewhere
+        clear_coverage_index()
+        return list(families)
+
+    def _scan_system_fonts(self) -> None:
+        with self._lock:
+            if self._scanned:
+                return
+            catalog = get_font_catalog()
+            if catalog is not None:
+                # the engines open the first face of a file only
+                for face in catalog.faces():
+                    if face["index"] == 0:
+                        self._add_face(face["family"], face["style"], face["path"], override=False)
+                self._scanned = True
+                return
+            for root_dir in _system_font_dirs():
+                for dirpath, _dirs, files in os.walk(root_dir):
+                    for fname in files:
+                        if not fname.lower().endswith(_FONT_EXTENSIONS):
+                            continue
+                        path = os.path.join(dirpath, fname)
+                        try:
+                            faces = self._read_faces(path)
+                        except Exception:
+                            continue
+                        for family, style in faces:
+                            self._add_face(family, style, path, override=False)
+            self._scanned = True
+
+    def list_families(self) -> List[str]:
+        self._scan_system_fonts()
+        with self._lock:
+            return sorted(f for f, _p, _s in self._families.values())
+
+    def _lookup(self, family: str) -> Optional[Tuple[str, str, str]]:
+        key = str(family).strip().lower()
+        if not key:
+            return None
+        with self._lock:
+            hit = self._families.get(key)
+        if hit is None and not self._scanned:
+            self._scan_system_fonts()
+            with self._lock:
+                hit = self._families.get(key)
+        return hit
+
+    def find_family(self, name: str) -> Optional[str]:
+        hit = self._lookup(name)
+        return hit[0] if hit is not None else None
+
+    def font_table(self, font_family: str, tag: str) -> Optional[bytes]:
+        return read_font_table(self.font_file(font_family), tag)
+
+    def font_file(self, family: str) -> str:
+        hit = self._lookup(family)
+        if hit is None:
+            raise RuntimeError(f"Font family '{family}' not found by the {self.name} engine.")
+        return hit[1]
+
+    def resolve_font(self, font_family: Optional[str] = None, font_path: Optional[str] = None) -> str:
+        from .fonts import BANGLA_FONT_CANDIDATES, get_default_font
+
+        if font_path:
+            families = self.register_font_file(font_path)
+            if not families:
+                raise RuntimeError(f"Registered font file but found no family names: {font_path}")
+            if font_family:
+                for fam in families:
+                    if fam.lower() == str(font_family).strip().lower():
+                        return fam
+                raise RuntimeError(
+                    f"Requested family '{font_family}' not found after registering '{font_path}'. "
+                    f"Families from file: {families}"
+                )
+            return families[0]
+
+        if font_family:
+            hit = self._lookup(font_family)
+            if hit is not None:
+                return hit[0]
+            raise RuntimeError(
+                f"Font family '{font_family}' not found. "
+                "Use list_available_fonts() or register_font()."
+            )
+
+        default = get_default_font()
+        if default.get("font_path"):
+            return self.resolve_font(default["font_family"], default["font_path"])
+        for name in [default.get("font_family")] + list(BANGLA_FONT_CANDIDATES):
+            hit = self._lookup(name) if name else None
+            if hit is not None:
+                return hit[0]
+
+        raise RuntimeError(
+            "No usable Bengali font family could be resolved. "
+            "Install or register a Bengali-capable font, then try again."
+        )
+
+
+# ---------------------------------------------------------------------
+# HarfBuzz + FreeType
+# ---------------------------------------------------------------------
+
+_HB_FONT_CACHE_MAXSIZE = 64
+_GLYPH_CACHE_MAXSIZE = 4096
+
+
+class HarfBuzzEngine(FontFileEngine):
+    """
+    Qt-free engine: uharfbuzz shapes, FreeType rasterizes glyph coverage,
+    NumPy composites. Glyph bitmaps are cached per (file, pixel size).
+    """
+
+    name = "harfbuzz"
+
+    def __init__(self):
+        super().__init__()
+        self._ft_faces: Dict[str, Any] = {}
+        self._hb_faces: Dict[str, Any] = {}
+        self._hb_fonts: "OrderedDict[Tuple[str, int], Any]" = OrderedDict()
+        self._glyphs: "OrderedDict[Tuple[str, int, int], Tuple[int, int, np.ndarray]]" = OrderedDict()
+
+    @classmethod
+    def available(cls) -> bool:
+        return HARFBUZZ_AVAILABLE
+
+    @classmethod
+    def import_error(cls) -> Optional[str]:
+        return str(HARFBUZZ_IMPORT_ERROR) if HARFBUZZ_IMPORT_ERROR else None
+
+    def _read_faces(self, path: str) -> List[Tuple[str, str]]:
+        face = freetype.Face(path)
+        family = (face.family_name or b"").decode("utf-8", "replace")
+        style = (face.style_name or b"").decode("utf-8", "replace")
+        return [(family, style)] if family else []
+
+    # -- cached font objects (call with self._lock held) -------------
+
+    def _ft_face(self, path: str, pixel_size: int):
+        face = self._ft_faces.get(path)
+        if face is None:
+            face = self._ft_faces[path] = freetype.Face(path)
+        face.set_pixel_sizes(0, pixel_size)
+        return face
+
+    def _hb_font(self, path: str, pixel_size: int):
+        key = (path, pixel_size)
+        font = self._hb_fonts.get(key)
+        if font is not None:
+            self._hb_fonts.move_to_end(key)
+            return font
+        face = self._hb_faces.get(path)
+        if face is None:
+            with open(path, "rb") as f:
+                face = self._hb_faces[path] = hb.Face(hb.Blob(f.read()))
+        font = hb.Font(face)
+        # 26.6 fixed point, like FreeType
+        font.scale = (pixel_size * 64, pixel_size * 64)
+        self._hb_fonts[key] = font
+        while len(self._hb_fonts) > _HB_FONT_CACHE_MAXSIZE:
+            self._hb_fonts.popitem(last=False)
+        return font
+
+    def _glyph(self, path: str, pixel_size: int, gid: int) -> Tuple[int, int, np.ndarray]:
+        key = (path, pixel_size, gid)
+        hit = self._glyphs.get(key)
+        if hit is not None:
+            self._glyphs.move_to_end(key)
+            return hit
+        face = self._ft_face(path, pixel_size)
+        face.load_glyph(gid, freetype.FT_LOAD_DEFAULT | freetype.FT_LOAD_RENDER)
+        slot = face.glyph
+        bm = slot.bitmap
+        if bm.rows and bm.width:
+            raw = ctypes.cast(bm._FT_Bitmap.buffer, ctypes.POINTER(ctypes.c_ubyte))
+            coverage = np.ctypeslib.as_array(raw, shape=(bm.rows, abs(bm.pitch)))[:, :bm.width].copy()
+        else:
+            coverage = np.zeros((0, 0), dtype=np.uint8)
+        hit = (slot.bitmap_left, slot.bitmap_top, coverage)
+        self._glyphs[key] = hit
+        while len(self._glyphs) > _GLYPH_CACHE_MAXSIZE:
+            self._glyphs.popitem(last=False)
+        return hit
+
+    # -- engine API --------------------------------------------------
+
+    def shape(self, text: str, font_family: str, pixel_size: int) -> List[ShapedGlyph]:
+        path = self.font_file(font_family)
+        with self._lock:
+            font = self._hb_font(path, pixel_size)
+            buf = hb.Buffer()
+            buf.add_str(text)
+            buf.guess_segment_properties()
+            hb.shape(font, buf, {})
+            infos, positions = buf.glyph_infos, buf.glyph_positions
+
+        glyphs: List[ShapedGlyph] = []
+        pen_x = pen_y = 0
+        for info, pos in zip(infos, positions):
+            glyphs.append(ShapedGlyph(
+                glyph_id=info.codepoint,
+                cluster=info.cluster,
+                x=(pen_x + pos.x_offset) / 64.0,
+                y=-(pen_y + pos.y_offset) / 64.0,
+                x_advance=pos.x_advance / 64.0,
+            ))
+            pen_x += pos.x_advance
+            pen_y += pos.y_advance
+        return glyphs
+
+    def _layout(self, params):
+        from .renderer import _scaled_pixel_size
+
+        px = _scaled_pixel_size(params.font_size, params.scale)
+        runs = self.font_runs(params.text, params.font_family)
+        shaped = [(self.font_file(family), self.shape(sub, family, px)) for sub, family in runs]
+
+        with self._lock:
+            ascent = descent = 0
+            for path in {self.font_file(params.font_family)} | {p for p, _g in shaped}:
+                size = self._ft_face(path, px).size
+                ascent = max(ascent, int(math.ceil(size.ascender / 64.0)))
+                descent = max(descent, int(math.ceil(-size.descender / 64.0)))
+            placed = []
+            advance = 0.0
+            for path, glyphs in shaped:
+                for g in glyphs:
+                    left, top, cov = self._glyph(path, px, g.glyph_id)
+                    placed.append((int(round(advance + g.x)) + left, int(round(g.y)) - top, cov))
+                advance += sum(g.x_advance for g in glyphs)
+
+        ink = [(x, y, x + c.shape[1], y + c.shape[0]) for x, y, c in placed if c.size]
+        x0 = min([0] + [b[0] for b in ink])
+        y0 = min([-ascent] + [b[1] for b in ink])
+        x1 = max([int(math.ceil(advance))] + [b[2] for b in ink])
+        y1 = max([descent] + [b[3] for b in ink])
+        return placed, ascent, descent, (x0, y0, max(1, x1 - x0), max(1, y1 - y0))
+
+    def metrics(self, params) -> Dict[str, Any]:
+        _placed, ascent, descent, (x, y, w, h) = self._layout(params)
+        return {
+            "font_family": params.font_family,
+            "font_size": params.font_size,
+            "scale": params.scale,
+            "text_width_px": w,
+            "text_height_px": h,
+            "image_width_px": w + (2 * params.padding),
+            "image_height_px": h + (2 * params.padding),
+            "ascent_px": ascent,
+            "descent_px": descent,
+            "bounding_rect": {"x": x, "y": y, "width": w, "height": h},
+        }
+
+    def rasterize(self, params) -> np.ndarray:
+        return colorize_alpha(self._coverage(params), params.color, params.bg)
+
+    def rasterize_alpha(self, params) -> np.ndarray:
+        return np.rint(self._coverage(params) * 255.0).astype(np.uint8)
+
+    def _coverage(self, params) -> np.ndarray:
+        placed, _ascent, _descent, (rx, ry, w, h) = self._layout(params)
+        pad = params.padding
+        img_w, img_h = w + 2 * pad, h + 2 * pad
+        ox, oy = pad - rx, pad - ry
+
+        alpha = np.zeros((img_h, img_w), dtype=np.float32)
+        for gx, gy, cov in placed:
+            if not cov.size:
+                continue
+            x0, y0 = ox + gx, oy + gy
+            x1, y1 = x0 + cov.shape[1], y0 + cov.shape[0]
+            cx0, cy0 = max(0, x0), max(0, y0)
+            cx1, cy1 = min(img_w, x1), min(img_h, y1)
+            if cx0 >= cx1 or cy0 >= cy1:
+                continue
+            g = cov[cy0 - y0:cy1 - y0, cx0 - x0:cx1 - x0].astype(np.float32) / 255.0
+            region = alpha[cy0:cy1, cx0:cx1]
+            # source-over, as QPainter composites overlapping glyphs
+            region += g * (1.0 - region)
+
+        return alpha
+
+
+# ---------------------------------------------------------------------
+# Pillow + libraqm
+# ---------------------------------------------------------------------
+
+_PIL_FONT_CACHE_MAXSIZE = 64
+
+
+class PillowEngine(FontFileEngine):
+    """
+    Qt-free engine on PIL.ImageFont with layout_engine=RAQM, so shaping is
+    done by libraqm (HarfBuzz + FriBiDi) inside Pillow.
+    """
+
+    name = "pillow"
+
+    def __init__(self):
+        super().__init__()
+        self._fonts: "OrderedDict[Tuple[str, int], Any]" = OrderedDict()
+
+    @classmethod
+    def available(cls) -> bool:
+        return PILLOW_AVAILABLE and bool(pil_features.check("raqm"))
+
+    @classmethod
+    def import_error(cls) -> Optional[str]:
+        if not PILLOW_AVAILABLE:
+            return str(PILLOW_IMPORT_ERROR)
+        if not pil_features.check("raqm"):
+            return "Pillow is installed but was built without libraqm."
+        return None
+
+    def _layout_engine(self):
+        return ImageFont.Layout.RAQM
+
+    def _read_faces(self, path: str) -> List[Tuple[str, str]]:
+        family, style = ImageFont.truetype(path, 12, layout_engine=ImageFont.Layout.BASIC).getname()
+        return [(family, style or "")] if family else []
+
+    def _font(self, family: str, pixel_size: int):
+        path = self.font_file(family)
+        key = (path, pixel_size)
+        with self._lock:
+            font = self._fonts.get(key)
+            if font is None:
+                font = ImageFont.truetype(path, pixel_size, layout_engine=self._layout_engine())
+                self._fonts[key] = font
+                while len(self._fonts) > _PIL_FONT_CACHE_MAXSIZE:
+                    self._fonts.popitem(last=False)
+            else:
+                self._fonts.move_to_end(key)
+            return font
+
+    def shape(self, text: str, font_family: str, pixel_size: int) -> List[ShapedGlyph]:
+        raise NotImplementedError("Pillow does not expose glyph-level shaping results.")
+
+    def _layout(self, params):
+        from .renderer import _scaled_pixel_size
+
+        px = _scaled_pixel_size(params.font_size, params.scale)
+        runs = self.font_runs(params.text, params.font_family)
+        placed = []
+        left = top = right = bottom = 0
+        advance = 0.0
+        # FreeTypeFont objects are not safe to share between threads
+        with self._lock:
+            ascent, descent = self._font(params.font_family, px).getmetrics()
+            for sub, family in runs:
+                font = self._font(family, px)
+                run_ascent, run_descent = font.getmetrics()
+                ascent, descent = max(ascent, run_ascent), max(descent, run_descent)
+                l, t, r, b = font.getbbox(sub, anchor="ls")
+                pen = int(round(advance))
+                left, top = min(left, pen + l), min(top, t)
+                right, bottom = max(right, pen + r), max(bottom, b)
+                placed.append((font, sub, pen))
+                advance += font.getlength(sub)
+        x0 = min(0, left)
+        y0 = min(-ascent, top)
+        x1 = max(int(math.ceil(advance)), right)
+        y1 = max(descent, bottom)
+        return placed, ascent, descent, (x0, y0, max(1, x1 - x0), max(1, y1 - y0))
+
+    def metrics(self, params) -> Dict[str, Any]:
+        _placed, ascent, descent, (x, y, w, h) = self._layout(params)
+        return {
+            "font_family": params.font_family,
+            "font_size": params.font_size,
+            "scale": params.scale,
+            "text_width_px": w,
+            "text_height_px": h,
+            "image_width_px": w + (2 * params.padding),
+            "image_height_px": h + (2 * params.padding),
+            "ascent_px": ascent,
+            "descent_px": descent,
+            "bounding_rect": {"x": x, "y": y, "width": w, "height": h},
+        }
+
+    def rasterize(self, params) -> np.ndarray:
+        return colorize_alpha(self.rasterize_alpha(params), params.color, params.bg)
+
+    def rasterize_alpha(self, params) -> np.ndarray:
+        placed, _ascent, _descent, (rx, ry, w, h) = self._layout(params)
+        pad = params.padding
+        mask = Image.new("L", (w + 2 * pad, h + 2 * pad), 0)
+        if placed:
+            draw = ImageDraw.Draw(mask)
+            # FreeTypeFont objects are not safe to share between threads
+            with self._lock:
+                for font, sub, pen in placed:
+                    draw.text((pad - rx + pen, pad - ry), sub, font=font, fill=255, anchor="ls")
+        return np.array(mask)
+
+
+# ---------------------------------------------------------------------
+# Registry
+# ---------------------------------------------------------------------
+
+_ENGINE_CLASSES: Dict[str, type] = {
+    "qt": QtEngine,
+    "harfbuzz": HarfBuzzEngine,
+    "pillow": PillowEngine,
+}
+
+_ENGINES: Dict[str, RenderEngine] = {}
+_ACTIVE_ENGINE = "qt"
+_ENGINE_LOCK = threading.RLock()
+
+
+def available_render_engines() -> Dict[str, bool]:
+    """
+    Map of engine name -> whether its dependencies import.
+    """
+    return {name: cls.available() for name, cls in _ENGINE_CLASSES.items()}
+
+
+def get_render_engine(name: Optional[str] = None) -> RenderEngine:
+    """
+    Return the engine instance called ``name`` (default: the active one).
+    """
+    with _ENGINE_LOCK:
+        name = name or _ACTIVE_ENGINE
+        engine = _ENGINES.get(name)
+        if engine is None:
+            cls = _ENGINE_CLASSES.get(name)
+            if cls is None:
+                raise ValueError(
+                    f"Unknown render backend {name!r}; choose from {sorted(_ENGINE_CLASSES)}."
+                )
+            if not cls.available():
+                raise RuntimeError(
+                    f"Render backend {name!r} is not available. "
+                    f"Original import error: {cls.import_error()}"
+                )
+            engine = _ENGINES[name] = cls()
+        return engine
+
+
+def set_render_engine(name: str) -> RenderEngine:
+    """
+    Make ``name`` the engine used by the single-line render and measurement
+    functions. Rendered images are cached per engine.
+    """
+    global _ACTIVE_ENGINE
+
+    with _ENGINE_LOCK:
+        engine = get_render_engine(name)
+        _ACTIVE_ENGINE = engine.name
+        return engine
+
+
+def active_render_engine_name() -> str:
+    return _ACTIVE_ENGINE
+
+
+__all__ = [
+    "RenderEngine",
+    "QtEngine",
+    "FontFileEngine",
+    "HarfBuzzEngine",
+    "PillowEngine",
+    "ShapedGlyph",
+    "available_render_engines",
+    "get_render_engine",
+    "set_render_engine",
+    "parse_color",
+    "colorize_alpha",
+]
@@ -0,0 +1,188 @@
+# bangla_render/executor.py
+from __future__ import annotations
+
+import itertools
+import os
+from collections import Counter, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .engines import get_render_engine
+from .renderer import measure_texts, render_paragraph_qimage, render_text_array, render_text_qimage
+
+
+def _default_workers() -> int:
+    return max(1, min(8, os.cpu_count() or 1))
+
+
+class RenderExecutor:
+    """
+    Fan rendering out over a pool of worker threads.
+
+    The Qt application (for the Qt backend) is created on the calling
+    thread (it must live on the main/GUI thread); workers only paint into
+    their own QImages.
+    Results share the regular render cache, so repeated texts are only
+    rendered once.
+
+    Usage:
+
+        with RenderExecutor(workers=4) as ex:
+            images = ex.map(["এক", "দুই", "তিন"], font_size=24)
+    """
+
+    def __init__(self, workers: Optional[int] = None):
+        get_render_engine().ensure_runtime()
+        self.workers = int(workers) if workers else _default_workers()
+        self._pool = ThreadPoolExecutor(
+            max_workers=self.workers,
+            thread_name_prefix="bangla_render",
+        )
+
+    # -- single submissions ------------------------------------------
+
+    def submit_call(self, fn: Callable[..., Any], *args, **kwargs) -> "Future[Any]":
+        """
+        Run any render function (or other callable) on the pool.
+        """
+        return self._pool.submit(fn, *args, **kwargs)
+
+    def submit(self, text: str, **style) -> "Future[Any]":
+        """
+        Render one single-line text; the future resolves to a QImage.
+        """
+        return self._pool.submit(render_text_qimage, text, **style)
+
+    def submit_paragraph(self, text: str, **style) -> "Future[Any]":
+        """
+        Render one wrapped paragraph; the future resolves to a QImage.
+        """
+        return self._pool.submit(render_paragraph_qimage, text, **style)
+
+    # -- batches -----------------------------------------------------
+
+    def submit_many(self, texts: Sequence[str], **style) -> List["Future[Any]"]:
+        """
+        Submit a batch of single-line texts; futures are in input order.
+        """
+        return [self.submit(t, **style) for t in texts]
+
+    def map(
+        self,
+        texts: Sequence[str],
+        timeout: Optional[float] = None,
+        **style,
+    ) -> List[Any]:
+        """
+        Render a batch of single-line texts and return QImages in input order.
+        """
+        futures = self.submit_many(texts, **style)
+        return [f.result(timeout=timeout) for f in futures]
+
+    # -- lifecycle ---------------------------------------------------
+
+    def shutdown(self, wait: bool = True) -> None:
+        self._pool.shutdown(wait=wait)
+
+    def __enter__(self) -> "RenderExecutor":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.shutdown(wait=True)
+
+
+# ---------------------------------------------------------------------
+# Streaming
+# ---------------------------------------------------------------------
+
+_MEASURE_OPTIONS = ("font_family", "font_path", "font_size", "padding", "scale")
+
+
+def _chunks(texts: Iterable[Any], chunk_size: int) -> Iterator[List[Any]]:
+    it = iter(texts)
+    while True:
+        chunk = list(itertools.islice(it, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def iter_render(
+    texts: Iterable[Any],
+    chunk_size: int = 256,
+    workers: Optional[int] = None,
+    with_metrics: bool = True,
+    **style,
+) -> Iterator[Tuple[int, np.ndarray, Optional[Dict[str, Any]]]]:
+    """
+    Render single-line texts lazily, yielding ``(index, array, metrics)``
+    in input order.
+
+    ``texts`` may be any iterable, including a generator over millions of
+    strings; it is consumed ``chunk_size`` at a time. Each chunk renders
+    every distinct text once through the render cache (repeats, within
+    and across chunks, are cache hits) and measures it with one pooled
+    font (measure_texts(); ``metrics`` is None without ``with_metrics``).
+    Arrays are as from render_text_array(**style) and owned by the
+    caller.
+
+    With ``workers`` > 1 chunks render on a RenderExecutor and the next
+    chunk is prefetched while the current one is consumed, so at most two
+    chunks of arrays are in flight besides what the caller keeps.
+    Abandoning the generator waits for the prefetched chunk and stops.
+    """
+    chunk_size = int(chunk_size)
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1.")
+    measure_style = {k: v for k, v in style.items() if k in _MEASURE_OPTIONS}
+
+    def emit(start: int, chunk: List[Any], rendered: Dict[Any, Any]):
+        # ``rendered`` holds each distinct text of the chunk once, in order
+        measured: Dict[Any, Optional[Dict[str, Any]]] = dict.fromkeys(rendered)
+        if with_metrics:
+            measured.update(zip(measured, measure_texts(list(measured), **measure_style)))
+        # repeats within the chunk get their own copies, taken from a private
+        # one made before the first occurrence reaches the caller
+        left = Counter(chunk)
+        spare: Dict[Any, np.ndarray] = {}
+        for i, text in enumerate(chunk):
+            left[text] -= 1
+            info = measured[text]
+            if text in spare:
+                arr = spare[text].copy() if left[text] else spare.pop(text)
+                info = dict(info) if info is not None else None
+            else:
+                arr = rendered.pop(text)
+                if isinstance(arr, Future):
+                    arr = arr.result()
+                if left[text]:
+                    spare[text] = arr.copy()
+            yield start + i, arr, info
+
+    start = 0
+    if not workers or int(workers) <= 1:
+        get_render_engine().ensure_runtime()
+        for chunk in _chunks(texts, chunk_size):
+            rendered = {t: render_text_array(t, **style) for t in dict.fromkeys(chunk)}
+            yield from emit(start, chunk, rendered)
+            start += len(chunk)
+        return
+
+    with RenderExecutor(workers=workers) as ex:
+        pending: "deque[Tuple[int, List[Any], Dict[Any, Future]]]" = deque()
+        for chunk in _chunks(texts, chunk_size):
+            futures = {t: ex.submit_call(render_text_array, t, **style) for t in dict.fromkeys(chunk)}
+            pending.append((start, chunk, futures))
+            start += len(chunk)
+            if len(pending) == 2:
+                yield from emit(*pending.popleft())
+        while pending:
+            yield from emit(*pending.popleft())
+
+
+__all__ = [
+    "RenderExecutor",
+    "iter_render",
+]
@@ -0,0 +1,434 @@
+# bangla_render/font_catalog.py
+"""
+Persistent catalogue of the fonts installed on this host.
+
+Enumerating Qt's font database is the slowest part of a cold start on
+hosts with large font collections. The catalogue records every face in
+the system font directories (family, style, path, file fingerprint,
+Bengali coverage and the last validation result) in a JSON file under
+the user cache directory, so discovery queries are answered without
+asking Qt. It is opt-in (set_font_catalog()).
+
+The catalogue also stores the modification time of every directory it
+walked. It is rescanned only when one of them changed, and then only
+files whose size or mtime changed are read again.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import struct
+import sys
+import tempfile
+import threading
+import time
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from .coverage import parse_cmap, sfnt_face_count, sfnt_table
+
+
+# ---------------------------------------------------------------------
+# Locations
+# ---------------------------------------------------------------------
+
+CATALOG_VERSION = 1
+
+_FONT_EXTENSIONS = (".ttf", ".otf", ".ttc", ".otc")
+
+# Letters, signs and the virama a usable Bengali font must map.
+_BENGALI_REQUIRED = (
+    "অআইঈউঊঋএঐওঔকখগঘঙচছজঝঞটঠডঢণতথদধনপফবভমযরলশষসহড়ঢ়য়"
+    "ািীুূৃেৈোৌ্ংঃঁ়"
+)
+
+
+def font_cache_dir() -> str:
+    """
+    Directory for bangla_render's persistent caches: $BANGLA_RENDER_CACHE_DIR,
+    else $XDG_CACHE_HOME/bangla_render, else ~/.cache/bangla_render.
+    """
+    explicit = os.environ.get("BANGLA_RENDER_CACHE_DIR")
+    if explicit:
+        return os.path.abspath(os.path.expanduser(explicit))
+    if sys.platform.startswith("win"):
+        base = os.environ.get("LOCALAPPDATA") or os.path.expanduser("~")
+    else:
+        base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "bangla_render")
+
+
+def default_catalog_path() -> str:
+    return os.path.join(font_cache_dir(), "font_catalog.json")
+
+
+def _system_font_dirs() -> List[str]:
+    home = os.path.expanduser("~")
+    if sys.platform.startswith("win"):
+        windir = os.environ.get("WINDIR", r"C:\Windows")
+        return [
+            os.path.join(windir, "Fonts"),
+            os.path.join(os.environ.get("LOCALAPPDATA", ""), "Microsoft", "Windows", "Fonts"),
+        ]
+    if sys.platform == "darwin":
+        return ["/System/Library/Fonts", "/Library/Fonts", os.path.join(home, "Library", "Fonts")]
+    return [
+        "/usr/share/fonts",
+        "/usr/local/share/fonts",
+        os.path.join(home, ".fonts"),
+        os.path.join(home, ".local", "share", "fonts"),
+    ]
+
+
+# ---------------------------------------------------------------------
+# Per-file facts
+# ---------------------------------------------------------------------
+
+_FINGERPRINT_CHUNK = 64 * 1024
+
+
+def font_fingerprint(path: str, stat: Optional[os.stat_result] = None) -> str:
+    """
+    Cheap content fingerprint of a font file: BLAKE2b over its size and
+    its first and last 64 KiB.
+    """
+    st = stat or os.stat(path)
+    h = hashlib.blake2b(digest_size=16)
+    h.update(str(st.st_size).encode("ascii"))
+    with open(path, "rb") as f:
+        h.update(f.read(_FINGERPRINT_CHUNK))
+        if st.st_size > 2 * _FINGERPRINT_CHUNK:
+            f.seek(-_FINGERPRINT_CHUNK, os.SEEK_END)
+            h.update(f.read(_FINGERPRINT_CHUNK))
+    return h.hexdigest()
+
+
+_NAME_RECORD = struct.Struct(">HHHHHH")
+
+
+def _decode_name(platform: int, raw: bytes) -> Optional[str]:
+    try:
+        if platform in (0, 3):
+            return raw.decode("utf-16-be")
+        if platform == 1:
+            return raw.decode("mac_roman")
+    except UnicodeDecodeError:
+        return None
+    return None
+
+
+def parse_name_table(table: bytes) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Return ``(family, style)`` from a ``name`` table, preferring the
+    typographic names (IDs 16/17) and Windows US-English records.
+    """
+    _fmt, count, string_offset = struct.unpack_from(">HHH", table, 0)
+    best: Dict[int, Tuple[int, str]] = {}
+    for i in range(count):
+        platform, _encoding, language, name_id, length, offset = _NAME_RECORD.unpack_from(table, 6 + 12 * i)
+        if name_id not in (1, 2, 16, 17):
+            continue
+        start = string_offset + offset
+        value = _decode_name(platform, table[start:start + length])
+        if not value:
+            continue
+        rank = 0 if (platform, language) == (3, 0x409) else 1 if platform == 3 else 2
+        if name_id not in best or rank < best[name_id][0]:
+            best[name_id] = (rank, value.strip())
+
+    family = (best.get(16) or best.get(1) or (0, None))[1]
+    style = (best.get(17) or best.get(2) or (0, ""))[1]
+    return family, style
+
+
+def read_font_faces(path: str) -> List[Dict[str, Any]]:
+    """
+    Catalogue entries (without file facts) for every face in a font file.
+    """
+    with open(path, "rb") as f:
+        data = f.read()
+    faces: List[Dict[str, Any]] = []
+    for index in range(sfnt_face_count(data)):
+        name = sfnt_table(data, "name", index)
+        if not name:
+            continue
+        family, style = parse_name_table(name)
+        if not family:
+            continue
+        cmap = sfnt_table(data, "cmap", index)
+        coverage = parse_cmap(cmap) if cmap else None
+        bengali = coverage is not None and coverage.covers(_BENGALI_REQUIRED)
+        faces.append({
+            "family": family,
+            "style": style or "",
+            "index": index,
+            "glyphs": len(coverage) if coverage is not None else 0,
+            "bengali": bool(bengali),
+            "validation": None,
+        })
+    return faces
+
+
+# ---------------------------------------------------------------------
+# Catalogue
+# ---------------------------------------------------------------------
+
+class FontCatalog:
+    """
+    On-disk catalogue of the faces under ``dirs`` (default: the system
+    font directories).
+    """
+
+    def __init__(self, path: Optional[str] = None, dirs: Optional[Sequence[str]] = None):
+        self.path = path or default_catalog_path()
+        self.roots = [os.path.abspath(d) for d in (dirs if dirs is not None else _system_font_dirs())]
+        self._lock = threading.RLock()
+        self._dirs: Dict[str, int] = {}
+        self._fonts: List[Dict[str, Any]] = []
+        self._by_family: Dict[str, List[Dict[str, Any]]] = {}
+        self._checked = False
+        self.stats: Dict[str, Any] = {"loaded": False, "rebuilt": False, "files_read": 0, "scan_s": 0.0}
+
+    # -- persistence -------------------------------------------------
+
+    def _load(self) -> bool:
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                doc = json.load(f)
+        except (OSError, ValueError):
+            return False
+        if doc.get("version") != CATALOG_VERSION or doc.get("roots") != self.roots:
+            return False
+        self._dirs = {str(k): int(v) for k, v in doc.get("dirs", {}).items()}
+        self._set_fonts(list(doc.get("fonts", [])))
+        self.stats["loaded"] = True
+        return True
+
+    def save(self) -> None:
+        """
+        Write the catalogue atomically; an unwritable cache dir is ignored.
+        """
+        with self._lock:
+            doc = {
+                "version": CATALOG_VERSION,
+                "roots": self.roots,
+                "dirs": self._dirs,
+                "fonts": self._fonts,
+            }
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            fd, tmp = tempfile.mkstemp(prefix=".font_catalog.", dir=os.path.dirname(self.path))
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(doc, f, ensure_ascii=False)
+            os.replace(tmp, self.path)
+        except OSError:
+            pass
+
+    def _set_fonts(self, fonts: List[Dict[str, Any]]) -> None:
+        by_family: Dict[str, List[Dict[str, Any]]] = {}
+        for entry in fonts:
+            by_family.setdefault(entry["family"].lower(), []).append(entry)
+        self._fonts = fonts
+        self._by_family = by_family
+
+    # -- scanning ----------------------------------------------------
+
+    def _dirs_changed(self) -> bool:
+        if not self._dirs:
+            return True
+        for root in self.roots:
+            if os.path.isdir(root) and root not in self._dirs:
+                return True
+        for d, mtime in self._dirs.items():
+            try:
+                if os.stat(d).st_mtime_ns != mtime:
+                    return True
+            except OSError:
+                return True
+        return False
+
+    def _rescan(self) -> None:
+        started = time.perf_counter()
+        previous: Dict[str, List[Dict[str, Any]]] = {}
+        for entry in self._fonts:
+            previous.setdefault(entry["path"], []).append(entry)
+
+        dirs: Dict[str, int] = {}
+        fonts: List[Dict[str, Any]] = []
+        files_read = 0
+        for root in self.roots:
+            if not os.path.isdir(root):
+                continue
+            for dirpath, _dirnames, filenames in os.walk(root):
+                try:
+                    dirs[dirpath] = os.stat(dirpath).st_mtime_ns
+                except OSError:
+                    continue
+                for fname in sorted(filenames):
+                    if not fname.lower().endswith(_FONT_EXTENSIONS):
+                        continue
+                    path = os.path.join(dirpath, fname)
+                    try:
+                        st = os.stat(path)
+                    except OSError:
+                        continue
+                    old = previous.get(path)
+                    if old and (old[0]["size"], old[0]["mtime_ns"]) == (st.st_size, st.st_mtime_ns):
+                        fonts.extend(old)
+                        continue
+                    try:
+                        faces = read_font_faces(path)
+                        fingerprint = font_fingerprint(path, st)
+                    except Exception:
+                        continue
+                    files_read += 1
+                    for face in faces:
+                        face.update(path=path, size=st.st_size, mtime_ns=st.st_mtime_ns, fingerprint=fingerprint)
+                        fonts.append(face)
+
+        self._dirs = dirs
+        self._set_fonts(fonts)
+        self.stats.update(rebuilt=True, files_read=files_read, scan_s=time.perf_counter() - started)
+
+    def refresh(self, force: bool = False) -> bool:
+        """
+        Load the catalogue and rescan if a font directory changed (or
+        ``force``). Returns True when a rescan happened.
+        """
+        with self._lock:
+            if not self._fonts and not self._dirs:
+                self._load()
+            if not force and not self._dirs_changed():
+                self._checked = True
+                return False
+            self._rescan()
+            self._checked = True
+        self.save()
+        return True
+
+    def _ensure(self) -> None:
+        if not self._checked:
+            self.refresh()
+
+    # -- queries -----------------------------------------------------
+
+    def families(self) -> List[str]:
+        self._ensure()
+        with self._lock:
+            return sorted({e["family"] for e in self._fonts})
+
+    def lookup(self, family: str) -> Optional[str]:
+        """
+        Catalogue spelling of ``family`` (case-insensitive), or None.
+        """
+        self._ensure()
+        with self._lock:
+            faces = self._by_family.get(str(family).strip().lower())
+            return faces[0]["family"] if faces else None
+
+    def faces(self, family: Optional[str] = None) -> List[Dict[str, Any]]:
+        self._ensure()
+        with self._lock:
+            if family is None:
+                return [dict(e) for e in self._fonts]
+            return [dict(e) for e in self._by_family.get(str(family).strip().lower(), [])]
+
+    def bengali_families(self) -> List[str]:
+        """
+        Families with at least one face covering the Bengali letters.
+        """
+        self._ensure()
+        with self._lock:
+            return sorted({e["family"] for e in self._fonts if e["bengali"]})
+
+    def set_validation(self, fingerprint: str, result: Optional[Dict[str, Any]]) -> None:
+        """
+        Record a validation result on every face with ``fingerprint``.
+        """
+        with self._lock:
+            changed = False
+            for entry in self._fonts:
+                if entry.get("fingerprint") == fingerprint and entry.get("validation") != result:
+                    entry["validation"] = result
+                    changed = True
+        if changed:
+            self.save()
+
+    def info(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "path": self.path,
+                "roots": list(self.roots),
+                "directories": len(self._dirs),
+                "faces": len(self._fonts),
+                "families": len(self._by_family),
+                **self.stats,
+            }
+
+
+_CATALOG: Optional[FontCatalog] = None
+# Opt-in: the catalogue only covers the standard font directories and
+# writes to the user cache dir, so it is off unless asked for.
+_CATALOG_ENABLED = os.environ.get("BANGLA_RENDER_FONT_CATALOG", "").strip().lower() in ("1", "true", "yes", "on")
+_CATALOG_LOCK = threading.Lock()
+
+
+def get_font_catalog() -> Optional[FontCatalog]:
+    """
+    The process-wide catalogue, or None when disabled.
+    """
+    global _CATALOG
+    if not _CATALOG_ENABLED:
+        return None
+    with _CATALOG_LOCK:
+        if _CATALOG is None:
+            _CATALOG = FontCatalog()
+        return _CATALOG
+
+
+def set_font_catalog(
+    enabled: bool = True,
+    path: Optional[str] = None,
+    dirs: Optional[Sequence[str]] = None,
+) -> Optional[FontCatalog]:
+    """
+    Enable/disable catalogue-backed font discovery, or point it at another
+    file or set of font directories. Discovery uses Qt's font database
+    unless this is called (or $BANGLA_RENDER_FONT_CATALOG=1 is set).
+    """
+    global _CATALOG, _CATALOG_ENABLED
+    with _CATALOG_LOCK:
+        _CATALOG_ENABLED = bool(enabled)
+        _CATALOG = FontCatalog(path=path, dirs=dirs) if enabled else None
+        return _CATALOG
+
+
+def rebuild_font_catalog() -> Dict[str, Any]:
+    """
+    Rescan the font directories now and return the catalogue info.
+    """
+    catalog = get_font_catalog()
+    if catalog is None:
+        raise RuntimeError("The font catalogue is disabled; call set_font_catalog(enabled=True).")
+    catalog.refresh(force=True)
+    return catalog.info()
+
+
+def get_font_catalog_info() -> Optional[Dict[str, Any]]:
+    catalog = get_font_catalog()
+    if catalog is None:
+        return None
+    catalog._ensure()
+    return catalog.info()
+
+
+__all__ = [
+    "FontCatalog",
+    "font_cache_dir",
+    "font_fingerprint",
+    "read_font_faces",
+    "get_font_catalog",
+    "set_font_catalog",
+    "rebuild_font_catalog",
+    "get_font_catalog_info",
+]
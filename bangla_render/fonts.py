@@ -1,11 +1,19 @@
 # bangla_render/fonts.py
 from __future__ import annotations
 
+import fnmatch
+import json
 import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, asdict, field
-from typing import Any, Dict, List, Optional, Sequence, Tuple
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
 
 from .backend import ensure_qt_application
+from .font_catalog import font_cache_dir, font_fingerprint, get_font_catalog
 
 try:
     from PySide6.QtGui import (
@@ -16,7 +24,7 @@ try:
         QPainter,
         QColor,
     )
-    from PySide6.QtCore import Qt
+    from PySide6.QtCore import QByteArray, Qt
     QT_FONT_AVAILABLE = True
     QT_FONT_IMPORT_ERROR = None
 except Exception as e:  # pragma: no cover
@@ -26,6 +34,7 @@ except Exception as e:  # pragma: no cover
     QImage = None
     QPainter = None
     QColor = None
+    QByteArray = None
     Qt = None
     QT_FONT_AVAILABLE = False
     QT_FONT_IMPORT_ERROR = e
@@ -41,6 +50,17 @@ _DEFAULT_FONT_PATH: Optional[str] = None
 _REGISTERED_FONT_FILES: List[str] = []
 _REGISTERED_FONT_FAMILIES: Dict[str, List[str]] = {}  # font_path -> families
 
+# Guards the default font and registration state above.
+_FONT_LOCK = threading.RLock()
+
+# (family, pixel_size) -> (QFont, QFontMetrics), shared by measurement
+# and rendering. Pooled objects must not be mutated by callers.
+# QFont/QFontMetrics are reentrant but not thread-safe, so each thread
+# keeps its own pool; bumping the generation invalidates every pool.
+_FONT_POOL_MAXSIZE = 64
+_FONT_POOL_LOCAL = threading.local()
+_FONT_POOL_GENERATION = 0
+
 
 BANGLA_FONT_CANDIDATES = [
     "Nirmala UI",
@@ -58,6 +78,43 @@ BANGLA_FONT_CANDIDATES = [
     "Lohit Bengali",
 ]
 
+# Tried, after the Bengali candidates, for characters the requested font
+# does not map (Latin, Devanagari, symbols in mixed labels).
+FALLBACK_FONT_CANDIDATES = [
+    "Noto Sans",
+    "Noto Sans Devanagari",
+    "Mangal",
+    "Lohit Devanagari",
+    "Segoe UI",
+    "Arial",
+    "Liberation Sans",
+    "DejaVu Sans",
+    "Noto Sans Symbols",
+    "Noto Sans Symbols 2",
+    "Segoe UI Symbol",
+]
+
+# (family, file fingerprint, sample text, pixel size) -> render-test
+# outcome, so validate_font() paints each sample once per font file.
+# Families with no known file get an empty fingerprint and are only
+# memoized in memory.
+_VALIDATION_CACHE: Dict[Tuple[str, str, str, int], Dict[str, Any]] = {}
+_VALIDATION_PERSIST_PATH: Optional[str] = None
+_VALIDATION_LOADED = False
+
+# Qt's family names as (sorted list, exact-name set, lower-case index),
+# built on first use and dropped by _invalidate_font_caches(). Every
+# render resolves its family name, and enumerating Qt's font database is
+# by far the most expensive part of that.
+_FAMILY_INDEX: Optional[Tuple[List[str], Set[str], Dict[str, str]]] = None
+
+# (path, size, mtime_ns) -> fingerprint
+_FINGERPRINTS: Dict[Tuple[str, int, int], str] = {}
+
+# None -> BANGLA_FONT_CANDIDATES + FALLBACK_FONT_CANDIDATES
+_FALLBACK_FAMILIES: Optional[List[str]] = None
+_FALLBACK_ENABLED = True
+
 
 @dataclass
 class FontValidationResult:
@@ -70,6 +127,8 @@ class FontValidationResult:
     glyph_metrics_nonempty: bool = False
     rendered_nonempty: bool = False
     exact_family_match: bool = False
+    fingerprint: Optional[str] = None
+    cached: bool = False
     warnings: List[str] = field(default_factory=list)
     error: Optional[str] = None
 
@@ -99,20 +158,29 @@ def _normalize_path(path: str) -> str:
     return os.path.abspath(os.path.expanduser(path))
 
 
+def _family_index() -> Tuple[List[str], Set[str], Dict[str, str]]:
+    global _FAMILY_INDEX
+    with _FONT_LOCK:
+        if _FAMILY_INDEX is None:
+            db = _font_db()
+            try:
+                fams = list(db.families())
+            except Exception:
+                fams = []
+            families = sorted(set(str(f) for f in fams))
+            _FAMILY_INDEX = (families, set(families), {f.lower(): f for f in families})
+        return _FAMILY_INDEX
+
+
 def _all_font_families() -> List[str]:
-    db = _font_db()
-    try:
-        fams = list(db.families())
-    except Exception:
-        fams = []
-    return sorted(set(str(f) for f in fams))
+    return list(_family_index()[0])
 
 
 def _family_exists(family: str) -> bool:
     family = str(family).strip()
     if not family:
         return False
-    return family in _all_font_families()
+    return family in _family_index()[1]
 
 
 def _case_insensitive_family_lookup(family: str) -> Optional[str]:
@@ -120,17 +188,116 @@ def _case_insensitive_family_lookup(family: str) -> Optional[str]:
     if not family:
         return None
 
-    families = _all_font_families()
-    if family in families:
+    _families, exact, lower_map = _family_index()
+    if family in exact:
         return family
-
-    lower_map = {f.lower(): f for f in families}
     return lower_map.get(family.lower())
 
 
-def _register_font_file(font_path: str) -> Tuple[bool, List[str], Optional[str]]:
+def _discovery_lookup(family: str) -> Optional[str]:
+    """
+    _case_insensitive_family_lookup() for discovery queries: answered from
+    the font catalogue plus application-registered families when the
+    catalogue is enabled, so Qt's font database is not enumerated.
+    """
+    catalog = get_font_catalog()
+    if catalog is None:
+        return _case_insensitive_family_lookup(family)
+
+    key = str(family).strip().lower()
+    if not key:
+        return None
+    with _FONT_LOCK:
+        for families in _REGISTERED_FONT_FAMILIES.values():
+            for f in families:
+                if f.lower() == key:
+                    return f
+    return catalog.lookup(family)
+
+
+def _lookup_family(family: str) -> Optional[str]:
     """
-    Register a font file with Qt.
+    Resolve a family name: through _discovery_lookup(), then Qt when the
+    catalogue does not know it (fonts outside the catalogued directories
+    are only known to Qt).
+    """
+    match = _discovery_lookup(family)
+    if match is None and get_font_catalog() is not None:
+        match = _case_insensitive_family_lookup(family)
+    return match
+
+
+def _font_pool() -> "OrderedDict[Tuple[str, int], Tuple[QFont, QFontMetrics]]":
+    pool = getattr(_FONT_POOL_LOCAL, "pool", None)
+    if pool is None or _FONT_POOL_LOCAL.generation != _FONT_POOL_GENERATION:
+        pool = OrderedDict()
+        _FONT_POOL_LOCAL.pool = pool
+        _FONT_POOL_LOCAL.generation = _FONT_POOL_GENERATION
+    return pool
+
+
+def _pooled_font_entry(family: str, pixel_size: int) -> Tuple[QFont, QFontMetrics]:
+    pool = _font_pool()
+    key = (str(family), max(1, int(pixel_size)))
+    entry = pool.get(key)
+    if entry is not None:
+        pool.move_to_end(key)
+        return entry
+
+    _ensure_font_runtime()
+    font = QFont(key[0])
+    font.setPixelSize(key[1])
+    entry = (font, QFontMetrics(font))
+
+    pool[key] = entry
+    while len(pool) > _FONT_POOL_MAXSIZE:
+        pool.popitem(last=False)
+    return entry
+
+
+def pooled_font(family: str, pixel_size: int) -> QFont:
+    """
+    Return a shared QFont for (family, pixel size). Do not mutate it.
+    """
+    return _pooled_font_entry(family, pixel_size)[0]
+
+
+def pooled_font_metrics(family: str, pixel_size: int) -> QFontMetrics:
+    """
+    Return shared QFontMetrics for (family, pixel size).
+    """
+    return _pooled_font_entry(family, pixel_size)[1]
+
+
+def get_font_pool_info() -> Dict[str, int]:
+    """
+    Return the calling thread's font pool occupancy.
+    """
+    return {
+        "size": len(_font_pool()),
+        "maxsize": _FONT_POOL_MAXSIZE,
+        "generation": _FONT_POOL_GENERATION,
+    }
+
+
+def clear_font_pool() -> None:
+    """
+    Invalidate the font pools of all threads.
+    """
+    global _FONT_POOL_GENERATION
+    with _FONT_LOCK:
+        _FONT_POOL_GENERATION += 1
+
+
+def _register_font_file(
+    font_path: str,
+    data: Optional[bytes] = None,
+    invalidate: bool = True,
+) -> Tuple[bool, List[str], Optional[str]]:
+    """
+    Register a font file with Qt. With ``data`` (the file's bytes) Qt
+    registers from memory instead of reading the file again. Bulk callers
+    pass ``invalidate=False`` and clear the font caches once at the end.
 
     Returns
     -------
@@ -147,7 +314,11 @@ def _register_font_file(font_path: str) -> Tuple[bool, List[str], Optional[str]]
         return False, [], f"Font path is not a file: {path}"
 
     try:
-        font_id = QFontDatabase.addApplicationFont(path)
+        with _FONT_LOCK:
+            if data is not None:
+                font_id = QFontDatabase.addApplicationFontFromData(QByteArray(data))
+            else:
+                font_id = QFontDatabase.addApplicationFont(path)
     except Exception as e:
         return False, [], f"Failed to register font '{path}': {e}"
 
@@ -161,13 +332,36 @@ def _register_font_file(font_path: str) -> Tuple[bool, List[str], Optional[str]]
 
     families = [str(f) for f in families]
 
-    if path not in _REGISTERED_FONT_FILES:
-        _REGISTERED_FONT_FILES.append(path)
-    _REGISTERED_FONT_FAMILIES[path] = families
+    with _FONT_LOCK:
+        is_new = path not in _REGISTERED_FONT_FILES
+        if is_new:
+            _REGISTERED_FONT_FILES.append(path)
+        _REGISTERED_FONT_FAMILIES[path] = families
+
+    if invalidate:
+        _invalidate_font_caches(coverage=is_new)
 
     return True, families, None
 
 
+def _invalidate_font_caches(coverage: bool = True) -> None:
+    # A newly registered file can change what a family name resolves to.
+    global _FAMILY_INDEX
+    clear_font_pool()
+    with _FONT_LOCK:
+        _FAMILY_INDEX = None
+        # results without a file fingerprint cannot go stale on their own
+        for key in [k for k in _VALIDATION_CACHE if not k[1]]:
+            del _VALIDATION_CACHE[key]
+    if coverage:
+        from .coverage import clear_coverage_index
+        from .renderer import clear_render_cache
+
+        # labels drawn with a fallback the new file now replaces
+        clear_coverage_index()
+        clear_render_cache()
+
+
 def _try_render_sample(
     family: str,
     sample_text: str,
@@ -184,6 +378,7 @@ def _try_render_sample(
     _ensure_font_runtime()
 
     try:
+        # point size, as validation has always used; not the pixel-size pool
         font = QFont(family, font_size)
         fm = QFontMetrics(font)
 
@@ -214,11 +409,133 @@ def _try_render_sample(
         return False, False, str(e)
 
 
+def _file_fingerprint(path: str) -> str:
+    st = os.stat(path)
+    key = (path, st.st_size, st.st_mtime_ns)
+    with _FONT_LOCK:
+        hit = _FINGERPRINTS.get(key)
+    if hit is None:
+        hit = font_fingerprint(path, st)
+        with _FONT_LOCK:
+            _FINGERPRINTS[key] = hit
+    return hit
+
+
+def _family_fingerprint(family: str, font_path: Optional[str] = None) -> str:
+    """
+    Fingerprint of the file providing ``family``: the explicit path, an
+    application-registered file, or the catalogue's regular face. Empty
+    when the file is unknown.
+    """
+    try:
+        if font_path:
+            return _file_fingerprint(_normalize_path(font_path))
+        key = str(family).strip().lower()
+        with _FONT_LOCK:
+            paths = [p for p, fams in _REGISTERED_FONT_FAMILIES.items() if key in (f.lower() for f in fams)]
+        if paths:
+            return _file_fingerprint(paths[-1])
+        catalog = get_font_catalog()
+        if catalog is not None:
+            faces = catalog.faces(family)
+            regular = [f for f in faces if f["style"].lower() in ("regular", "book", "normal", "roman")]
+            if faces:
+                return (regular or faces)[0]["fingerprint"]
+    except OSError:
+        pass
+    return ""
+
+
+def _validation_store_path() -> str:
+    return _VALIDATION_PERSIST_PATH or os.path.join(font_cache_dir(), "font_validation.json")
+
+
+def _load_validation_store() -> None:
+    global _VALIDATION_LOADED
+    if _VALIDATION_LOADED or _VALIDATION_PERSIST_PATH is None:
+        return
+    _VALIDATION_LOADED = True
+    try:
+        with open(_validation_store_path(), "r", encoding="utf-8") as f:
+            doc = json.load(f)
+    except (OSError, ValueError):
+        return
+    for entry in doc.get("results", []):
+        key = (entry["family"], entry["fingerprint"], entry["sample_text"], int(entry["font_size"]))
+        _VALIDATION_CACHE.setdefault(key, entry)
+
+
+def _save_validation_store() -> None:
+    if _VALIDATION_PERSIST_PATH is None:
+        return
+    with _FONT_LOCK:
+        results = [e for (_f, fp, _t, _s), e in _VALIDATION_CACHE.items() if fp]
+    path = _validation_store_path()
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp = tempfile.mkstemp(prefix=".font_validation.", dir=os.path.dirname(path))
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump({"version": 1, "results": results}, f, ensure_ascii=False)
+        os.replace(tmp, path)
+    except OSError:
+        pass
+
+
+def _validated_sample(
+    family: str,
+    font_path: Optional[str],
+    sample_text: str,
+    font_size: int,
+) -> Tuple[Dict[str, Any], bool]:
+    """
+    Memoized _try_render_sample(). Returns (entry, from_cache); failed
+    renders (exceptions) are not memoized.
+    """
+    fingerprint = _family_fingerprint(family, font_path)
+    key = (family, fingerprint, sample_text, int(font_size))
+    with _FONT_LOCK:
+        _load_validation_store()
+        hit = _VALIDATION_CACHE.get(key)
+    if hit is not None:
+        return hit, True
+
+    glyph_ok, render_ok, error = _try_render_sample(family=family, sample_text=sample_text, font_size=font_size)
+    entry = {
+        "family": family,
+        "fingerprint": fingerprint,
+        "sample_text": sample_text,
+        "font_size": int(font_size),
+        "glyph_metrics_nonempty": glyph_ok,
+        "rendered_nonempty": render_ok,
+        "error": error,
+    }
+    if error:
+        return entry, False
+
+    with _FONT_LOCK:
+        _VALIDATION_CACHE[key] = entry
+    _save_validation_store()
+    catalog = get_font_catalog()
+    if catalog is not None and fingerprint:
+        catalog.set_validation(fingerprint, {
+            "ok": bool(glyph_ok and render_ok),
+            "sample_text": sample_text,
+            "font_size": int(font_size),
+        })
+    return entry, False
+
+
 def _resolve_from_candidates() -> Optional[str]:
     for name in BANGLA_FONT_CANDIDATES:
-        match = _case_insensitive_family_lookup(name)
+        match = _discovery_lookup(name)
         if match:
             return match
+    if get_font_catalog() is not None:
+        # fonts outside the catalogued directories are only known to Qt
+        for name in BANGLA_FONT_CANDIDATES:
+            match = _case_insensitive_family_lookup(name)
+            if match:
+                return match
     return None
 
 
@@ -257,9 +574,142 @@ def register_fonts(font_paths: Sequence[str]) -> Dict[str, List[str]]:
     return results
 
 
+_FONT_PATTERNS = ("*.ttf", "*.otf", "*.ttc", "*.otc")
+
+
+def _read_for_registration(
+    path: str,
+    known: set,
+    from_data: bool,
+) -> Tuple[str, Optional[str], Optional[bytes], Optional[str]]:
+    """
+    Worker for register_font_directory(): (path, fingerprint, data, error).
+    Files whose fingerprint is already registered are not read.
+    """
+    try:
+        fingerprint = _file_fingerprint(path)
+        if fingerprint in known or not from_data:
+            return path, fingerprint, None, None
+        with open(path, "rb") as f:
+            return path, fingerprint, f.read(), None
+    except OSError as e:
+        return path, None, None, str(e)
+
+
+def register_font_directory(
+    path: str,
+    recursive: bool = True,
+    patterns: Sequence[str] = _FONT_PATTERNS,
+    workers: Optional[int] = None,
+    from_data: bool = False,
+) -> Dict[str, Any]:
+    """
+    Register every font file under ``path`` whose name matches one of
+    ``patterns`` (case-insensitive).
+
+    Files are stat'ed and fingerprinted on a thread pool; registration
+    with Qt happens on the calling thread. Files whose fingerprint is
+    already registered, including copies under another path, are skipped,
+    and font caches are invalidated once for the whole directory.
+
+    With ``from_data`` the pool also reads each file and Qt registers it
+    from memory (addApplicationFontFromData). Qt parses in-memory fonts
+    more slowly than files on local disk, so this only pays off when the
+    fonts live on a slow or network filesystem.
+
+    Returns
+    -------
+    dict with ``families`` (family -> sorted paths, including skipped
+    files), ``skipped`` and ``errors`` (path -> message) and ``stats``
+    (counts and per-phase timings in seconds).
+    """
+    _ensure_font_runtime()
+    started = time.perf_counter()
+    root = _normalize_path(path)
+    if not os.path.isdir(root):
+        raise RuntimeError(f"Font directory does not exist: {root}")
+
+    lowered = [p.lower() for p in patterns]
+    files: List[str] = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames.sort()
+        for fname in sorted(filenames):
+            if any(fnmatch.fnmatch(fname.lower(), p) for p in lowered):
+                files.append(os.path.join(dirpath, fname))
+        if not recursive:
+            break
+    scanned = time.perf_counter()
+
+    with _FONT_LOCK:
+        registered_paths = list(_REGISTERED_FONT_FILES)
+    by_fingerprint: Dict[str, str] = {}
+    for registered in registered_paths:
+        try:
+            by_fingerprint[_file_fingerprint(registered)] = registered
+        except OSError:
+            continue
+    known = set(by_fingerprint)
+
+    families: Dict[str, List[str]] = {}
+    skipped: List[str] = []
+    errors: Dict[str, str] = {}
+    registered_count = 0
+    register_s = 0.0
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(_read_for_registration, f, known, from_data) for f in files]
+        for future in as_completed(futures):
+            file_path, fingerprint, data, error = future.result()
+            if error:
+                errors[file_path] = error
+                continue
+            owner = by_fingerprint.get(fingerprint)
+            if owner is not None:
+                skipped.append(file_path)
+                with _FONT_LOCK:
+                    owner_families = list(_REGISTERED_FONT_FAMILIES.get(owner, []))
+                for family in owner_families:
+                    families.setdefault(family, []).append(file_path)
+                continue
+
+            t0 = time.perf_counter()
+            ok, file_families, error = _register_font_file(file_path, data=data, invalidate=False)
+            register_s += time.perf_counter() - t0
+            if not ok:
+                errors[file_path] = error or f"Failed to register {file_path}"
+                continue
+            registered_count += 1
+            by_fingerprint[fingerprint] = file_path
+            for family in file_families:
+                families.setdefault(family, []).append(file_path)
+
+    if registered_count:
+        _invalidate_font_caches()
+
+    finished = time.perf_counter()
+    return {
+        "families": {family: sorted(paths) for family, paths in sorted(families.items())},
+        "skipped": sorted(skipped),
+        "errors": errors,
+        "stats": {
+            "files": len(files),
+            "registered": registered_count,
+            "skipped": len(skipped),
+            "failed": len(errors),
+            "scan_s": scanned - started,
+            "read_s": finished - scanned - register_s,
+            "register_s": register_s,
+            "total_s": finished - started,
+        },
+    }
+
+
 def list_available_fonts() -> List[str]:
     """
     Return all font families currently visible to Qt.
+
+    Always asks Qt: fonts outside the catalogued directories (fontconfig
+    extras, bundled or embedded families) are only known there.
     """
     return _all_font_families()
 
@@ -268,7 +718,8 @@ def list_registered_fonts() -> Dict[str, List[str]]:
     """
     Return application-registered font files and their family names.
     """
-    return dict(_REGISTERED_FONT_FAMILIES)
+    with _FONT_LOCK:
+        return dict(_REGISTERED_FONT_FAMILIES)
 
 
 def list_bangla_candidate_fonts(installed_only: bool = True) -> List[str]:
@@ -280,9 +731,11 @@ def list_bangla_candidate_fonts(installed_only: bool = True) -> List[str]:
 
     found: List[str] = []
     for name in BANGLA_FONT_CANDIDATES:
-        match = _case_insensitive_family_lookup(name)
+        match = _discovery_lookup(name)
         if match:
             found.append(match)
+    if not found and get_font_catalog() is not None:
+        found = [m for m in map(_case_insensitive_family_lookup, BANGLA_FONT_CANDIDATES) if m]
 
     seen = set()
     out = []
@@ -302,64 +755,66 @@ def set_default_font(
     """
     global _DEFAULT_FONT_FAMILY, _DEFAULT_FONT_PATH
 
-    if font_path:
-        families = register_font(font_path)
-        if not families:
-            raise RuntimeError(
-                f"Font file was registered but no family names were returned: {font_path}"
-            )
+    with _FONT_LOCK:
+        if font_path:
+            families = register_font(font_path)
+            if not families:
+                raise RuntimeError(
+                    f"Font file was registered but no family names were returned: {font_path}"
+                )
+
+            if font_family:
+                match = _lookup_family(font_family)
+                if not match:
+                    raise RuntimeError(
+                        f"Requested font family '{font_family}' was not found after "
+                        f"registering '{font_path}'. Available families from this file: {families}"
+                    )
+                resolved = match
+            else:
+                resolved = families[0]
+
+            _DEFAULT_FONT_FAMILY = resolved
+            _DEFAULT_FONT_PATH = _normalize_path(font_path)
+            return resolved
 
         if font_family:
-            match = _case_insensitive_family_lookup(font_family)
+            match = _lookup_family(font_family)
             if not match:
                 raise RuntimeError(
-                    f"Requested font family '{font_family}' was not found after "
-                    f"registering '{font_path}'. Available families from this file: {families}"
+                    f"Font family '{font_family}' was not found. "
+                    "Use list_available_fonts() or register_font()."
                 )
-            resolved = match
-        else:
-            resolved = families[0]
-
-        _DEFAULT_FONT_FAMILY = resolved
-        _DEFAULT_FONT_PATH = _normalize_path(font_path)
-        return resolved
-
-    if font_family:
-        match = _case_insensitive_family_lookup(font_family)
-        if not match:
-            raise RuntimeError(
-                f"Font family '{font_family}' was not found. "
-                "Use list_available_fonts() or register_font()."
-            )
-        _DEFAULT_FONT_FAMILY = match
-        _DEFAULT_FONT_PATH = None
-        return match
+            _DEFAULT_FONT_FAMILY = match
+            _DEFAULT_FONT_PATH = None
+            return match
 
-    match = _case_insensitive_family_lookup(_DEFAULT_FONT_FAMILY)
-    if match:
-        _DEFAULT_FONT_FAMILY = match
-        return match
+        match = _lookup_family(_DEFAULT_FONT_FAMILY)
+        if match:
+            _DEFAULT_FONT_FAMILY = match
+            return match
 
-    resolved = _resolve_from_candidates()
-    if resolved:
-        _DEFAULT_FONT_FAMILY = resolved
-        _DEFAULT_FONT_PATH = None
-        return resolved
+        resolved = _resolve_from_candidates()
+        if resolved:
+            _DEFAULT_FONT_FAMILY = resolved
+            _DEFAULT_FONT_PATH = None
+            return resolved
 
-    raise RuntimeError(
-        "Could not determine a default Bengali font. "
-        "Please install or register a Bengali-capable font."
-    )
+        raise RuntimeError(
+            "Could not determine a default Bengali font. "
+            "Please install or register a Bengali-capable font."
+        )
 
 
 def get_default_font() -> Dict[str, Optional[str]]:
     """
     Return current package-wide font defaults.
     """
-    return {
-        "font_family": _DEFAULT_FONT_FAMILY,
-        "font_path": _DEFAULT_FONT_PATH,
-    }
+    with _FONT_LOCK:
+        return {
+            "font_family": _DEFAULT_FONT_FAMILY,
+            "font_path": _DEFAULT_FONT_PATH,
+        }
 
 
 def resolve_font(
@@ -379,7 +834,7 @@ def resolve_font(
             )
 
         if font_family:
-            match = _case_insensitive_family_lookup(font_family)
+            match = _lookup_family(font_family)
             if not match:
                 raise RuntimeError(
                     f"Requested family '{font_family}' not found after registering '{font_path}'. "
@@ -390,7 +845,7 @@ def resolve_font(
         return families[0]
 
     if font_family:
-        match = _case_insensitive_family_lookup(font_family)
+        match = _lookup_family(font_family)
         if match:
             return match
         raise RuntimeError(
@@ -398,14 +853,15 @@ def resolve_font(
             "Use list_available_fonts() or register_font()."
         )
 
-    match = _case_insensitive_family_lookup(_DEFAULT_FONT_FAMILY)
+    match = _lookup_family(get_default_font()["font_family"])
     if match:
         return match
 
     resolved = _resolve_from_candidates()
     if resolved:
-        _DEFAULT_FONT_FAMILY = resolved
-        _DEFAULT_FONT_PATH = None
+        with _FONT_LOCK:
+            _DEFAULT_FONT_FAMILY = resolved
+            _DEFAULT_FONT_PATH = None
         return resolved
 
     raise RuntimeError(
@@ -473,11 +929,12 @@ def validate_font(
                 f"Requested family '{font_family}' resolved to '{resolved}'."
             )
 
-    glyph_ok, render_ok, render_error = _try_render_sample(
-        family=resolved,
-        sample_text=sample_text,
-        font_size=font_size,
-    )
+    sample, cached = _validated_sample(resolved, font_path, sample_text, font_size)
+    glyph_ok = sample["glyph_metrics_nonempty"]
+    render_ok = sample["rendered_nonempty"]
+    render_error = sample["error"]
+    result.fingerprint = sample["fingerprint"] or None
+    result.cached = cached
     result.glyph_metrics_nonempty = glyph_ok
     result.rendered_nonempty = render_ok
 
@@ -501,11 +958,61 @@ def validate_font(
     return result.to_dict()
 
 
+def set_fallback_fonts(
+    families: Optional[Sequence[str]] = None,
+    enabled: bool = True,
+) -> Dict[str, Any]:
+    """
+    Configure per-codepoint font fallback for single-line rendering.
+
+    ``families`` are tried in order for characters the requested font does
+    not cover; None restores the default list (the Bengali candidates, then
+    FALLBACK_FONT_CANDIDATES). Families that are not installed are skipped.
+    """
+    global _FALLBACK_FAMILIES, _FALLBACK_ENABLED
+
+    with _FONT_LOCK:
+        _FALLBACK_FAMILIES = [str(f) for f in families] if families is not None else None
+        _FALLBACK_ENABLED = bool(enabled)
+
+    from .coverage import clear_coverage_index
+    from .renderer import clear_render_cache
+
+    clear_coverage_index()
+    clear_render_cache()
+    return get_fallback_fonts()
+
+
+def get_fallback_fonts() -> Dict[str, Any]:
+    """
+    Return the fallback settings: ``enabled`` and the ordered ``families``.
+    """
+    with _FONT_LOCK:
+        families = _FALLBACK_FAMILIES
+        if families is None:
+            families = list(BANGLA_FONT_CANDIDATES) + list(FALLBACK_FONT_CANDIDATES)
+        return {
+            "enabled": _FALLBACK_ENABLED,
+            "families": list(families),
+        }
+
+
 def find_best_bangla_font() -> Optional[str]:
     """
     Return the first installed Bengali candidate font, or None if not found.
+
+    When no candidate is installed, any catalogued family whose cmap covers
+    the Bengali letters is returned instead.
     """
-    return _resolve_from_candidates()
+    match = _resolve_from_candidates()
+    if match:
+        return match
+    catalog = get_font_catalog()
+    if catalog is not None:
+        covering = catalog.bengali_families()
+        if covering:
+            return covering[0]
+    return None
 
 
 def ensure_default_font() -> str:
@@ -523,6 +1030,13 @@ def font_info(
     Resolve a font and return a concise info dictionary.
     """
     resolved = resolve_font(font_family=font_family, font_path=font_path)
+    fingerprint = _family_fingerprint(resolved, font_path)
+    with _FONT_LOCK:
+        _load_validation_store()
+        validations = [
+            dict(e) for (fam, fp, _t, _s), e in _VALIDATION_CACHE.items()
+            if fam == resolved and fp == fingerprint
+        ]
     return {
         "requested_family": font_family,
         "requested_path": _normalize_path(font_path) if font_path else None,
@@ -530,12 +1044,62 @@ def font_info(
         "default_font_family": _DEFAULT_FONT_FAMILY,
         "default_font_path": _DEFAULT_FONT_PATH,
         "is_default": resolved == _DEFAULT_FONT_FAMILY,
+        "fingerprint": fingerprint or None,
+        "validation": validations,
     }
 
 
+def set_font_validation_cache(persist: bool = False, path: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Keep memoized validate_font() results on disk as well (``persist``),
+    in ``path`` or font_validation.json in the bangla_render cache dir.
+    Only results for fonts with a known file fingerprint are written.
+    """
+    global _VALIDATION_PERSIST_PATH, _VALIDATION_LOADED
+
+    with _FONT_LOCK:
+        if persist:
+            _VALIDATION_PERSIST_PATH = _normalize_path(path) if path else os.path.join(
+                font_cache_dir(), "font_validation.json"
+            )
+        else:
+            _VALIDATION_PERSIST_PATH = None
+        _VALIDATION_LOADED = False
+        _load_validation_store()
+    _save_validation_store()
+    return get_font_validation_cache_info()
+
+
+def clear_font_validation_cache(font_family: Optional[str] = None) -> int:
+    """
+    Forget memoized validation results (all, or those of one family),
+    including the persisted copies. Returns the number removed.
+    """
+    with _FONT_LOCK:
+        _load_validation_store()
+        if font_family is None:
+            keys = list(_VALIDATION_CACHE)
+        else:
+            want = str(font_family).strip().lower()
+            keys = [k for k in _VALIDATION_CACHE if k[0].lower() == want]
+        for key in keys:
+            del _VALIDATION_CACHE[key]
+    _save_validation_store()
+    return len(keys)
+
+
+def get_font_validation_cache_info() -> Dict[str, Any]:
+    with _FONT_LOCK:
+        return {
+            "size": len(_VALIDATION_CACHE),
+            "persist_path": _VALIDATION_PERSIST_PATH,
+        }
+
+
 __all__ = [
     "register_font",
     "register_fonts",
+    "register_font_directory",
     "list_available_fonts",
     "list_registered_fonts",
     "list_bangla_candidate_fonts",
@@ -546,4 +1110,11 @@ __all__ = [
     "find_best_bangla_font",
     "ensure_default_font",
     "font_info",
+    "get_font_pool_info",
+    "clear_font_pool",
+    "set_fallback_fonts",
+    "get_fallback_fonts",
+    "set_font_validation_cache",
+    "clear_font_validation_cache",
+    "get_font_validation_cache_info",
 ]
\ No newline at end of file
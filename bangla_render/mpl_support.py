@@ -1,9 +1,11 @@
 # bangla_render/mpl_support.py
 from __future__ import annotations
 
-from typing import Optional, Sequence, Tuple
+from functools import lru_cache
+from typing import Any, Optional, Sequence, Tuple
 
 import numpy as np
+from matplotlib.colors import ListedColormap, Normalize
 from matplotlib.lines import Line2D
 from matplotlib.offsetbox import (
     AnnotationBbox,
@@ -16,7 +18,13 @@ from matplotlib.offsetbox import (
 from matplotlib.patches import Patch, Rectangle
 
 from .layout import get_layout_manager
-from .renderer import render_paragraph_qimage, render_text_qimage
+from .renderer import (
+    _canonical_color,
+    _color_rgba,
+    get_render_defaults,
+    render_paragraph_qimage,
+    render_text_array,
+)
 
 
 try:
@@ -47,6 +55,127 @@ def to_bangla_numerals(value):
     return str(value).translate(_BANGLA_DIGITS)
 
 
+_DIGIT_GROUPINGS = ("thousands", "lakh")
+
+
+def _group_integer_digits(int_part: np.ndarray, grouping: str) -> np.ndarray:
+    """
+    Insert grouping commas into an array of unsigned digit strings.
+
+    "thousands" groups as 1,234,567 and "lakh" as 12,34,567 (the
+    South Asian lakh/crore convention). The work is done column-wise on a
+    right-aligned character matrix, so there is no per-element Python loop.
+    """
+    if int_part.size == 0:
+        return int_part
+
+    width = int(np.char.str_len(int_part).max())
+    if width <= 3:
+        return int_part
+
+    padded = np.char.rjust(int_part, width).astype(f"U{width}")
+    chars = np.ascontiguousarray(padded).view("U1").reshape(-1, width)
+
+    if grouping == "thousands":
+        boundaries = set(range(3, width, 3))
+    else:
+        boundaries = set(range(3, width, 2))
+
+    columns = []
+    for col in range(width):
+        if col > 0 and (width - col) in boundaries:
+            # A pad space on the left means the number is too short for
+            # this separator; leave a space there and strip it afterwards.
+            columns.append(np.where(chars[:, col - 1] != " ", ",", " "))
+        columns.append(chars[:, col])
+
+    joined = np.ascontiguousarray(np.stack(columns, axis=1).astype("U1"))
+    grouped = joined.view(f"U{len(columns)}").reshape(int_part.shape)
+    return np.char.lstrip(grouped, " ")
+
+
+def format_bangla_numbers(
+    values,
+    decimals: Optional[int] = None,
+    percent: bool = False,
+    grouping: Optional[str] = None,
+    return_inverse: bool = False,
+):
+    """
+    Format a whole array of numbers as Bengali-numeral strings.
+
+    Parameters
+    ----------
+    values:
+        Anything NumPy can turn into an array (lists, ndarrays, pandas
+        Series/DataFrame values). The result keeps its shape.
+    decimals:
+        Fixed number of decimal places. If None, values are formatted like
+        ``str(value)`` (or with 0 decimals when ``percent=True``).
+    percent:
+        Multiply by 100 and append "%".
+    grouping:
+        None, "thousands" (১,২৩৪,৫৬৭) or "lakh" (১২,৩৪,৫৬৭).
+    return_inverse:
+        If True, return ``(labels, inverse)`` where ``labels`` holds each
+        distinct formatted string once and ``labels[inverse]`` rebuilds the
+        full array. Only ``labels`` needs to go through the renderer.
+
+    Notes
+    -----
+    Repeated values are formatted once: the array is reduced with
+    ``np.unique`` first and all string work runs on the unique values with
+    ``np.char`` operations.
+    """
+    if grouping is not None and grouping not in _DIGIT_GROUPINGS:
+        raise ValueError(f"grouping must be None or one of {_DIGIT_GROUPINGS}")
+
+    arr = np.asarray(values)
+    if percent or decimals is not None:
+        arr = arr.astype(float)
+    elif grouping is not None and arr.dtype.kind not in "iuf":
+        arr = arr.astype(float)
+
+    uniq, inverse = np.unique(arr.ravel(), return_inverse=True)
+
+    if percent:
+        uniq = uniq * 100.0
+        if decimals is None:
+            decimals = 0
+
+    if decimals is not None:
+        strs = np.char.mod(f"%.{int(decimals)}f", uniq)
+    else:
+        strs = uniq.astype(str)
+
+    if grouping is not None and strs.size:
+        negative = np.char.startswith(strs, "-")
+        body = np.char.lstrip(strs, "-")
+        parts = np.char.partition(body, ".")
+        int_part = parts[:, 0]
+        rest = np.char.add(parts[:, 1], parts[:, 2])
+
+        digits_only = np.char.isdigit(int_part)
+        if digits_only.any():
+            grouped = _group_integer_digits(int_part[digits_only], grouping)
+            width = max(grouped.dtype.itemsize, int_part.dtype.itemsize) // 4
+            int_part = int_part.astype(f"U{width}")
+            int_part[digits_only] = grouped
+
+        strs = np.char.add(np.where(negative, "-", ""), np.char.add(int_part, rest))
+
+    if percent:
+        strs = np.char.add(strs, "%")
+
+    strs = np.char.translate(strs, _BANGLA_DIGITS)
+
+    if return_inverse:
+        labels, label_inverse = np.unique(strs, return_inverse=True)
+        return labels, label_inverse[inverse].reshape(arr.shape)
+
+    return strs[inverse].reshape(arr.shape)
+
+
 def _qimage_to_rgba_array(qimg: QImage) -> np.ndarray:
     """
     Convert a QImage to an RGBA numpy array in [0, 1].
@@ -110,6 +239,32 @@ def _default_zoom_for_fontsize(font_size: float) -> float:
     return 0.35 * (font_size / 24.0)
 
 
+@lru_cache(maxsize=64)
+def _text_colormap(rgba: Tuple[int, int, int, int]) -> ListedColormap:
+    colors = np.empty((256, 4))
+    colors[:, :3] = np.array(rgba[:3]) / 255.0
+    colors[:, 3] = np.arange(256) / 255.0 * (rgba[3] / 255.0)
+    return ListedColormap(colors, name="bangla_text")
+
+
+def text_colormap(color: Any = None) -> ListedColormap:
+    """
+    Colormap that paints a ``mode="alpha"`` coverage mask as ``color``
+    ink (default: the render default colour): entry i is the colour at
+    coverage i / 255. Use it with
+    ``norm=Normalize(0, 255)`` (or ``vmin=0, vmax=255``):
+
+        mask = br.render_text_array("বাংলা", mode="alpha")
+        ax.imshow(mask, cmap=br.text_colormap("navy"), vmin=0, vmax=255)
+    """
+    if color is None:
+        color = get_render_defaults()["color"]
+    return _text_colormap(_color_rgba(_canonical_color(color)))
+
+
+_MASK_NORM = Normalize(vmin=0, vmax=255)
+
+
 def _build_offset_image(
     text: str,
     font_size: int,
@@ -122,7 +277,11 @@ def _build_offset_image(
     zoom: Optional[float] = None,
     rotate_90: bool = False,
 ):
-    qimg = render_text_qimage(
+    # Ink on a transparent background is rendered as a uint8 coverage mask
+    # (shared by every colour in the cache) and coloured by Matplotlib
+    # at draw time, instead of converting RGBA to float64.
+    alpha_only = _canonical_color(bg, background=True) == "transparent"
+    rgba = render_text_array(
         text=text,
         font_family=font_family,
         font_path=font_path,
@@ -131,8 +290,9 @@ def _build_offset_image(
         bg=bg,
         padding=padding,
         scale=scale,
+        mode="alpha" if alpha_only else "rgba",
     )
-    img = _qimage_to_rgba_array(qimg)
+    img = rgba if alpha_only else rgba / 255.0
 
     if rotate_90:
         img = np.rot90(img, k=1)
@@ -140,8 +300,11 @@ def _build_offset_image(
     if zoom is None:
         zoom = _default_zoom_for_fontsize(font_size)
 
-    oi = OffsetImage(img, zoom=zoom)
-    return qimg, img, oi
+    if alpha_only:
+        oi = OffsetImage(img, zoom=zoom, cmap=text_colormap(color), norm=_MASK_NORM)
+    else:
+        oi = OffsetImage(img, zoom=zoom)
+    return rgba, img, oi
 
 
 def _build_paragraph_offset_image(
@@ -0,0 +1,232 @@
+# bangla_render/pool.py
+from __future__ import annotations
+
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+
+@dataclass
+class FigureJob:
+    """
+    One unit of work for a ``FigurePool``.
+
+    ``func(*args, **kwargs)`` runs inside a worker. If it returns a
+    Matplotlib figure and ``output_path`` is set, the figure is saved
+    there (with ``savefig_kwargs``) and closed, and the path is returned;
+    otherwise the function's (picklable) return value comes back.
+
+    ``func`` must be picklable, i.e. a module-level function, so that the
+    job also works with the "spawn" start method.
+    """
+    func: Callable[..., Any]
+    args: Tuple[Any, ...] = ()
+    kwargs: Dict[str, Any] = field(default_factory=dict)
+    output_path: Optional[str] = None
+    savefig_kwargs: Dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class FigureResult:
+    index: int
+    ok: bool
+    value: Any = None
+    output_path: Optional[str] = None
+    error: Optional[str] = None
+    worker_pid: Optional[int] = None
+
+
+# ---------------------------------------------------------------------
+# Worker side
+# ---------------------------------------------------------------------
+
+def _init_worker(
+    font_paths: Sequence[str],
+    default_font: Optional[str],
+    cache_maxsize: Optional[int],
+) -> None:
+    """
+    Per-process initializer: select a non-interactive Matplotlib backend,
+    create the Qt application and register fonts once per worker.
+    """
+    import matplotlib
+    matplotlib.use("Agg", force=True)
+
+    from .backend import init_renderer
+    from .fonts import register_fonts, set_default_font
+    from .renderer import set_render_cache_maxsize
+
+    init_renderer(headless=True)
+
+    if font_paths:
+        register_fonts(list(font_paths))
+    if default_font:
+        set_default_font(font_family=default_font)
+    if cache_maxsize:
+        set_render_cache_maxsize(cache_maxsize)
+
+
+def _run_job(index: int, job: FigureJob) -> FigureResult:
+    try:
+        value = job.func(*job.args, **job.kwargs)
+
+        if job.output_path and hasattr(value, "savefig"):
+            import matplotlib.pyplot as plt
+
+            value.savefig(job.output_path, **job.savefig_kwargs)
+            plt.close(value)
+            return FigureResult(
+                index=index,
+                ok=True,
+                output_path=job.output_path,
+                worker_pid=os.getpid(),
+            )
+
+        return FigureResult(
+            index=index,
+            ok=True,
+            value=value,
+            output_path=job.output_path,
+            worker_pid=os.getpid(),
+        )
+    except Exception as e:
+        return FigureResult(
+            index=index,
+            ok=False,
+            error=f"{type(e).__name__}: {e}",
+            worker_pid=os.getpid(),
+        )
+
+
+# ---------------------------------------------------------------------
+# Public API
+# ---------------------------------------------------------------------
+
+def _parent_has_qt_app() -> bool:
+    from .backend import _existing_app
+
+    return _existing_app() is not None
+
+
+def _as_job(item: Any) -> FigureJob:
+    if isinstance(item, FigureJob):
+        return item
+    if isinstance(item, dict):
+        return FigureJob(**item)
+    if callable(item):
+        return FigureJob(func=item)
+    raise TypeError(
+        "Jobs must be FigureJob instances, dicts of FigureJob fields, or callables."
+    )
+
+
+class FigurePool:
+    """
+    Process pool for batch figure generation with pre-initialized workers.
+
+    Each worker process runs ``init_renderer(headless=True)``, registers
+    ``font_paths`` and sets ``default_font`` exactly once, then keeps its
+    Qt application, fonts and render cache warm across all the jobs it
+    receives.
+
+    Works with the "fork", "forkserver" and "spawn" start methods; pass
+    ``start_method`` to choose one explicitly. A Qt application does not
+    survive ``fork()``, so when the parent process has already created one
+    and no method is given, "spawn" is used.
+
+    Usage:
+
+        with FigurePool(processes=4, font_paths=["fonts/Kalpurush.ttf"]) as pool:
+            for res in pool.imap(jobs):
+                print(res.index, res.output_path)
+    """
+
+    def __init__(
+        self,
+        processes: Optional[int] = None,
+        font_paths: Sequence[str] = (),
+        default_font: Optional[str] = None,
+        start_method: Optional[str] = None,
+        cache_maxsize: Optional[int] = None,
+    ):
+        if start_method is None and _parent_has_qt_app():
+            start_method = "spawn"
+        ctx = multiprocessing.get_context(start_method) if start_method else None
+        self.processes = int(processes) if processes else (os.cpu_count() or 1)
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.processes,
+            mp_context=ctx,
+            initializer=_init_worker,
+            initargs=(
+                [os.path.abspath(os.path.expanduser(p)) for p in font_paths],
+                default_font,
+                cache_maxsize,
+            ),
+        )
+
+    def imap_unordered(self, jobs: Sequence[Any]) -> Iterator[FigureResult]:
+        """
+        Yield results as soon as each job finishes.
+        """
+        futures = [
+            self._executor.submit(_run_job, i, _as_job(job))
+            for i, job in enumerate(jobs)
+        ]
+        for fut in as_completed(futures):
+            yield fut.result()
+
+    def imap(self, jobs: Sequence[Any]) -> Iterator[FigureResult]:
+        """
+        Yield results in job order, streaming as the next one is ready.
+        """
+        futures = [
+            self._executor.submit(_run_job, i, _as_job(job))
+            for i, job in enumerate(jobs)
+        ]
+        for fut in futures:
+            yield fut.result()
+
+    def map(self, jobs: Sequence[Any]) -> List[FigureResult]:
+        return list(self.imap(jobs))
+
+    def shutdown(self, wait: bool = True) -> None:
+        self._executor.shutdown(wait=wait)
+
+    def __enter__(self) -> "FigurePool":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.shutdown(wait=True)
+
+
+def render_figures(
+    jobs: Sequence[Any],
+    processes: Optional[int] = None,
+    font_paths: Sequence[str] = (),
+    default_font: Optional[str] = None,
+    start_method: Optional[str] = None,
+    ordered: bool = False,
+) -> Iterator[FigureResult]:
+    """
+    One-shot helper: run ``jobs`` on a temporary ``FigurePool`` and stream
+    back ``FigureResult`` objects (completion order unless ``ordered``).
+    """
+    with FigurePool(
+        processes=processes,
+        font_paths=font_paths,
+        default_font=default_font,
+        start_method=start_method,
+    ) as pool:
+        results = pool.imap(jobs) if ordered else pool.imap_unordered(jobs)
+        for res in results:
+            yield res
+
+
+__all__ = [
+    "FigureJob",
+    "FigureResult",
+    "FigurePool",
+    "render_figures",
+]
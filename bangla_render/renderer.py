@@ -1,17 +1,25 @@
 # bangla_render/renderer.py
 from __future__ import annotations
 
+import math
+import re
+import sys
+import threading
+import unicodedata
 from collections import OrderedDict
-from dataclasses import dataclass, asdict
-from typing import Any, Dict, Optional, Tuple
+from dataclasses import dataclass, asdict, field, replace
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 import numpy as np
 
 from .backend import ensure_qt_application
-from .fonts import resolve_font
+from .cold_cache import ColdTier
+from .engines import RenderEngine, active_render_engine_name, get_render_engine, parse_color
+from .fonts import pooled_font, pooled_font_metrics
 
 try:
-    from PySide6.QtCore import Qt, QRect, QRectF
+    from PySide6.QtCore import Qt, QPointF, QRect, QRectF, QTextBoundaryFinder
     from PySide6.QtGui import (
         QColor,
         QFont,
@@ -19,21 +27,23 @@ try:
         QImage,
         QPainter,
         QPen,
-        QTextOption,
+        QTextLayout,
     )
     QT_RENDER_AVAILABLE = True
     QT_RENDER_IMPORT_ERROR = None
 except Exception as e:  # pragma: no cover
     Qt = None
+    QPointF = None
     QRect = None
     QRectF = None
+    QTextBoundaryFinder = None
     QColor = None
     QFont = None
     QFontMetrics = None
     QImage = None
     QPainter = None
     QPen = None
-    QTextOption = None
+    QTextLayout = None
     QT_RENDER_AVAILABLE = False
     QT_RENDER_IMPORT_ERROR = e
 
@@ -43,7 +53,48 @@ except Exception as e:  # pragma: no cover
 # ---------------------------------------------------------------------
 
 _RENDER_CACHE_MAXSIZE = 256
-_RENDER_CACHE: "OrderedDict[Tuple[Any, ...], QImage]" = OrderedDict()
+# Values are QImages for the Qt backend and RGBA arrays for the others.
+# Every key starts with its kind: the engine name for single-line images,
+# "paragraph" for paragraphs.
+_RENDER_CACHE: "OrderedDict[Tuple[Any, ...], Any]" = OrderedDict()
+
+# Canonical cache key -> the distinct raw (text, size, colour, bg, scale)
+# spellings that resolved to it; everything past the first spelling is a
+# duplicate entry the raw keys would have created. Guarded by _CACHE_LOCK
+# and evicted together with _RENDER_CACHE.
+_KEY_SPELLINGS: Dict[Tuple[Any, ...], set] = {}
+
+# Guards _RENDER_CACHE and _RENDER_DEFAULTS. Painting itself runs outside
+# any lock: QImage/QPainter rendering is safe off the GUI thread as long
+# as each thread uses its own QImage, QPainter and QFont objects.
+_CACHE_LOCK = threading.RLock()
+
+# Guards the paragraph caches below. QTextLayout objects are shared
+# between threads through the cache, so shaping and line breaking happen
+# under this lock; drawing only uses the extracted glyph runs.
+_LAYOUT_LOCK = threading.RLock()
+
+# Paragraphs are shaped once per (text, family, pixel size) into a single
+# unwrapped QTextLayout line per hard paragraph. Line breaking then only
+# picks break opportunities from the shaped advances and is cached per
+# (text, family, pixel size, inner width), so a width change re-wraps
+# without shaping again.
+_SHAPED_PARAGRAPH_CACHE_MAXSIZE = 64
+_SHAPED_PARAGRAPH_CACHE: "OrderedDict[Tuple[str, str, int], List[ShapedParagraph]]" = OrderedDict()
+
+_PARAGRAPH_LAYOUT_CACHE_MAXSIZE = 128
+_PARAGRAPH_LAYOUT_CACHE: "OrderedDict[Tuple[Any, ...], ParagraphLayout]" = OrderedDict()
+
+# Compressed second tier (see cold_cache.py): images evicted from the hot
+# LRU are demoted here and promoted back on their next hit, so a few MB
+# keep tens of thousands of labels resident. Off (None) until enabled with
+# set_render_cache_cold_tier(); _COLD_CACHE_DEFAULT_MB is its default size.
+_COLD_CACHE_DEFAULT_MB = 32
+_COLD_RENDER_CACHE: Optional[ColdTier] = None
+
+# Optional cross-process tier (see shm_cache.py): consulted when the
+# in-process LRU misses and filled after every fresh single-line render.
+_SHARED_RENDER_CACHE = None
 
 _RENDER_DEFAULTS: Dict[str, Any] = {
     "color": "black",
@@ -70,6 +121,41 @@ class RenderParams:
         return asdict(self)
 
 
+@dataclass
+class ShapedParagraph:
+    """
+    One hard paragraph shaped as a single unwrapped line.
+
+    ``breaks`` are the Unicode line-break opportunities (character offsets)
+    and ``xs`` the pen position at each offset, so wrapping needs no
+    further shaping.
+    """
+    text: str
+    layout: Any
+    breaks: List[int]
+    xs: List[float]
+    height: float
+
+
+@dataclass
+class ParagraphLine:
+    paragraph: ShapedParagraph
+    start: int
+    length: int
+    x_start: float
+    y: float
+    width: float
+    glyph_runs: List[Any] = field(default_factory=list)
+
+
+@dataclass
+class ParagraphLayout:
+    lines: List[ParagraphLine]
+    text_width: float
+    text_height: float
+    ink_rect: Optional[Tuple[float, float, float, float]]
+
+
 # ---------------------------------------------------------------------
 # Core helpers
 # ---------------------------------------------------------------------
@@ -102,11 +188,19 @@ def _normalize_bg(bg: str) -> Optional[QColor]:
     return qc
 
 
+def _scaled_pixel_size(font_size: int, scale: float = 1.0) -> int:
+    return max(1, int(round(font_size * scale)))
+
+
 def _font_for_render(font_family: str, font_size: int, scale: float = 1.0) -> QFont:
-    scaled_size = max(1, int(round(font_size * scale)))
-    font = QFont(font_family)
-    font.setPixelSize(scaled_size)
-    return font
+    """
+    Pooled QFont for rendering; callers must not mutate it.
+    """
+    return pooled_font(font_family, _scaled_pixel_size(font_size, scale))
+
+
+def _metrics_for_render(font_family: str, font_size: int, scale: float = 1.0) -> QFontMetrics:
+    return pooled_font_metrics(font_family, _scaled_pixel_size(font_size, scale))
 
 
 def _trim_rgba_alpha_bounds(alpha: np.ndarray, threshold: int = 0) -> Optional[Tuple[int, int, int, int]]:
@@ -141,20 +235,35 @@ def _rgba_uint8_to_qimage(arr: np.ndarray) -> QImage:
     qimg = QImage(arr.data, w, h, 4 * w, QImage.Format.Format_RGBA8888)
     return qimg.copy()
 
-def _trim_transparent_borders(
-    qimg: QImage,
-    *,
+
+def _qimage_to_alpha_uint8(qimg: QImage) -> np.ndarray:
+    if qimg.format() != QImage.Format.Format_Alpha8:
+        qimg = qimg.convertToFormat(QImage.Format.Format_Alpha8)
+    w, h, bpl = qimg.width(), qimg.height(), qimg.bytesPerLine()
+    rows = np.frombuffer(qimg.constBits(), np.uint8, count=h * bpl).reshape((h, bpl))
+    return rows[:, :w].copy()
+
+
+def _alpha_uint8_to_qimage(alpha: np.ndarray) -> QImage:
+    alpha = np.ascontiguousarray(alpha)
+    h, w = alpha.shape
+    return QImage(alpha.data, w, h, w, QImage.Format.Format_Alpha8).copy()
+
+def _trim_rgba_array(
+    arr: np.ndarray,
     margin_px: int = 1,
     alpha_threshold: int = 0,
-) -> QImage:
+) -> np.ndarray:
     """
-    Trim fully transparent borders and keep a small safety margin.
+    Crop an (H, W, 4) uint8 array (or an (H, W) alpha mask) to its
+    non-transparent content plus a margin. Fully transparent images are
+    returned unchanged.
     """
-    arr = _qimage_to_rgba_uint8(qimg)
-    bounds = _trim_rgba_alpha_bounds(arr[:, :, 3], threshold=alpha_threshold)
+    alpha = arr if arr.ndim == 2 else arr[:, :, 3]
+    bounds = _trim_rgba_alpha_bounds(alpha, threshold=alpha_threshold)
 
     if bounds is None:
-        return qimg
+        return arr
 
     top, bottom, left, right = bounds
 
@@ -163,54 +272,628 @@ def _trim_transparent_borders(
     left = max(0, left - margin_px)
     right = min(arr.shape[1], right + margin_px)
 
-    cropped = np.ascontiguousarray(arr[top:bottom, left:right, :])
+    cropped = np.ascontiguousarray(arr[top:bottom, left:right])
     if cropped.size == 0:
+        return arr
+    return cropped
+
+
+def _trim_transparent_borders(
+    qimg: QImage,
+    *,
+    margin_px: int = 1,
+    alpha_threshold: int = 0,
+) -> QImage:
+    """
+    Trim fully transparent borders and keep a small safety margin.
+    """
+    arr = _qimage_to_rgba_uint8(qimg)
+    cropped = _trim_rgba_array(arr, margin_px=margin_px, alpha_threshold=alpha_threshold)
+    if cropped is arr:
         return qimg
     return _rgba_uint8_to_qimage(cropped)
 
 
+# ---------------------------------------------------------------------
+# Cache-key canonicalization
+# ---------------------------------------------------------------------
+
+# ত + ্ + ZWJ is the pre-Unicode-4.1 spelling of khanda ta (ৎ). Before a
+# consonant the ZWJ instead asks for a half form, which is a different
+# glyph, so only the word-final / pre-vowel spelling is folded.
+_KHANDA_TA_RE = re.compile("\u09a4\u09cd\u200d(?![\u0995-\u09b9\u09dc-\u09df])")
+
+
+def _canonical_text(text: str) -> str:
+    """
+    NFC text with legacy Bengali spellings folded, so strings that shape
+    to the same glyphs share one cache entry.
+
+    NFC already maps precomposed য় / ড় / ঢ় (composition exclusions) to base
+    plus nukta and composes the two-part vowels ো / ৌ.
+    """
+    if text.isascii():
+        return text
+    if not unicodedata.is_normalized("NFC", text):
+        text = unicodedata.normalize("NFC", text)
+    if "\u200d" in text:
+        text = _KHANDA_TA_RE.sub("\u09ce", text)
+    return text
+
+
+def _color_string_rgba(color: str) -> Optional[Tuple[int, int, int, int]]:
+    s = color.strip()
+    if QColor is not None:
+        qc = QColor(s)
+        if qc.isValid():
+            return tuple(qc.getRgb())
+    rgba = parse_color(s)
+    if rgba is not None:
+        return rgba
+    # matplotlib shorthands QColor does not know: "k", "C0", "0.5", "none"
+    try:
+        from matplotlib.colors import to_rgba
+
+        return tuple(int(round(c * 255)) for c in to_rgba(s))
+    except Exception:
+        return None
+
+
+def _color_rgba(color: Any) -> Optional[Tuple[int, int, int, int]]:
+    """
+    0..255 RGBA of a colour name / hex string / matplotlib colour, or of a
+    3- or 4-sequence (0..1 floats, or 0..255 ints when any value exceeds
+    1); None when it is not a colour.
+    """
+    if isinstance(color, (tuple, list, np.ndarray)):
+        try:
+            vals = [float(v) for v in color]
+        except (TypeError, ValueError):
+            return None
+        if len(vals) not in (3, 4):
+            return None
+        if len(vals) == 3:
+            vals.append(255.0 if any(v > 1 for v in vals) else 1.0)
+        if not any(v > 1 for v in vals):
+            vals = [v * 255 for v in vals]
+        return tuple(min(255, max(0, int(round(v)))) for v in vals)
+    return _color_string_rgba(str(color))
+
+
+def _canonical_color(color: Any, background: bool = False) -> str:
+    """
+    Canonical "#aarrggbb" spelling of ``color`` (QColor parses it back).
+
+    Invalid foregrounds become opaque black, as QColor fallback always did;
+    invalid or fully transparent backgrounds become "transparent".
+    """
+    if isinstance(color, str):
+        return _canonical_color_string(color, background)
+    return _format_canonical_color(_color_rgba(color), background)
+
+
+@lru_cache(maxsize=512)
+def _canonical_color_string(color: str, background: bool) -> str:
+    return _format_canonical_color(_color_string_rgba(color), background)
+
+
+def _format_canonical_color(rgba: Optional[Tuple[int, int, int, int]], background: bool) -> str:
+    if rgba is None or (background and rgba[3] == 0):
+        return "transparent" if background else "#ff000000"
+    r, g, b, a = rgba
+    return f"#{a:02x}{r:02x}{g:02x}{b:02x}"
+
+
+# mode="alpha" renders coverage masks: colour and background are applied
+# at composite time, so they are replaced in the cache key by this marker
+# (never a canonical colour) and one mask serves every colour.
+_RENDER_MODES = ("rgba", "alpha")
+_ALPHA_MODE_COLOR = "alpha"
+
+
+def _check_render_mode(mode: str) -> bool:
+    """
+    Validate ``mode``; True for alpha-mask output.
+    """
+    if mode not in _RENDER_MODES:
+        raise ValueError(f"Unknown render mode {mode!r}; choose from {_RENDER_MODES}.")
+    return mode == "alpha"
+
+
+# Version of the key layouts built below (field order of _make_cache_key,
+# _text_cache_key and _paragraph_cache_key); render cache snapshots record
+# it, so bump it whenever a key gains, loses or reorders a field.
+_CACHE_KEY_LAYOUT = 2
+
+
 def _make_cache_key(params: RenderParams) -> Tuple[Any, ...]:
+    # font_size and scale only ever reach painting as one integer pixel
+    # size, so 12pt at 2x and 24pt at 1x are the same image.
     return (
         params.text,
         params.font_family,
         params.font_path,
-        params.font_size,
+        _scaled_pixel_size(params.font_size, params.scale),
         params.color,
         params.bg,
         params.padding,
-        round(float(params.scale), 4),
     )
 
 
+def _text_cache_key(
+    engine_name: str,
+    params: RenderParams,
+    trim: bool,
+    trim_margin_px: int,
+) -> Tuple[Any, ...]:
+    return (engine_name,) + _make_cache_key(params) + (bool(trim), int(trim_margin_px))
+
+
+def _cached_nbytes(value: Any) -> int:
+    if isinstance(value, np.ndarray):
+        return int(value.nbytes)
+    return int(value.sizeInBytes())
+
+
+def _single_line_cache_key(
+    engine: RenderEngine,
+    text: str,
+    font_family: Optional[str] = None,
+    font_path: Optional[str] = None,
+    font_size: int = 24,
+    color: Optional[str] = None,
+    bg: Optional[str] = None,
+    padding: Optional[int] = None,
+    scale: Optional[float] = None,
+    trim: Optional[bool] = None,
+    trim_margin_px: Optional[int] = None,
+    mode: str = "rgba",
+) -> Tuple[Any, ...]:
+    """
+    Cache key render_text_qimage() / render_text_array() use for these
+    arguments with ``engine``.
+    """
+    alpha = _check_render_mode(mode)
+    if trim is None:
+        trim = _RENDER_DEFAULTS["trim"]
+    if trim_margin_px is None:
+        trim_margin_px = _RENDER_DEFAULTS["trim_margin_px"]
+    params = _resolve_render_params(
+        text=text,
+        font_family=font_family,
+        font_path=font_path,
+        font_size=font_size,
+        color=color,
+        bg=bg,
+        padding=padding,
+        scale=scale,
+        engine=engine,
+    )
+    if alpha:
+        params = replace(params, color=_ALPHA_MODE_COLOR, bg="transparent")
+    return _text_cache_key(engine.name, params, trim, trim_margin_px)
+
+
+def _probe_render_cache(text: str, **style: Any) -> Tuple[Tuple[Any, ...], Optional[int]]:
+    """
+    Cache key of a single-line render with the active backend, and the
+    bytes its cached image occupies (None when it is not cached). Nothing
+    is rendered and the LRU order is left alone.
+    """
+    key = _single_line_cache_key(get_render_engine(), text, **style)
+    with _CACHE_LOCK:
+        cached = _RENDER_CACHE.get(key)
+    if cached is not None:
+        return key, _cached_nbytes(cached)
+    cold = _COLD_RENDER_CACHE
+    return key, (cold.nbytes(key) if cold is not None else None)
+
+
+def _key_spelling(
+    text: Any,
+    font_size: int,
+    color: Any,
+    bg: Any,
+    scale: Optional[float],
+) -> Tuple[Any, ...]:
+    """
+    The raw style fields a key was built from, before canonicalization.
+    """
+    return (
+        str(text),
+        font_size,
+        repr(_RENDER_DEFAULTS["color"] if color is None else color),
+        repr(_RENDER_DEFAULTS["bg"] if bg is None else bg),
+        _RENDER_DEFAULTS["scale"] if scale is None else scale,
+    )
+
+
+def _note_key_spelling(key: Tuple[Any, ...], spelling: Tuple[Any, ...]) -> None:
+    with _CACHE_LOCK:
+        spellings = _KEY_SPELLINGS.get(key)
+        if spellings is None:
+            _KEY_SPELLINGS[key] = {spelling}
+        elif spelling not in spellings:
+            spellings.add(spelling)
+
+
+def _peek_cached(key: Tuple[Any, ...]) -> Any:
+    # the cached value itself (promoted from the cold tier if needed);
+    # callers must not modify it
+    with _CACHE_LOCK:
+        cached = _RENDER_CACHE.get(key)
+        if cached is not None:
+            _RENDER_CACHE.move_to_end(key)
+    if cached is None:
+        cached = _promote_cold(key)
+    return cached
+
+
 def _get_cached_qimage(key: Tuple[Any, ...]) -> Optional[QImage]:
-    cached = _RENDER_CACHE.get(key)
+    cached = _peek_cached(key)
     if cached is None:
         return None
-    _RENDER_CACHE.move_to_end(key)
     return cached.copy()
 
 
 def _set_cached_qimage(key: Tuple[Any, ...], qimg: QImage) -> None:
-    _RENDER_CACHE[key] = qimg.copy()
-    _RENDER_CACHE.move_to_end(key)
+    _store_hot(key, qimg.copy())
+
+
+def _store_hot(key: Tuple[Any, ...], value: Any) -> None:
+    with _CACHE_LOCK:
+        _RENDER_CACHE[key] = value
+        _RENDER_CACHE.move_to_end(key)
+        evicted = _pop_over_capacity()
+    if evicted:
+        _demote(evicted)
+
+
+def _pop_over_capacity() -> List[Tuple[Tuple[Any, ...], Any]]:
+    # caller holds _CACHE_LOCK; demote the result after releasing it
+    evicted = []
     while len(_RENDER_CACHE) > _RENDER_CACHE_MAXSIZE:
-        _RENDER_CACHE.popitem(last=False)
+        evicted.append(_RENDER_CACHE.popitem(last=False))
+    return evicted
+
+
+def _cache_value_pixels(value: Any) -> Optional[Tuple[np.ndarray, Any]]:
+    """
+    (H, W, C) uint8 pixels of a hot cache value and how to rebuild it: the
+    QImage format, "array" for RGBA arrays or "mask" for alpha masks.
+    None for anything else.
+    """
+    if isinstance(value, np.ndarray):
+        if value.dtype != np.uint8:
+            return None
+        if value.ndim == 3 and value.shape[2] == 4:
+            return value, "array"
+        if value.ndim == 2:
+            return value[..., None], "mask"
+        return None
+    channels = value.depth() // 8
+    if channels not in (1, 4):
+        return None
+    w, h, bpl = value.width(), value.height(), value.bytesPerLine()
+    rows = np.frombuffer(value.constBits(), np.uint8, count=h * bpl).reshape((h, bpl))
+    return rows[:, :channels * w].reshape((h, w, channels)), value.format().value
+
+
+def _demote(evicted: List[Tuple[Tuple[Any, ...], Any]]) -> None:
+    cold = _COLD_RENDER_CACHE
+    dropped = []
+    for key, value in evicted:
+        packed = _cache_value_pixels(value) if cold is not None else None
+        if packed is None:
+            dropped.append(key)
+        else:
+            dropped.extend(cold.put(key, *packed))
+    if dropped:
+        with _CACHE_LOCK:
+            for key in dropped:
+                if key not in _RENDER_CACHE:
+                    _KEY_SPELLINGS.pop(key, None)
+
+
+def _promote_cold(key: Tuple[Any, ...]) -> Any:
+    cold = _COLD_RENDER_CACHE
+    if cold is None:
+        return None
+    hit = cold.pop(key)
+    if hit is None:
+        return None
+    pixels, meta = hit
+    value = _cache_value_from_pixels(pixels, meta)
+    _store_hot(key, value)
+    return value
+
+
+def _cache_value_from_pixels(pixels: np.ndarray, meta: Any) -> Any:
+    if meta == "array":
+        return pixels
+    if meta == "mask":
+        return pixels[..., 0]
+    return _qimage_from_shared(pixels, meta)
+
+
+def _in_render_cache(key: Tuple[Any, ...]) -> bool:
+    cold = _COLD_RENDER_CACHE
+    return key in _RENDER_CACHE or (cold is not None and key in cold)
 
 
 def get_render_cache_info() -> Dict[str, int]:
+    """
+    Hot LRU and cold tier occupancy, plus ``duplicates_avoided``: how many
+    extra entries the cached images would occupy if keys used the raw
+    colour / size / text spellings callers passed instead of their
+    canonical forms.
+    """
+    cold = _COLD_RENDER_CACHE
+    with _CACHE_LOCK, _LAYOUT_LOCK:
+        return {
+            "size": len(_RENDER_CACHE),
+            "maxsize": _RENDER_CACHE_MAXSIZE,
+            "bytes": sum(_cached_nbytes(v) for v in _RENDER_CACHE.values()),
+            "cold": cold.info() if cold is not None else None,
+            "duplicates_avoided": sum(
+                len(spellings) - 1
+                for key, spellings in _KEY_SPELLINGS.items()
+                if _in_render_cache(key)
+            ),
+            "paragraph_layouts": len(_PARAGRAPH_LAYOUT_CACHE),
+            "shaped_paragraphs": len(_SHAPED_PARAGRAPH_CACHE),
+        }
+
+
+def set_render_cache_cold_tier(max_mb: float = _COLD_CACHE_DEFAULT_MB, codec: str = "auto") -> Optional[Dict[str, Any]]:
+    """
+    Enable the cold render cache tier (off by default) with ``max_mb`` MB
+    of compressed data; ``max_mb=0`` disables it again. Codecs: "zlib",
+    "rle", "lz4" (needs the lz4 package) or "auto" (lz4 when installed,
+    else zlib). Entries of the previous tier are discarded.
+    """
+    global _COLD_RENDER_CACHE
+
+    tier = ColdTier(int(float(max_mb) * 1024 * 1024), codec) if max_mb > 0 else None
+    with _CACHE_LOCK:
+        previous, _COLD_RENDER_CACHE = _COLD_RENDER_CACHE, tier
+        if previous is not None:
+            for key in [k for k in _KEY_SPELLINGS if k not in _RENDER_CACHE]:
+                _KEY_SPELLINGS.pop(key)
+    return tier.info() if tier is not None else None
+
+
+def enable_shared_render_cache(
+    path: Optional[str] = None,
+    size_mb: int = 64,
+    slots: int = 8192,
+) -> Dict[str, Any]:
+    """
+    Share rendered single-line labels with every process on this host that
+    enables the cache with the same ``path`` (default: a per-user file on
+    /dev/shm). A label rendered by one process is a hit in all others.
+    """
+    global _SHARED_RENDER_CACHE
+    from .shm_cache import SharedRenderCache
+
+    cache = SharedRenderCache(path=path, size_bytes=int(size_mb) * 1024 * 1024, slots=slots)
+    with _CACHE_LOCK:
+        previous, _SHARED_RENDER_CACHE = _SHARED_RENDER_CACHE, cache
+    if previous is not None:
+        previous.close()
+    return cache.info()
+
+
+def disable_shared_render_cache() -> None:
+    global _SHARED_RENDER_CACHE
+    with _CACHE_LOCK:
+        previous, _SHARED_RENDER_CACHE = _SHARED_RENDER_CACHE, None
+    if previous is not None:
+        previous.close()
+
+
+def get_shared_render_cache_info() -> Optional[Dict[str, Any]]:
+    """
+    Per-process hit/miss/store counters and arena occupancy of the shared
+    tier, or None when it is disabled.
+    """
+    shared = _SHARED_RENDER_CACHE
+    return shared.info() if shared is not None else None
+
+
+# ---------------------------------------------------------------------
+# Snapshots
+# ---------------------------------------------------------------------
+
+def _key_font(key: Tuple[Any, ...]) -> Tuple[str, Optional[str]]:
+    """
+    (font_family, font_path) of a render cache key: every key is its kind
+    followed by _make_cache_key().
+    """
+    return key[2], key[3]
+
+
+def save_render_cache(path: str) -> Dict[str, Any]:
+    """
+    Write the in-memory render cache (hot and cold tiers, single-line and
+    paragraph images, all backends) to a snapshot file at ``path``.
+
+    The file records the library version, the cache key layout and a
+    fingerprint of every font file the entries were rendered with;
+    load_render_cache() skips entries whose font has changed since.
+    """
+    from . import __version__
+    from .cache_snapshot import encode_key, write_snapshot
+    from .fonts import _family_fingerprint
+
+    cold = _COLD_RENDER_CACHE
+    items = []
+    if cold is not None:
+        for key, pixels, meta in cold.items():
+            items.append((key, _cache_value_from_pixels(pixels, meta)))
+    with _CACHE_LOCK:
+        items.extend(_RENDER_CACHE.items())
+
+    entries = []
+    fonts: Dict[Tuple[str, Optional[str]], int] = {}
+    for key, value in items:
+        encoded = encode_key(key)
+        if encoded is None:
+            continue
+        font = fonts.setdefault(_key_font(key), len(fonts))
+        if isinstance(value, np.ndarray):
+            pixels = np.ascontiguousarray(value)
+            entries.append({
+                "key": encoded,
+                "font": font,
+                "kind": "array",
+                "fmt": 0,
+                "width": pixels.shape[1],
+                "pixels": pixels,
+            })
+        else:
+            h, bpl = value.height(), value.bytesPerLine()
+            pixels = np.frombuffer(value.constBits(), np.uint8, count=h * bpl).reshape((h, bpl))
+            entries.append({
+                "key": encoded,
+                "font": font,
+                "kind": "qimage",
+                "fmt": value.format().value,
+                "width": value.width(),
+                "pixels": pixels,
+            })
+
+    return write_snapshot(
+        path,
+        entries,
+        __version__,
+        _CACHE_KEY_LAYOUT,
+        [(family, font_path, _family_fingerprint(family, font_path)) for family, font_path in fonts],
+    )
+
+
+def load_render_cache(path: str, grow_cache: bool = False) -> Dict[str, Any]:
+    """
+    Load a snapshot written by save_render_cache() into the render cache.
+
+    Pixels are not copied: cached entries are views into a read-only
+    memory map of the file, which is unmapped once all of them have been
+    evicted or cleared (demoted entries are compressed copies). Entries already in the cache are kept, as are
+    entries whose font file no longer matches its saved fingerprint
+    (counted as ``stale`` and skipped). When the snapshot holds more
+    entries than the hot LRU, the older ones are demoted to the cold tier
+    (compressed copies); without a cold tier only the most recently used
+    are loaded, unless ``grow_cache`` enlarges the LRU to fit.
+
+    Raises ValueError for files that are not snapshots, or were written
+    by another snapshot format, cache key layout or bangla_render version.
+    """
+    global _RENDER_CACHE_MAXSIZE
+    from . import __version__
+    from .cache_snapshot import Snapshot
+    from .fonts import _family_fingerprint
+
+    snap = Snapshot(path)
+    if snap.library_version != __version__:
+        raise ValueError(
+            f"Render cache snapshot {path!r} was written by bangla_render "
+            f"{snap.library_version}; this is {__version__}."
+        )
+    if snap.key_layout != _CACHE_KEY_LAYOUT:
+        raise ValueError(
+            f"Render cache snapshot {path!r} uses cache key layout "
+            f"{snap.key_layout}; this bangla_render uses {_CACHE_KEY_LAYOUT}."
+        )
+
+    stale_fonts = {
+        i
+        for i, (family, font_path, fp) in enumerate(snap.fonts)
+        if _family_fingerprint(family, font_path) != fp
+    }
+
+    records = snap.records
+    with _CACHE_LOCK:
+        if grow_cache:
+            _RENDER_CACHE_MAXSIZE = max(_RENDER_CACHE_MAXSIZE, len(_RENDER_CACHE) + len(records))
+        dropped = 0 if _COLD_RENDER_CACHE is not None else max(0, len(records) - _RENDER_CACHE_MAXSIZE)
+
+    loaded = present = stale = 0
+    evicted = []
+    for record in records[dropped:]:
+        key = tuple(record["key"])
+        if record["font"] in stale_fonts:
+            stale += 1
+            continue
+        view = snap.view(record)
+        if record["kind"] == "qimage":
+            h, bpl = record["shape"]
+            if QImage is None:
+                raise RuntimeError(
+                    "This snapshot holds Qt images and PySide6 is not available. "
+                    f"Original import error: {QT_RENDER_IMPORT_ERROR}"
+                )
+            value = QImage(view.data, record["width"], h, bpl, QImage.Format(record["fmt"]))
+        else:
+            value = view
+        with _CACHE_LOCK:
+            if _in_render_cache(key):
+                present += 1
+                continue
+            _RENDER_CACHE[key] = value
+            _RENDER_CACHE.move_to_end(key)
+            evicted.extend(_pop_over_capacity())
+        loaded += 1
+    _demote(evicted)
+    # cached values reference the map through their views (QImage keeps
+    # its buffer alive), so it lives exactly as long as they do
+    snap.close()
+
     return {
-        "size": len(_RENDER_CACHE),
-        "maxsize": _RENDER_CACHE_MAXSIZE,
+        "path": path,
+        "entries": len(records),
+        "loaded": loaded,
+        "already_cached": present,
+        "stale": stale,
+        "dropped": dropped,
     }
 
 
+def _qimage_from_shared(view: np.ndarray, fmt: int) -> QImage:
+    h, w, c = view.shape
+    return QImage(view.data, w, h, c * w, QImage.Format(fmt)).copy()
+
+
+def _get_shared_qimage(key: Tuple[Any, ...]) -> Optional[QImage]:
+    shared = _SHARED_RENDER_CACHE
+    if shared is None:
+        return None
+    return shared.get(key, reader=_qimage_from_shared)
+
+
+def _set_shared_qimage(key: Tuple[Any, ...], qimg: QImage) -> None:
+    shared = _SHARED_RENDER_CACHE
+    if shared is None or qimg.depth() != 32:
+        return
+    w, h = qimg.width(), qimg.height()
+    pixels = np.frombuffer(qimg.constBits(), np.uint8, count=w * h * 4).reshape((h, w, 4))
+    shared.put(key, pixels, qimg.format().value)
+
+
 def clear_render_cache() -> None:
-    _RENDER_CACHE.clear()
+    with _CACHE_LOCK:
+        _RENDER_CACHE.clear()
+        _KEY_SPELLINGS.clear()
+        if _COLD_RENDER_CACHE is not None:
+            _COLD_RENDER_CACHE.clear()
+    with _LAYOUT_LOCK:
+        _PARAGRAPH_LAYOUT_CACHE.clear()
+        _SHAPED_PARAGRAPH_CACHE.clear()
 
 
 def set_render_cache_maxsize(maxsize: int) -> int:
     """
-    Set the maximum number of cached rendered text images.
+    Set the maximum number of cached rendered text images in the hot LRU
+    (the cold tier is sized by set_render_cache_cold_tier()).
     """
     global _RENDER_CACHE_MAXSIZE
 
@@ -218,12 +901,12 @@ def set_render_cache_maxsize(maxsize: int) -> int:
     if maxsize < 1:
         raise ValueError("maxsize must be at least 1")
 
-    _RENDER_CACHE_MAXSIZE = maxsize
-
-    while len(_RENDER_CACHE) > _RENDER_CACHE_MAXSIZE:
-        _RENDER_CACHE.popitem(last=False)
+    with _CACHE_LOCK:
+        _RENDER_CACHE_MAXSIZE = maxsize
+        evicted = _pop_over_capacity()
+    _demote(evicted)
 
-    return _RENDER_CACHE_MAXSIZE
+    return maxsize
 
 
 def set_render_defaults(
@@ -238,27 +921,29 @@ def set_render_defaults(
     """
     Set package-level render defaults.
     """
-    if color is not None:
-        _RENDER_DEFAULTS["color"] = str(color)
-    if bg is not None:
-        _RENDER_DEFAULTS["bg"] = str(bg)
-    if padding is not None:
-        _RENDER_DEFAULTS["padding"] = int(padding)
-    if scale is not None:
-        _RENDER_DEFAULTS["scale"] = float(scale)
-    if trim is not None:
-        _RENDER_DEFAULTS["trim"] = bool(trim)
-    if trim_margin_px is not None:
-        _RENDER_DEFAULTS["trim_margin_px"] = int(trim_margin_px)
-
-    return dict(_RENDER_DEFAULTS)
+    with _CACHE_LOCK:
+        if color is not None:
+            _RENDER_DEFAULTS["color"] = str(color)
+        if bg is not None:
+            _RENDER_DEFAULTS["bg"] = str(bg)
+        if padding is not None:
+            _RENDER_DEFAULTS["padding"] = int(padding)
+        if scale is not None:
+            _RENDER_DEFAULTS["scale"] = float(scale)
+        if trim is not None:
+            _RENDER_DEFAULTS["trim"] = bool(trim)
+        if trim_margin_px is not None:
+            _RENDER_DEFAULTS["trim_margin_px"] = int(trim_margin_px)
+
+        return dict(_RENDER_DEFAULTS)
 
 
 def get_render_defaults() -> Dict[str, Any]:
     """
     Return current render defaults.
     """
-    return dict(_RENDER_DEFAULTS)
+    with _CACHE_LOCK:
+        return dict(_RENDER_DEFAULTS)
 
 
 # ---------------------------------------------------------------------
@@ -274,67 +959,70 @@ def _resolve_render_params(
     bg: Optional[str] = None,
     padding: Optional[int] = None,
     scale: Optional[float] = None,
+    engine: Optional[RenderEngine] = None,
 ) -> RenderParams:
-    _ensure_runtime()
-
-    resolved_family = resolve_font(font_family=font_family, font_path=font_path)
+    if engine is None:
+        engine = get_render_engine()
+    resolved_family = engine.resolve_font(font_family=font_family, font_path=font_path)
 
+    defaults = get_render_defaults()
     if color is None:
-        color = _RENDER_DEFAULTS["color"]
+        color = defaults["color"]
     if bg is None:
-        bg = _RENDER_DEFAULTS["bg"]
+        bg = defaults["bg"]
     if padding is None:
-        padding = _RENDER_DEFAULTS["padding"]
+        padding = defaults["padding"]
     if scale is None:
-        scale = _RENDER_DEFAULTS["scale"]
+        scale = defaults["scale"]
 
     return RenderParams(
-        text=str(text),
+        text=_canonical_text(str(text)),
         font_family=resolved_family,
         font_path=font_path,
         font_size=int(font_size),
-        color=str(color),
-        bg=str(bg),
+        color=_canonical_color(color),
+        bg=_canonical_color(bg, background=True),
         padding=int(padding),
         scale=float(scale),
     )
 
 
-def measure_text(
-    text: str,
-    font_family: Optional[str] = None,
-    font_path: Optional[str] = None,
-    font_size: int = 24,
-    padding: Optional[int] = None,
-    scale: Optional[float] = None,
-) -> Dict[str, Any]:
-    """
-    Measure single-line text before rendering.
-    """
-    params = _resolve_render_params(
-        text=text,
-        font_family=font_family,
-        font_path=font_path,
-        font_size=font_size,
-        padding=padding,
-        scale=scale,
-    )
+def _qt_font_runs(params: RenderParams) -> List[Tuple[str, str]]:
+    return get_render_engine("qt").font_runs(params.text, params.font_family)
 
-    font = _font_for_render(params.font_family, params.font_size, params.scale)
-    fm = QFontMetrics(font)
 
+def _runs_box(params: RenderParams, runs: List[Tuple[str, str]]) -> Tuple[QRect, int, int, List[int]]:
+    """
+    Bounding rect (pen origin on the baseline), ascent and descent of text
+    drawn as consecutive font runs, plus each run's pen x.
+    """
+    rect = QRect()
+    ascent = descent = 0
+    pens: List[int] = []
+    pen = 0
+    for sub, family in runs:
+        fm = _metrics_for_render(family, params.font_size, params.scale)
+        pens.append(pen)
+        rect = rect.united(fm.boundingRect(sub).translated(pen, 0))
+        pen += fm.horizontalAdvance(sub)
+        ascent = max(ascent, fm.ascent())
+        descent = max(descent, fm.descent())
+    return rect, ascent, descent, pens
+
+
+def _measure_with_metrics(fm: QFontMetrics, params: RenderParams) -> Dict[str, Any]:
+    ascent, descent = fm.ascent(), fm.descent()
     try:
-        rect = fm.boundingRect(params.text)
+        runs = _qt_font_runs(params)
+        if len(runs) > 1:
+            rect, ascent, descent, _pens = _runs_box(params, runs)
+        else:
+            rect = fm.boundingRect(params.text)
     except Exception:
         rect = QRect(0, 0, 1, 1)
 
     text_w = max(1, rect.width())
     text_h = max(1, rect.height())
-    ascent = fm.ascent()
-    descent = fm.descent()
-
-    full_w = text_w + (2 * params.padding)
-    full_h = text_h + (2 * params.padding)
 
     return {
         "font_family": params.font_family,
@@ -342,8 +1030,8 @@ def measure_text(
         "scale": params.scale,
         "text_width_px": text_w,
         "text_height_px": text_h,
-        "image_width_px": full_w,
-        "image_height_px": full_h,
+        "image_width_px": text_w + (2 * params.padding),
+        "image_height_px": text_h + (2 * params.padding),
         "ascent_px": ascent,
         "descent_px": descent,
         "bounding_rect": {
@@ -355,68 +1043,94 @@ def measure_text(
     }
 
 
-# ---------------------------------------------------------------------
-# Single-line render
-# ---------------------------------------------------------------------
-
-def render_text_qimage(
+def measure_text(
     text: str,
     font_family: Optional[str] = None,
     font_path: Optional[str] = None,
     font_size: int = 24,
-    color: Optional[str] = None,
-    bg: Optional[str] = None,
     padding: Optional[int] = None,
     scale: Optional[float] = None,
-    trim: Optional[bool] = None,
-    trim_margin_px: Optional[int] = None,
-) -> QImage:
+) -> Dict[str, Any]:
     """
-    Render a single-line Bengali text string to a QImage.
-
-    Important improvement:
-    - trims transparent borders after render, so layout boxes track visible text
-      more closely and title/suptitle spacing becomes more natural.
+    Measure single-line text before rendering.
     """
-    if trim is None:
-        trim = _RENDER_DEFAULTS["trim"]
-    if trim_margin_px is None:
-        trim_margin_px = _RENDER_DEFAULTS["trim_margin_px"]
-
+    engine = get_render_engine()
     params = _resolve_render_params(
         text=text,
         font_family=font_family,
         font_path=font_path,
         font_size=font_size,
-        color=color,
-        bg=bg,
         padding=padding,
         scale=scale,
+        engine=engine,
     )
 
-    key = _make_cache_key(params) + (bool(trim), int(trim_margin_px))
-    cached = _get_cached_qimage(key)
-    if cached is not None:
-        return cached
-
-    font = _font_for_render(params.font_family, params.font_size, params.scale)
-    fm = QFontMetrics(font)
+    if engine.name != "qt":
+        return engine.metrics(params)
+    fm = _metrics_for_render(params.font_family, params.font_size, params.scale)
+    return _measure_with_metrics(fm, params)
 
-    rect = fm.boundingRect(params.text)
-    text_w = max(1, rect.width())
-    text_h = max(1, rect.height())
 
-    img_w = max(1, text_w + (2 * params.padding))
-    img_h = max(1, text_h + (2 * params.padding))
+def measure_texts(
+    texts: Sequence[str],
+    font_family: Optional[str] = None,
+    font_path: Optional[str] = None,
+    font_size: int = 24,
+    padding: Optional[int] = None,
+    scale: Optional[float] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Measure many single-line strings with the same style.
 
-    qimg = QImage(img_w, img_h, QImage.Format.Format_ARGB32)
+    The font is resolved once and one pooled QFontMetrics is reused for
+    every string, so this is much cheaper than calling measure_text() in
+    a loop.
+    """
+    texts = list(texts)
+    engine = get_render_engine()
+    base = _resolve_render_params(
+        text="",
+        font_family=font_family,
+        font_path=font_path,
+        font_size=font_size,
+        padding=padding,
+        scale=scale,
+        engine=engine,
+    )
+    if engine.name != "qt":
+        return [engine.metrics(replace(base, text=_canonical_text(str(t)))) for t in texts]
+    fm = _metrics_for_render(base.font_family, base.font_size, base.scale)
+    return [_measure_with_metrics(fm, replace(base, text=_canonical_text(str(t)))) for t in texts]
+
+
+# ---------------------------------------------------------------------
+# Single-line render
+# ---------------------------------------------------------------------
+
+def _paint_text_qimage(params: RenderParams) -> QImage:
+    """
+    Paint ``params.text`` with Qt into an untrimmed ARGB32 QImage.
+    """
+    runs = _qt_font_runs(params)
+    if len(runs) > 1:
+        rect, _ascent, _descent, pens = _runs_box(params, runs)
+    else:
+        fm = _metrics_for_render(params.font_family, params.font_size, params.scale)
+        rect = fm.boundingRect(params.text)
+        runs, pens = [(params.text, params.font_family)], [0]
+    text_w = max(1, rect.width())
+    text_h = max(1, rect.height())
+
+    img_w = max(1, text_w + (2 * params.padding))
+    img_h = max(1, text_h + (2 * params.padding))
+
+    qimg = QImage(img_w, img_h, QImage.Format.Format_ARGB32)
     qimg.fill(Qt.GlobalColor.transparent)
 
     painter = QPainter(qimg)
     try:
         painter.setRenderHint(QPainter.RenderHint.Antialiasing, True)
         painter.setRenderHint(QPainter.RenderHint.TextAntialiasing, True)
-        painter.setFont(font)
 
         bg_qc = _normalize_bg(params.bg)
         if bg_qc is not None:
@@ -427,17 +1141,169 @@ def render_text_qimage(
 
         x = params.padding - rect.left()
         y = params.padding - rect.top()
-        painter.drawText(x, y, params.text)
+        for (sub, family), pen_x in zip(runs, pens):
+            painter.setFont(_font_for_render(family, params.font_size, params.scale))
+            painter.drawText(x + pen_x, y, sub)
     finally:
         painter.end()
 
+    return qimg
+
+
+def render_text_qimage(
+    text: str,
+    font_family: Optional[str] = None,
+    font_path: Optional[str] = None,
+    font_size: int = 24,
+    color: Optional[str] = None,
+    bg: Optional[str] = None,
+    padding: Optional[int] = None,
+    scale: Optional[float] = None,
+    trim: Optional[bool] = None,
+    trim_margin_px: Optional[int] = None,
+    mode: str = "rgba",
+) -> QImage:
+    """
+    Render a single-line Bengali text string to a QImage.
+
+    Important improvement:
+    - trims transparent borders after render, so layout boxes track visible text
+      more closely and title/suptitle spacing becomes more natural.
+
+    ``mode="alpha"`` returns a Format_Alpha8 coverage mask instead of an
+    ARGB image: ``color`` and ``bg`` are ignored, one cached mask serves
+    every colour, and colour is applied when compositing (see
+    text_colormap()).
+
+    With a non-Qt render backend the image comes from render_text_array()
+    and is wrapped in a QImage (PySide6 must still be importable).
+    """
+    alpha = _check_render_mode(mode)
+    if active_render_engine_name() != "qt":
+        if not QT_RENDER_AVAILABLE:
+            raise RuntimeError(
+                "render_text_qimage() needs PySide6; use render_text_array() "
+                f"with the '{active_render_engine_name()}' backend."
+            )
+        arr = render_text_array(
+            text=text,
+            font_family=font_family,
+            font_path=font_path,
+            font_size=font_size,
+            color=color,
+            bg=bg,
+            padding=padding,
+            scale=scale,
+            trim=trim,
+            trim_margin_px=trim_margin_px,
+            mode=mode,
+        )
+        return _alpha_uint8_to_qimage(arr) if alpha else _rgba_uint8_to_qimage(arr)
+
+    if trim is None:
+        trim = _RENDER_DEFAULTS["trim"]
+    if trim_margin_px is None:
+        trim_margin_px = _RENDER_DEFAULTS["trim_margin_px"]
+
+    params = _resolve_render_params(
+        text=text,
+        font_family=font_family,
+        font_path=font_path,
+        font_size=font_size,
+        color=color,
+        bg=bg,
+        padding=padding,
+        scale=scale,
+    )
+    if alpha:
+        params = replace(params, color=_ALPHA_MODE_COLOR, bg="transparent")
+
+    key = _text_cache_key("qt", params, trim, trim_margin_px)
+    _note_key_spelling(key, _key_spelling(text, font_size, color, bg, scale))
+    cached = _get_cached_qimage(key)
+    if cached is not None:
+        return cached
+
+    shared = _get_shared_qimage(key)
+    if shared is not None:
+        _set_cached_qimage(key, shared)
+        return shared
+
+    qimg = _paint_text_qimage(replace(params, color="#ff000000") if alpha else params)
+
     if trim:
         qimg = _trim_transparent_borders(qimg, margin_px=int(trim_margin_px))
+    if alpha:
+        qimg = qimg.convertToFormat(QImage.Format.Format_Alpha8)
 
     _set_cached_qimage(key, qimg)
+    _set_shared_qimage(key, qimg)
     return qimg.copy()
 
 
+def _render_text_array_with_engine(
+    engine: RenderEngine,
+    text: str,
+    font_family: Optional[str],
+    font_path: Optional[str],
+    font_size: int,
+    color: Optional[str],
+    bg: Optional[str],
+    padding: Optional[int],
+    scale: Optional[float],
+    trim: Optional[bool],
+    trim_margin_px: Optional[int],
+    mode: str = "rgba",
+) -> np.ndarray:
+    """
+    render_text_qimage() for array-producing engines: same parameter
+    resolution, cache keys (prefixed with the engine name), LRU and shared
+    tier, with RGBA arrays (or alpha masks) as the cached values.
+    """
+    alpha = _check_render_mode(mode)
+    if trim is None:
+        trim = _RENDER_DEFAULTS["trim"]
+    if trim_margin_px is None:
+        trim_margin_px = _RENDER_DEFAULTS["trim_margin_px"]
+
+    params = _resolve_render_params(
+        text=text,
+        font_family=font_family,
+        font_path=font_path,
+        font_size=font_size,
+        color=color,
+        bg=bg,
+        padding=padding,
+        scale=scale,
+        engine=engine,
+    )
+    if alpha:
+        params = replace(params, color=_ALPHA_MODE_COLOR, bg="transparent")
+
+    key = _text_cache_key(engine.name, params, trim, trim_margin_px)
+    _note_key_spelling(key, _key_spelling(text, font_size, color, bg, scale))
+    cached = _get_cached_qimage(key)
+    if cached is not None:
+        return cached
+
+    # the shared arena holds RGBA images only
+    shared = None if alpha else _SHARED_RENDER_CACHE
+    if shared is not None:
+        hit = shared.get(key)
+        if hit is not None:
+            _set_cached_qimage(key, hit)
+            return hit
+
+    arr = engine.rasterize_alpha(params) if alpha else engine.rasterize(params)
+    if trim:
+        arr = _trim_rgba_array(arr, margin_px=int(trim_margin_px))
+
+    _set_cached_qimage(key, arr)
+    if shared is not None:
+        shared.put(key, arr, 0)
+    return arr.copy()
+
+
 def render_text_array(
     text: str,
     font_family: Optional[str] = None,
@@ -449,7 +1315,38 @@ def render_text_array(
     scale: Optional[float] = None,
     trim: Optional[bool] = None,
     trim_margin_px: Optional[int] = None,
+    mode: str = "rgba",
+    out: Optional[np.ndarray] = None,
+    offset: Tuple[int, int] = (0, 0),
+    blend: str = "over",
 ) -> np.ndarray:
+    """
+    Render a single-line string to an (H, W, 4) uint8 RGBA array through
+    the active render backend, or with ``mode="alpha"`` to an (H, W)
+    uint8 coverage mask (``color`` and ``bg`` ignored).
+
+    With ``out`` the label is drawn into that preallocated uint8 canvas
+    ((H, W, 4) RGBA, or (H, W) for ``mode="alpha"``; views of a larger
+    array are fine) with its top-left corner at ``offset`` = (x, y), and
+    the view of ``out`` it covers is returned. Nothing is copied on the
+    way: the cached image is composited straight into the caller's
+    memory, source-over (``blend="over"``) or replacing the covered
+    pixels (``blend="copy"``). Parts outside the canvas are clipped.
+    """
+    if out is not None:
+        source = _render_source(
+            text, font_family, font_path, font_size, color, bg,
+            padding, scale, trim, trim_margin_px, mode,
+        )
+        return _blit_into(out, source, offset, blend, mode)
+
+    engine = get_render_engine()
+    if engine.name != "qt":
+        return _render_text_array_with_engine(
+            engine, text, font_family, font_path, font_size,
+            color, bg, padding, scale, trim, trim_margin_px, mode,
+        )
+
     qimg = render_text_qimage(
         text=text,
         font_family=font_family,
@@ -461,10 +1358,234 @@ def render_text_array(
         scale=scale,
         trim=trim,
         trim_margin_px=trim_margin_px,
+        mode=mode,
     )
+    if mode == "alpha":
+        return _qimage_to_alpha_uint8(qimg)
     return _qimage_to_rgba_uint8(qimg)
 
 
+# ---------------------------------------------------------------------
+# Rendering into caller buffers
+# ---------------------------------------------------------------------
+
+_BLEND_MODES = ("over", "copy")
+_LITTLE_ENDIAN = sys.byteorder == "little"
+if QT_RENDER_AVAILABLE:
+    _RGBA8888 = QImage.Format.Format_RGBA8888
+    _ALPHA8 = QImage.Format.Format_Alpha8
+
+
+def _render_source(
+    text: str,
+    font_family: Optional[str],
+    font_path: Optional[str],
+    font_size: int,
+    color: Optional[str],
+    bg: Optional[str],
+    padding: Optional[int],
+    scale: Optional[float],
+    trim: Optional[bool],
+    trim_margin_px: Optional[int],
+    mode: str,
+) -> Any:
+    """
+    The cached image (QImage or array) for a single-line render, rendering
+    it first on a miss. Hits return the cache entry itself, not a copy.
+    """
+    engine = get_render_engine()
+    key = _single_line_cache_key(
+        engine, text, font_family, font_path, font_size, color, bg,
+        padding, scale, trim, trim_margin_px, mode,
+    )
+    _note_key_spelling(key, _key_spelling(text, font_size, color, bg, scale))
+    cached = _peek_cached(key)
+    if cached is not None:
+        return cached
+    if engine.name != "qt":
+        return _render_text_array_with_engine(
+            engine, text, font_family, font_path, font_size,
+            color, bg, padding, scale, trim, trim_margin_px, mode,
+        )
+    return render_text_qimage(
+        text=text,
+        font_family=font_family,
+        font_path=font_path,
+        font_size=font_size,
+        color=color,
+        bg=bg,
+        padding=padding,
+        scale=scale,
+        trim=trim,
+        trim_margin_px=trim_margin_px,
+        mode=mode,
+    )
+
+
+def _check_canvas(out: np.ndarray, mode: str) -> None:
+    if not isinstance(out, np.ndarray) or out.dtype != np.uint8:
+        raise ValueError("out must be a uint8 NumPy array.")
+    if not out.flags.writeable:
+        raise ValueError("out must be writeable.")
+    if mode == "alpha":
+        if out.ndim != 2:
+            raise ValueError(f"mode='alpha' renders into an (H, W) canvas; got shape {out.shape}.")
+    elif out.ndim != 3 or out.shape[2] != 4:
+        raise ValueError(f"mode='rgba' renders into an (H, W, 4) canvas; got shape {out.shape}.")
+
+
+def _canvas_qimage(out: np.ndarray, region: np.ndarray, x0: int, y0: int) -> Optional[QImage]:
+    """
+    A QImage over the memory of ``region`` = ``out[y0:, x0:]`` (no copy),
+    or None when its strides do not describe QImage scanlines.
+    """
+    h, w = region.shape[:2]
+    channels = 1 if region.ndim == 2 else 4
+    if region.strides[-1] != 1 or (channels == 4 and region.strides[1] != 4):
+        return None
+    bpl = region.strides[0]
+    if bpl < channels * w:
+        return None
+    fmt = _RGBA8888 if channels == 4 else _ALPHA8
+    if out.flags.c_contiguous:
+        start = y0 * bpl + x0 * channels
+        return QImage(memoryview(out.reshape(-1))[start:], w, h, bpl, fmt)
+    span = (h - 1) * bpl + channels * w
+    flat = np.lib.stride_tricks.as_strided(region, shape=(span,), strides=(1,))
+    return QImage(memoryview(flat), w, h, bpl, fmt)
+
+
+def _source_qimage(value: Any) -> QImage:
+    # cached arrays are C-contiguous; wrap them without copying
+    if not isinstance(value, np.ndarray):
+        return value
+    h, w = value.shape[:2]
+    if value.ndim == 2:
+        return QImage(memoryview(value.reshape(-1)), w, h, w, _ALPHA8)
+    return QImage(memoryview(value.reshape(-1)), w, h, 4 * w, _RGBA8888)
+
+
+def _blend_over(dst: np.ndarray, src: np.ndarray) -> None:
+    """
+    Source-over of straight-alpha ``src`` onto ``dst`` in place (NumPy
+    fallback for canvases QPainter cannot wrap).
+    """
+    if dst.ndim == 2:
+        sa = src.astype(np.uint32)
+        dst[...] = sa + (dst * (255 - sa) + 127) // 255
+        return
+    sa = src[..., 3:].astype(np.float32) / 255.0
+    da = dst[..., 3:].astype(np.float32) / 255.0
+    oa = sa + da * (1.0 - sa)
+    rgb = src[..., :3] * sa + dst[..., :3] * (da * (1.0 - sa))
+    np.divide(rgb, oa, out=rgb, where=oa > 0)
+    dst[..., :3] = np.rint(rgb)
+    dst[..., 3:] = np.rint(oa * 255.0)
+
+
+def _blit_into(out: np.ndarray, source: Any, offset: Tuple[int, int], blend: str, mode: str) -> np.ndarray:
+    if blend not in _BLEND_MODES:
+        raise ValueError(f"Unknown blend {blend!r}; choose from {_BLEND_MODES}.")
+    _check_canvas(out, mode)
+    x, y = (int(v) for v in offset)
+    if isinstance(source, np.ndarray):
+        h, w = source.shape[:2]
+        qt_format = None
+    else:
+        h, w = source.height(), source.width()
+        qt_format = source.format()
+    x0, y0 = max(x, 0), max(y, 0)
+    x1, y1 = min(x + w, out.shape[1]), min(y + h, out.shape[0])
+    if x1 <= x0 or y1 <= y0:
+        return out[:0, :0]
+    region = out[y0:y1, x0:x1]
+    sx, sy = x0 - x, y0 - y
+    rows, cols = y1 - y0, x1 - x0
+
+    # channel order of the source bytes, when NumPy can use them as-is
+    if qt_format is None or qt_format in (_RGBA8888, _ALPHA8):
+        order = None
+    elif qt_format == QImage.Format.Format_ARGB32 and _LITTLE_ENDIAN:
+        order = (2, 1, 0, 3)
+    else:
+        order = False
+    target = None
+    if QT_RENDER_AVAILABLE and (blend == "over" or order is False):
+        target = _canvas_qimage(out, region, x0, y0)
+    if target is None:
+        if order is False:
+            source, order = source.convertToFormat(_RGBA8888), None
+        src = _cache_value_pixels(source)[0][sy:sy + rows, sx:sx + cols]
+        if out.ndim == 2:
+            src = src[..., 0]
+        elif order:
+            src = src[..., list(order)]
+        if blend == "copy":
+            region[...] = src
+        else:
+            _blend_over(region, src)
+        return region
+
+    painter = QPainter(target)
+    try:
+        if blend == "copy":
+            painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_Source)
+        painter.drawImage(0, 0, _source_qimage(source), sx, sy, cols, rows)
+    finally:
+        painter.end()
+    return region
+
+
+def _render_text_file_without_qt(
+    text: str,
+    output_path: Optional[str],
+    font_family: Optional[str],
+    font_path: Optional[str],
+    font_size: int,
+    width: Optional[int],
+    height: Optional[int],
+    color: Optional[str],
+    bg: Optional[str],
+    padding: Optional[int],
+    scale: Optional[float],
+    trim: Optional[bool],
+    trim_margin_px: Optional[int],
+) -> np.ndarray:
+    from .engines import colorize_alpha
+
+    arr = render_text_array(
+        text=text,
+        font_family=font_family,
+        font_path=font_path,
+        font_size=font_size,
+        color=color,
+        bg=bg,
+        padding=padding,
+        scale=scale,
+        trim=trim,
+        trim_margin_px=trim_margin_px,
+    )
+
+    h, w = arr.shape[:2]
+    target_w = max(w, int(width)) if width is not None else w
+    target_h = max(h, int(height)) if height is not None else h
+    if (target_w, target_h) != (w, h):
+        canvas = colorize_alpha(
+            np.zeros((target_h, target_w), dtype=np.uint8),
+            "black",
+            bg if bg is not None else _RENDER_DEFAULTS["bg"],
+        )
+        canvas[:h, :w] = arr
+        arr = canvas
+
+    if output_path:
+        import matplotlib.image as mpimg
+
+        mpimg.imsave(output_path, arr)
+
+    return arr
+
+
 def render_text(
     text: str,
     output_path: Optional[str] = None,
@@ -482,7 +1603,15 @@ def render_text(
 ):
     """
     Backward-compatible public single-line render helper.
+
+    Returns a QImage, or an RGBA array with a non-Qt render backend.
     """
+    if active_render_engine_name() != "qt":
+        return _render_text_file_without_qt(
+            text, output_path, font_family, font_path, font_size,
+            width, height, color, bg, padding, scale, trim, trim_margin_px,
+        )
+
     qimg = render_text_qimage(
         text=text,
         font_family=font_family,
@@ -526,11 +1655,373 @@ def render_text(
 # Paragraph render
 # ---------------------------------------------------------------------
 
-def _estimate_paragraph_height(width: int, font: QFont, text: str, margin: int) -> int:
-    fm = QFontMetrics(font)
+def _line_break_offsets(text: str) -> List[int]:
+    finder = QTextBoundaryFinder(QTextBoundaryFinder.BoundaryType.Line, text)
+    offsets: List[int] = []
+    pos = finder.toNextBoundary()
+    while pos != -1:
+        offsets.append(pos)
+        pos = finder.toNextBoundary()
+    if not offsets or offsets[-1] != len(text):
+        offsets.append(len(text))
+    return offsets
+
+
+def _shape_paragraphs(font: QFont, family: str, text: str) -> List[ShapedParagraph]:
+    """
+    Shape each hard paragraph of ``text`` once (cached).
+
+    Callers must hold ``_LAYOUT_LOCK``.
+    """
+    key = (text, family, font.pixelSize())
+    cached = _SHAPED_PARAGRAPH_CACHE.get(key)
+    if cached is not None:
+        _SHAPED_PARAGRAPH_CACHE.move_to_end(key)
+        return cached
+
+    shaped: List[ShapedParagraph] = []
+    for para in text.split("\n"):
+        layout = QTextLayout(para, font)
+        layout.beginLayout()
+        line = layout.createLine()
+        line.setLineWidth(1.0e7)
+        layout.endLayout()
+
+        breaks = _line_break_offsets(para)
+        xs = [float(line.cursorToX(pos)[0]) for pos in [0] + breaks]
+        shaped.append(
+            ShapedParagraph(
+                text=para,
+                layout=layout,
+                breaks=breaks,
+                xs=xs,
+                height=float(line.height()),
+            )
+        )
+
+    _SHAPED_PARAGRAPH_CACHE[key] = shaped
+    while len(_SHAPED_PARAGRAPH_CACHE) > _SHAPED_PARAGRAPH_CACHE_MAXSIZE:
+        _SHAPED_PARAGRAPH_CACHE.popitem(last=False)
+    return shaped
+
+
+def _glyph_runs_ink_rect(runs) -> Optional[Tuple[float, float, float, float]]:
+    """
+    Exact ink bounds (x0, y0, x1, y1) of positioned glyph runs.
+    """
+    x0 = y0 = float("inf")
+    x1 = y1 = float("-inf")
+    for run in runs:
+        raw = run.rawFont()
+        for glyph, pos in zip(run.glyphIndexes(), run.positions()):
+            r = raw.boundingRect(glyph)
+            if r.width() <= 0 or r.height() <= 0:
+                continue
+            x0 = min(x0, pos.x() + r.left())
+            y0 = min(y0, pos.y() + r.top())
+            x1 = max(x1, pos.x() + r.right())
+            y1 = max(y1, pos.y() + r.bottom())
+    if x0 > x1:
+        return None
+    return x0, y0, x1, y1
+
+
+def _wrap_shaped_paragraph(
+    para: ShapedParagraph,
+    inner_w: float,
+    y: float,
+) -> List[ParagraphLine]:
+    """
+    Greedy line breaking over the shaped paragraph's break opportunities.
+
+    Trailing spaces do not count towards a line's width, and a segment
+    wider than the line overflows on a line of its own, like
+    QTextOption.WordWrap.
+    """
+    text = para.text
+    shaped_line = para.layout.lineAt(0)
+    lines: List[ParagraphLine] = []
+
+    def pen_x(offset: int, break_idx: int) -> float:
+        # xs[0] is offset 0 and xs[i + 1] is breaks[i]
+        if offset == para.breaks[break_idx]:
+            return para.xs[break_idx + 1]
+        return float(shaped_line.cursorToX(offset)[0])
+
+    start, start_x = 0, para.xs[0]
+    fit: Optional[Tuple[int, float, float]] = None  # (break index, x, width)
+    i = 0
+    while i < len(para.breaks):
+        end = para.breaks[i]
+        vis = end
+        while vis > start and text[vis - 1].isspace():
+            vis -= 1
+        width = max(0.0, pen_x(vis, i) - start_x)
+
+        if fit is None or width <= inner_w:
+            fit = (i, para.xs[i + 1], width)
+            i += 1
+            continue
+
+        fit_idx, fit_x, fit_w = fit
+        fit_end = para.breaks[fit_idx]
+        lines.append(ParagraphLine(para, start, fit_end - start, start_x, y, fit_w))
+        y += para.height
+        start, start_x = fit_end, fit_x
+        fit = None
+
+    lines.append(
+        ParagraphLine(para, start, len(text) - start, start_x, y, fit[2] if fit else 0.0)
+    )
+    return lines
+
+
+def _paragraph_layout(font: QFont, family: str, text: str, inner_w: int) -> ParagraphLayout:
+    """
+    Return the (cached) line-break layout of a paragraph, including the
+    exact ink bounding box relative to the text origin.
+    """
+    key = (text, family, font.pixelSize(), inner_w)
+
+    with _LAYOUT_LOCK:
+        cached = _PARAGRAPH_LAYOUT_CACHE.get(key)
+        if cached is not None:
+            _PARAGRAPH_LAYOUT_CACHE.move_to_end(key)
+            return cached
+
+        lines: List[ParagraphLine] = []
+        y = 0.0
+        for para in _shape_paragraphs(font, family, text):
+            para_lines = _wrap_shaped_paragraph(para, float(inner_w), y)
+            lines.extend(para_lines)
+            y += para.height * len(para_lines)
+
+        ink = None
+        for line in lines:
+            if line.length > 0:
+                line.glyph_runs = list(line.paragraph.layout.glyphRuns(line.start, line.length))
+            r = _glyph_runs_ink_rect(line.glyph_runs)
+            if r is None:
+                continue
+            r = (r[0] - line.x_start, r[1] + line.y, r[2] - line.x_start, r[3] + line.y)
+            ink = r if ink is None else (
+                min(ink[0], r[0]), min(ink[1], r[1]), max(ink[2], r[2]), max(ink[3], r[3])
+            )
+
+        layout = ParagraphLayout(
+            lines=lines,
+            text_width=max((line.width for line in lines), default=0.0),
+            text_height=max(1.0, y),
+            ink_rect=ink,
+        )
+
+        _PARAGRAPH_LAYOUT_CACHE[key] = layout
+        while len(_PARAGRAPH_LAYOUT_CACHE) > _PARAGRAPH_LAYOUT_CACHE_MAXSIZE:
+            _PARAGRAPH_LAYOUT_CACHE.popitem(last=False)
+        return layout
+
+
+def _draw_paragraph_lines(
+    painter: QPainter,
+    layout: ParagraphLayout,
+    origin_x: float,
+    origin_y: float,
+    y_range: Optional[Tuple[float, float]] = None,
+) -> None:
+    for line in layout.lines:
+        top = origin_y + line.y
+        if y_range is not None:
+            # Ascenders/descenders may overhang the line box by up to a
+            # line height, so keep one line of slack on each side.
+            slack = line.paragraph.height
+            if top + line.paragraph.height + slack <= y_range[0] or top - slack >= y_range[1]:
+                continue
+        pos = QPointF(origin_x - line.x_start, top)
+        for run in line.glyph_runs:
+            painter.drawGlyphRun(pos, run)
+
+
+@dataclass
+class ParagraphCanvas:
+    """
+    Laid-out paragraph plus the geometry of the image it is drawn into.
+    """
+    layout: ParagraphLayout
+    width: int
+    height: int
+    origin_x: float
+    origin_y: float
+    clip: Optional[Tuple[float, float, float, float]]
+    color: str
+    bg: str
+
+
+def _paragraph_canvas(
+    params: RenderParams,
+    width: int,
+    height: Optional[int],
+    margin: int,
+    trim: bool,
+    trim_margin_px: int,
+) -> ParagraphCanvas:
+    font = _font_for_render(params.font_family, params.font_size, params.scale)
     inner_w = max(1, width - (2 * margin))
-    rect = fm.boundingRect(QRect(0, 0, inner_w, 100000), int(Qt.TextFlag.TextWordWrap), text)
-    return max(1, rect.height() + (2 * margin))
+    layout = _paragraph_layout(font, params.font_family, params.text, inner_w)
+
+    clip_h = None if height is None else float(max(1, height - (2 * margin)))
+
+    if trim and _normalize_bg(params.bg) is None:
+        # The layout's ink box sizes the image exactly; no pixel scan.
+        # Clamped to the paragraph box, like the clip of the untrimmed image.
+        ink = layout.ink_rect
+        if ink is not None:
+            ink = (max(0.0, ink[0]), ink[1], min(float(inner_w), ink[2]), ink[3])
+            if clip_h is not None:
+                ink = (ink[0], max(0.0, ink[1]), ink[2], min(clip_h, ink[3]))
+            if ink[0] >= ink[2] or ink[1] >= ink[3]:
+                ink = None
+        if ink is None:
+            ink = (0.0, 0.0, 1.0, 1.0)
+
+        pad = max(0, int(trim_margin_px))
+        left = int(math.floor(ink[0])) - pad
+        top = int(math.floor(ink[1])) - pad
+        img_w = max(1, int(math.ceil(ink[2])) + pad - left)
+        img_h = max(1, int(math.ceil(ink[3])) + pad - top)
+        origin_x, origin_y = float(-left), float(-top)
+        if clip_h is None:
+            clip = (origin_x, origin_y + ink[1], float(inner_w), ink[3] - ink[1])
+        else:
+            clip = (origin_x, origin_y, float(inner_w), clip_h)
+    else:
+        img_w = width
+        img_h = height if height is not None else max(1, int(math.ceil(layout.text_height)) + (2 * margin))
+        origin_x, origin_y = float(margin), float(margin)
+        clip = (origin_x, origin_y, float(inner_w), float(max(1, img_h - (2 * margin))))
+
+    return ParagraphCanvas(
+        layout=layout,
+        width=img_w,
+        height=img_h,
+        origin_x=origin_x,
+        origin_y=origin_y,
+        clip=clip,
+        color=params.color,
+        bg=params.bg,
+    )
+
+
+def _paint_paragraph_canvas(canvas: ParagraphCanvas, top: int = 0, rows: Optional[int] = None) -> QImage:
+    """
+    Rasterize rows [top, top + rows) of a paragraph canvas.
+    """
+    if rows is None:
+        rows = canvas.height - top
+
+    qimg = QImage(canvas.width, max(1, rows), QImage.Format.Format_ARGB32)
+    bg_qc = _normalize_bg(canvas.bg)
+    if bg_qc is None:
+        qimg.fill(Qt.GlobalColor.transparent)
+    else:
+        qimg.fill(bg_qc)
+
+    painter = QPainter(qimg)
+    try:
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing, True)
+        painter.setRenderHint(QPainter.RenderHint.TextAntialiasing, True)
+        painter.setPen(QPen(_normalize_color(canvas.color)))
+        painter.translate(0.0, float(-top))
+        if canvas.clip is not None:
+            painter.setClipRect(QRectF(*canvas.clip))
+        _draw_paragraph_lines(
+            painter,
+            canvas.layout,
+            canvas.origin_x,
+            canvas.origin_y,
+            y_range=(float(top), float(top + rows)),
+        )
+    finally:
+        painter.end()
+
+    return qimg
+
+
+def _resolve_paragraph_args(
+    text: str,
+    width: int,
+    height: Optional[int],
+    font_family: Optional[str],
+    font_path: Optional[str],
+    font_size: int,
+    color: Optional[str],
+    bg: Optional[str],
+    margin: int,
+    scale: Optional[float],
+    trim: Optional[bool],
+    trim_margin_px: Optional[int],
+) -> Tuple[RenderParams, int, Optional[int], int, bool, int]:
+    if trim is None:
+        trim = _RENDER_DEFAULTS["trim"]
+    if trim_margin_px is None:
+        trim_margin_px = _RENDER_DEFAULTS["trim_margin_px"]
+
+    width = max(1, int(width))
+    margin = max(0, int(margin))
+    if height is not None:
+        height = max(1, int(height))
+
+    # Paragraph layout is QTextLayout-based, whatever the active backend.
+    params = _resolve_render_params(
+        text=text,
+        font_family=font_family,
+        font_path=font_path,
+        font_size=font_size,
+        color=color,
+        bg=bg,
+        padding=margin,
+        scale=scale,
+        engine=get_render_engine("qt"),
+    )
+    return params, width, height, margin, bool(trim), int(trim_margin_px)
+
+
+def _paragraph_cache_key(
+    params: RenderParams,
+    width: int,
+    height: Optional[int],
+    trim: bool,
+    trim_margin_px: int,
+) -> Tuple[Any, ...]:
+    return ("paragraph",) + _make_cache_key(params) + (
+        width,
+        height,
+        trim,
+        trim_margin_px,
+    )
+
+
+def _paragraph_text_cache_key(
+    text: str,
+    width: int = 600,
+    height: Optional[int] = None,
+    font_family: Optional[str] = None,
+    font_path: Optional[str] = None,
+    font_size: int = 24,
+    color: Optional[str] = None,
+    bg: Optional[str] = None,
+    margin: int = 12,
+    scale: Optional[float] = None,
+    trim: Optional[bool] = None,
+    trim_margin_px: Optional[int] = None,
+) -> Tuple[Any, ...]:
+    """
+    Cache key render_paragraph_qimage() uses for these arguments.
+    """
+    params, width, height, margin, trim, trim_margin_px = _resolve_paragraph_args(
+        text, width, height, font_family, font_path, font_size,
+        color, bg, margin, scale, trim, trim_margin_px,
+    )
+    return _paragraph_cache_key(params, width, height, trim, trim_margin_px)
 
 
 def render_paragraph_qimage(
@@ -549,62 +2040,114 @@ def render_paragraph_qimage(
 ) -> QImage:
     """
     Render wrapped paragraph text to a QImage.
-    """
-    _ensure_runtime()
 
-    if color is None:
-        color = _RENDER_DEFAULTS["color"]
-    if bg is None:
-        bg = _RENDER_DEFAULTS["bg"]
-    if scale is None:
-        scale = _RENDER_DEFAULTS["scale"]
-    if trim is None:
-        trim = _RENDER_DEFAULTS["trim"]
-    if trim_margin_px is None:
-        trim_margin_px = _RENDER_DEFAULTS["trim_margin_px"]
+    The text is shaped once with QTextLayout; line positions and the exact
+    ink bounding box come from that single pass, so a trimmed image is
+    sized directly from the box instead of being scanned for transparent
+    borders. The finished image is cached alongside single-line renders,
+    and the line-break layout separately per (text, font, width).
+    """
+    params, width, height, margin, trim, trim_margin_px = _resolve_paragraph_args(
+        text, width, height, font_family, font_path, font_size,
+        color, bg, margin, scale, trim, trim_margin_px,
+    )
 
-    resolved_family = resolve_font(font_family=font_family, font_path=font_path)
-    font = _font_for_render(resolved_family, font_size, scale)
+    key = _paragraph_cache_key(params, width, height, trim, trim_margin_px)
+    _note_key_spelling(key, _key_spelling(text, font_size, color, bg, scale))
+    cached = _get_cached_qimage(key)
+    if cached is not None:
+        return cached
 
-    width = max(1, int(width))
-    margin = max(0, int(margin))
+    canvas = _paragraph_canvas(params, width, height, margin, trim, trim_margin_px)
+    qimg = _paint_paragraph_canvas(canvas)
 
-    if height is None:
-        height = _estimate_paragraph_height(width, font, str(text), margin)
-    else:
-        height = max(1, int(height))
+    _set_cached_qimage(key, qimg)
+    return qimg.copy()
 
-    qimg = QImage(width, height, QImage.Format.Format_ARGB32)
-    bg_qc = _normalize_bg(bg)
-    if bg_qc is None:
-        qimg.fill(Qt.GlobalColor.transparent)
-    else:
-        qimg.fill(bg_qc)
 
-    painter = QPainter(qimg)
-    try:
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing, True)
-        painter.setRenderHint(QPainter.RenderHint.TextAntialiasing, True)
-        painter.setFont(font)
-        painter.setPen(QPen(_normalize_color(color)))
-
-        text_rect = QRectF(
-            float(margin),
-            float(margin),
-            float(max(1, width - (2 * margin))),
-            float(max(1, height - (2 * margin))),
-        )
+class ParagraphTiles:
+    """
+    A paragraph laid out once and rasterized in fixed-height tiles on demand.
 
-        option = QTextOption()
-        option.setWrapMode(QTextOption.WrapMode.WordWrap)
-        painter.drawText(text_rect, str(text), option)
-    finally:
-        painter.end()
+    Indexing or iterating yields ``QImage`` tiles of ``tile_height`` rows
+    (the last one may be shorter). Only the requested tile is allocated,
+    so peak memory is bounded by the tile size rather than the document.
+    Tiles are not cached.
+    """
 
-    if trim and _normalize_bg(bg) is None:
-        qimg = _trim_transparent_borders(qimg, margin_px=int(trim_margin_px))
+    def __init__(self, canvas: ParagraphCanvas, tile_height: int):
+        self._canvas = canvas
+        self.tile_height = max(1, int(tile_height))
+
+    @property
+    def width(self) -> int:
+        return self._canvas.width
+
+    @property
+    def height(self) -> int:
+        return self._canvas.height
+
+    def __len__(self) -> int:
+        return -(-self._canvas.height // self.tile_height)
+
+    def tile_bounds(self, index: int) -> Tuple[int, int]:
+        """
+        Return (top, rows) of tile ``index`` in full-image pixel rows.
+        """
+        n = len(self)
+        if index < 0:
+            index += n
+        if not 0 <= index < n:
+            raise IndexError("tile index out of range")
+        top = index * self.tile_height
+        return top, min(self.tile_height, self._canvas.height - top)
+
+    def __getitem__(self, index: int) -> QImage:
+        top, rows = self.tile_bounds(index)
+        return _paint_paragraph_canvas(self._canvas, top=top, rows=rows)
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def iter_arrays(self):
+        """
+        Yield ``(top, rgba_uint8)`` for each tile, for writers that consume
+        rows incrementally.
+        """
+        for i in range(len(self)):
+            top, _ = self.tile_bounds(i)
+            yield top, _qimage_to_rgba_uint8(self[i])
+
+
+def render_paragraph_tiles(
+    text: str,
+    width: int = 600,
+    height: Optional[int] = None,
+    tile_height: int = 512,
+    font_family: Optional[str] = None,
+    font_path: Optional[str] = None,
+    font_size: int = 24,
+    color: Optional[str] = None,
+    bg: Optional[str] = None,
+    margin: int = 12,
+    scale: Optional[float] = None,
+    trim: Optional[bool] = None,
+    trim_margin_px: Optional[int] = None,
+) -> ParagraphTiles:
+    """
+    Lay out a (possibly very long) paragraph once and return a lazily
+    rasterized ``ParagraphTiles`` sequence instead of one large image.
 
-    return qimg
+    Stacking the tiles top to bottom gives the same pixels as
+    ``render_paragraph_qimage`` with the same arguments.
+    """
+    params, width, height, margin, trim, trim_margin_px = _resolve_paragraph_args(
+        text, width, height, font_family, font_path, font_size,
+        color, bg, margin, scale, trim, trim_margin_px,
+    )
+    canvas = _paragraph_canvas(params, width, height, margin, trim, trim_margin_px)
+    return ParagraphTiles(canvas, tile_height)
 
 
 def render_paragraph(
@@ -0,0 +1,441 @@
+# bangla_render/server.py
+"""
+Local render daemon.
+
+One process owns the Qt application, the registered fonts and a single
+render cache; any number of client processes (e.g. gunicorn workers) send
+batched render requests over a Unix socket and get RGBA buffers back,
+through a client-owned shared-memory arena when possible.
+
+Run the server:
+
+    python -m bangla_render.server --socket /tmp/bangla_render.sock \\
+        --font fonts/Kalpurush.ttf
+
+and use it from a client:
+
+    client = RenderClient("/tmp/bangla_render.sock")
+    rgba = client.render_text_rgba("বাংলা", font_size=32)
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import socket
+import socketserver
+import struct
+import sys
+import tempfile
+import threading
+import time
+from multiprocessing import shared_memory
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+
+# ---------------------------------------------------------------------
+# Wire protocol
+# ---------------------------------------------------------------------
+#
+# Every message is a 4-byte big-endian header length, a UTF-8 JSON header
+# and ``header["payload"]`` raw bytes (0 when absent).
+
+_HEADER = struct.Struct(">I")
+_MAX_HEADER_BYTES = 64 * 1024 * 1024
+
+DEFAULT_ARENA_SIZE = 16 * 1024 * 1024
+
+
+def default_socket_path() -> str:
+    base = os.environ.get("XDG_RUNTIME_DIR") or tempfile.gettempdir()
+    uid = os.getuid() if hasattr(os, "getuid") else 0
+    return os.path.join(base, f"bangla_render-{uid}.sock")
+
+
+def _recv_exact(sock: socket.socket, n: int) -> bytes:
+    buf = bytearray(n)
+    view = memoryview(buf)
+    got = 0
+    while got < n:
+        k = sock.recv_into(view[got:], n - got)
+        if k == 0:
+            raise ConnectionError("Render server connection closed.")
+        got += k
+    return bytes(buf)
+
+
+def _send_message(sock: socket.socket, header: Dict[str, Any], payload: Sequence[bytes] = ()) -> None:
+    header = dict(header, payload=sum(len(p) for p in payload))
+    raw = json.dumps(header, ensure_ascii=False).encode("utf-8")
+    sock.sendall(_HEADER.pack(len(raw)) + raw)
+    for part in payload:
+        sock.sendall(part)
+
+
+def _recv_message(sock: socket.socket) -> Tuple[Dict[str, Any], bytes]:
+    (n,) = _HEADER.unpack(_recv_exact(sock, _HEADER.size))
+    if n > _MAX_HEADER_BYTES:
+        raise ValueError(f"Render message header too large ({n} bytes).")
+    header = json.loads(_recv_exact(sock, n).decode("utf-8"))
+    size = int(header.get("payload", 0))
+    payload = _recv_exact(sock, size) if size else b""
+    return header, payload
+
+
+def _attach_shared_memory(name: str, owner_pid: Optional[int] = None) -> shared_memory.SharedMemory:
+    """
+    Attach to a client-owned segment without letting this process's
+    resource tracker unlink it on exit (Python < 3.13 registers every
+    attachment). A client in this same process shares our tracker and
+    keeps its own registration.
+    """
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, track=False)
+    shm = shared_memory.SharedMemory(name=name)
+    if owner_pid == os.getpid():
+        return shm
+    try:
+        from multiprocessing import resource_tracker
+
+        resource_tracker.unregister(shm._name, "shared_memory")
+    except Exception:
+        pass
+    return shm
+
+
+def _hashable_style(style: Dict[str, Any]) -> Dict[str, Any]:
+    # JSON turns tuples (e.g. RGBA colours) into lists; the render cache
+    # key needs them hashable again.
+    return {k: tuple(v) if isinstance(v, list) else v for k, v in style.items()}
+
+
+# ---------------------------------------------------------------------
+# Server
+# ---------------------------------------------------------------------
+
+def _socket_is_live(path: str) -> bool:
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(path)
+    except (ConnectionRefusedError, FileNotFoundError):
+        return False
+    finally:
+        sock.close()
+    return True
+
+
+class _RenderRequestHandler(socketserver.BaseRequestHandler):
+    def setup(self) -> None:
+        self._arenas: Dict[str, shared_memory.SharedMemory] = {}
+        self._client_pid: Optional[int] = None
+
+    def finish(self) -> None:
+        for shm in self._arenas.values():
+            try:
+                shm.close()
+            except Exception:
+                pass
+
+    def handle(self) -> None:
+        while True:
+            try:
+                header, _payload = _recv_message(self.request)
+            except (ConnectionError, OSError):
+                return
+            try:
+                self._client_pid = header.get("pid")
+                reply, parts = self.server.dispatch(header, self._arena)
+            except Exception as e:
+                reply, parts = {"ok": False, "error": f"{type(e).__name__}: {e}"}, ()
+            try:
+                _send_message(self.request, reply, parts)
+            except OSError:
+                return
+
+    def _arena(self, name: str) -> shared_memory.SharedMemory:
+        shm = self._arenas.get(name)
+        if shm is None:
+            shm = self._arenas[name] = _attach_shared_memory(name, self._client_pid)
+        return shm
+
+
+class RenderServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """
+    Threaded Unix-socket render server.
+
+    Requests from all connections are rendered with the regular (thread-safe)
+    render functions, so they share one cache. Create it on the thread that
+    owns the Qt application, then call ``serve_forever()``.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, socket_path: Optional[str] = None):
+        from .engines import get_render_engine
+
+        get_render_engine().ensure_runtime()
+        self.socket_path = socket_path or default_socket_path()
+        if os.path.exists(self.socket_path):
+            # only a stale socket (nothing listening) may be replaced
+            if _socket_is_live(self.socket_path):
+                raise RuntimeError(f"A render server is already running on {self.socket_path!r}.")
+            os.unlink(self.socket_path)
+        super().__init__(self.socket_path, _RenderRequestHandler)
+        self._stats_lock = threading.Lock()
+        self._started = time.time()
+        self._counters = {"requests": 0, "items": 0, "shm_batches": 0, "inline_batches": 0, "errors": 0}
+
+    # -- ops ---------------------------------------------------------
+
+    def dispatch(self, header: Dict[str, Any], arena) -> Tuple[Dict[str, Any], Sequence[bytes]]:
+        op = header.get("op")
+        self._count("requests")
+        if op == "ping":
+            return {"ok": True, "pid": os.getpid()}, ()
+        if op in ("stats", "health"):
+            return {"ok": True, "stats": self.stats()}, ()
+        if op == "render":
+            try:
+                return self._render(header, arena)
+            except Exception:
+                self._count("errors")
+                raise
+        self._count("errors")
+        raise ValueError(f"Unknown render server op: {op!r}")
+
+    def _render(self, header: Dict[str, Any], arena) -> Tuple[Dict[str, Any], Sequence[bytes]]:
+        from .renderer import render_text_array
+
+        style = _hashable_style(header.get("style") or {})
+        items = header.get("items") or []
+
+        images = []
+        for item in items:
+            if isinstance(item, dict):
+                item = dict(item)
+                text = item.pop("text")
+                kw = dict(style, **_hashable_style(item))
+            else:
+                text, kw = item, style
+            if "out" in kw:
+                raise ValueError("The render server does not support out=; copy the returned arrays instead.")
+            images.append(np.ascontiguousarray(render_text_array(str(text), **kw)))
+        self._count("items", len(images))
+
+        results = []
+        offset = 0
+        for img in images:
+            h, w = img.shape[:2]
+            # mode="alpha" renders (H, W) masks
+            channels = img.shape[2] if img.ndim == 3 else 1
+            results.append({"width": w, "height": h, "channels": channels, "offset": offset, "nbytes": img.nbytes})
+            offset += img.nbytes
+
+        shm_name = header.get("shm")
+        if shm_name and offset <= int(header.get("shm_size", 0)):
+            shm = arena(shm_name)
+            dst = np.ndarray((offset,), dtype=np.uint8, buffer=shm.buf)
+            for img, res in zip(images, results):
+                dst[res["offset"]:res["offset"] + res["nbytes"]] = img.reshape(-1)
+            del dst
+            self._count("shm_batches")
+            return {"ok": True, "transport": "shm", "results": results}, ()
+
+        self._count("inline_batches")
+        parts = [img.tobytes() for img in images]
+        return {"ok": True, "transport": "inline", "results": results}, parts
+
+    # -- stats -------------------------------------------------------
+
+    def _count(self, key: str, n: int = 1) -> None:
+        with self._stats_lock:
+            self._counters[key] += n
+
+    def stats(self) -> Dict[str, Any]:
+        from .renderer import get_render_cache_info
+
+        with self._stats_lock:
+            counters = dict(self._counters)
+        counters.update(
+            pid=os.getpid(),
+            uptime_s=round(time.time() - self._started, 3),
+            socket=self.socket_path,
+            cache=get_render_cache_info(),
+        )
+        return counters
+
+    def server_close(self) -> None:
+        super().server_close()
+        try:
+            os.unlink(self.socket_path)
+        except OSError:
+            pass
+
+
+# ---------------------------------------------------------------------
+# Client
+# ---------------------------------------------------------------------
+
+class RenderClient:
+    """
+    Thin client for a ``RenderServer``; does not import Qt.
+
+    Results are ``(H, W, 4)`` uint8 RGBA arrays. Pixels come back through a
+    shared-memory arena owned by the client (``arena_size`` bytes, 0 to
+    disable), falling back to the socket when a batch does not fit. With
+    ``copy=False`` the arrays are views into the arena and stay valid only
+    until the next request.
+    """
+
+    def __init__(
+        self,
+        socket_path: Optional[str] = None,
+        arena_size: int = DEFAULT_ARENA_SIZE,
+        timeout: Optional[float] = 30.0,
+    ):
+        self.socket_path = socket_path or default_socket_path()
+        self.arena_size = int(arena_size)
+        self.timeout = timeout
+        self._sock: Optional[socket.socket] = None
+        self._shm: Optional[shared_memory.SharedMemory] = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> socket.socket:
+        if self._sock is None:
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            sock.settimeout(self.timeout)
+            sock.connect(self.socket_path)
+            self._sock = sock
+        if self._shm is None and self.arena_size > 0:
+            self._shm = shared_memory.SharedMemory(create=True, size=self.arena_size)
+        return self._sock
+
+    def _call(self, header: Dict[str, Any]) -> Tuple[Dict[str, Any], bytes]:
+        sock = self._connect()
+        try:
+            _send_message(sock, header)
+            reply, payload = _recv_message(sock)
+        except (OSError, ConnectionError):
+            self._drop_connection()
+            raise
+        if not reply.get("ok"):
+            raise RuntimeError(f"Render server error: {reply.get('error')}")
+        return reply, payload
+
+    def _drop_connection(self) -> None:
+        if self._sock is not None:
+            try:
+                self._sock.close()
+            finally:
+                self._sock = None
+
+    # -- ops ---------------------------------------------------------
+
+    def ping(self) -> bool:
+        with self._lock:
+            return bool(self._call({"op": "ping"})[0].get("ok"))
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return self._call({"op": "stats"})[0]["stats"]
+
+    def render_many(
+        self,
+        texts: Sequence[Union[str, Dict[str, Any]]],
+        copy: bool = True,
+        **style,
+    ) -> List[np.ndarray]:
+        """
+        Render a batch in one round trip. Items are strings (rendered with
+        ``style``) or dicts with ``text`` plus per-item style overrides.
+        Arrays are RGBA, or (H, W) masks for ``mode="alpha"``.
+        """
+        with self._lock:
+            self._connect()
+            header: Dict[str, Any] = {"op": "render", "items": list(texts), "style": style}
+            if self._shm is not None:
+                header.update(shm=self._shm.name, shm_size=self._shm.size, pid=os.getpid())
+            reply, payload = self._call(header)
+
+            source = self._shm.buf if reply["transport"] == "shm" else payload
+            out = []
+            for res in reply["results"]:
+                h, w, c = res["height"], res["width"], res["channels"]
+                shape = (h, w, c) if c > 1 else (h, w)
+                arr = np.ndarray(shape, dtype=np.uint8, buffer=source, offset=res["offset"])
+                out.append(arr.copy() if copy or reply["transport"] != "shm" else arr)
+            return out
+
+    def render_text_rgba(self, text: str, **style) -> np.ndarray:
+        """
+        Drop-in for ``render_text_qimage`` returning an RGBA array.
+        """
+        return self.render_many([text], **style)[0]
+
+    # -- lifecycle ---------------------------------------------------
+
+    def close(self) -> None:
+        with self._lock:
+            self._drop_connection()
+            if self._shm is not None:
+                self._shm.close()
+                self._shm.unlink()
+                self._shm = None
+
+    def __enter__(self) -> "RenderClient":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+
+# ---------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m bangla_render.server",
+        description="Local Bangla render daemon (Unix socket).",
+    )
+    parser.add_argument("--socket", default=None, help="socket path (default: $XDG_RUNTIME_DIR/bangla_render-<uid>.sock)")
+    parser.add_argument("--font", action="append", default=[], help="font file to register (repeatable)")
+    parser.add_argument("--default-font", default=None, help="default font family")
+    parser.add_argument("--cache-size", type=int, default=None, help="render cache entries")
+    args = parser.parse_args(argv)
+
+    from .backend import init_renderer
+    from .fonts import register_fonts, set_default_font
+    from .renderer import set_render_cache_maxsize
+
+    init_renderer(headless=True)
+    if args.font:
+        register_fonts(args.font)
+    if args.default_font:
+        set_default_font(font_family=args.default_font)
+    if args.cache_size:
+        set_render_cache_maxsize(args.cache_size)
+
+    server = RenderServer(args.socket)
+    print(f"bangla_render server listening on {server.socket_path}", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+
+__all__ = [
+    "RenderServer",
+    "RenderClient",
+    "default_socket_path",
+    "main",
+]
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
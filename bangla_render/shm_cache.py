@@ -0,0 +1,381 @@
+# bangla_render/shm_cache.py
+"""
+Cross-process render cache on a memory-mapped arena file.
+
+Worker processes on one host map the same file (on ``/dev/shm`` when
+available) and share rendered label bitmaps through it:
+
+- a fixed open-addressing slot table indexed by a 64-bit BLAKE2b hash of
+  the render cache key (linear probing, ``_MAX_PROBE`` slots);
+- a bump-allocated data region holding, per entry, the full key bytes
+  followed by the pixels; a lookup only hits when the stored key equals
+  the requested one, so hash collisions are misses, never wrong bitmaps;
+  when the region is full the arena is reset (slot table cleared,
+  generation bumped) instead of compacted;
+- writers serialize on an ``fcntl.flock`` of the arena file; a file with
+  a foreign or outdated layout is never truncated in place (processes
+  still mapping it would fault) but replaced by a fresh file;
+- readers take no lock: every slot carries a sequence counter that is odd
+  while the slot is written, and a read is only accepted when the counter
+  and the arena generation are unchanged after the pixels were copied.
+
+``get_view`` returns zero-copy NumPy views into the arena, valid until the
+arena is next reset.
+"""
+from __future__ import annotations
+
+import hashlib
+import mmap
+import os
+import struct
+import tempfile
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import numpy as np
+
+try:
+    import fcntl
+    FCNTL_AVAILABLE = True
+except Exception:  # pragma: no cover - Windows
+    fcntl = None
+    FCNTL_AVAILABLE = False
+
+
+# ---------------------------------------------------------------------
+# Arena layout
+# ---------------------------------------------------------------------
+#
+# header: magic, version, nslots, data_offset, data_size, bump, generation
+# slot:   seq, fmt, keyhash, offset, width, height   (32 bytes)
+# entry:  key length (u32), key bytes, pixels at the next 64-byte boundary
+
+_MAGIC = b"BRSC"
+_VERSION = 2
+
+_HEADER = struct.Struct("<4sIIxxxxQQQQ")
+_HEADER_SIZE = 64
+_BUMP_OFFSET = 4 + 4 + 4 + 4 + 8 + 8
+_GENERATION_OFFSET = _BUMP_OFFSET + 8
+
+_SLOT = struct.Struct("<IIQQII")
+_SLOT_SIZE = _SLOT.size
+_SEQ = struct.Struct("<I")
+_U32 = struct.Struct("<I")
+_U64 = struct.Struct("<Q")
+
+_MAX_PROBE = 16
+_ALIGN = 64
+
+DEFAULT_ARENA_BYTES = 64 * 1024 * 1024
+DEFAULT_SLOTS = 8192
+
+
+def default_arena_path() -> str:
+    base = "/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir()
+    uid = os.getuid() if hasattr(os, "getuid") else 0
+    return os.path.join(base, f"bangla_render-{uid}.cache")
+
+
+def key_bytes(key: Tuple[Any, ...]) -> bytes:
+    """
+    Canonical byte form of a render cache key, stored with each entry.
+    """
+    return repr(key).encode("utf-8")
+
+
+def key_hash(key: Tuple[Any, ...]) -> int:
+    """
+    Stable 64-bit hash of a render cache key (never 0, which marks an
+    empty slot). ``hash()`` is salted per process, so it cannot be used.
+    """
+    return _bytes_hash(key_bytes(key))
+
+
+def _bytes_hash(kb: bytes) -> int:
+    digest = hashlib.blake2b(kb, digest_size=8).digest()
+    return _U64.unpack(digest)[0] or 1
+
+
+class SharedRenderCache:
+    """
+    A render cache shared by all processes that open the same arena file.
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        size_bytes: int = DEFAULT_ARENA_BYTES,
+        slots: int = DEFAULT_SLOTS,
+    ):
+        if not FCNTL_AVAILABLE:
+            raise RuntimeError("The shared render cache needs fcntl (POSIX only).")
+
+        self.path = path or default_arena_path()
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+
+        fd = self._open_locked()
+        try:
+            fd = self._open_or_init(fd, int(size_bytes), int(slots))
+        except BaseException:
+            os.close(fd)
+            raise
+        fcntl.flock(fd, fcntl.LOCK_UN)
+        self._fd = fd
+
+    def _open_locked(self) -> int:
+        """
+        Open and exclusively lock the arena file at ``self.path``, retrying
+        if another process replaced it while we waited for the lock.
+        """
+        while True:
+            fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX)
+                if _is_current(fd, self.path):
+                    return fd
+            except BaseException:
+                os.close(fd)
+                raise
+            os.close(fd)
+
+    def _open_or_init(self, fd: int, size_bytes: int, slots: int) -> int:
+        # called with ``fd`` locked; returns the (locked) fd to keep
+        existing = os.fstat(fd).st_size
+        if existing >= _HEADER_SIZE:
+            head = os.pread(fd, _HEADER.size, 0)
+            magic, version, nslots, data_offset, data_size, _bump, _gen = _HEADER.unpack(head)
+            if magic == _MAGIC and version == _VERSION and existing == data_offset + data_size:
+                self._map(fd, existing, nslots, data_offset, data_size)
+                return fd
+
+        if slots < 1:
+            raise ValueError("slots must be at least 1")
+        data_offset = _align(_HEADER_SIZE + slots * _SLOT_SIZE)
+        data_size = max(_ALIGN, size_bytes - data_offset)
+        total = data_offset + data_size
+        header = _HEADER.pack(_MAGIC, _VERSION, slots, data_offset, data_size, 0, 0)
+
+        if existing == 0:
+            # freshly created: nobody can have it mapped yet
+            os.ftruncate(fd, total)
+            os.pwrite(fd, header, 0)
+            self._map(fd, total, slots, data_offset, data_size)
+            return fd
+
+        # Another layout (or a damaged file) that other processes may still
+        # map: shrinking it would fault their reads, so build a new file and
+        # swap it in. Old mappings keep the old file until they close.
+        directory = os.path.dirname(os.path.abspath(self.path))
+        new_fd, tmp = tempfile.mkstemp(prefix=".bangla_render-", suffix=".cache", dir=directory)
+        try:
+            fcntl.flock(new_fd, fcntl.LOCK_EX)
+            os.ftruncate(new_fd, total)
+            os.pwrite(new_fd, header, 0)
+            os.replace(tmp, self.path)
+        except BaseException:
+            os.close(new_fd)
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+            raise
+        os.close(fd)
+        self._map(new_fd, total, slots, data_offset, data_size)
+        return new_fd
+
+    def _map(self, fd: int, total: int, nslots: int, data_offset: int, data_size: int) -> None:
+        self._mm = mmap.mmap(fd, total)
+        self._buf = np.frombuffer(self._mm, dtype=np.uint8)
+        self.nslots = nslots
+        self.data_offset = data_offset
+        self.data_size = data_size
+
+    # -- low-level ---------------------------------------------------
+
+    def _slot_pos(self, index: int) -> int:
+        return _HEADER_SIZE + index * _SLOT_SIZE
+
+    def _generation(self) -> int:
+        return _U64.unpack_from(self._mm, _GENERATION_OFFSET)[0]
+
+    def _probe(self, h: int):
+        start = h % self.nslots
+        for i in range(min(_MAX_PROBE, self.nslots)):
+            yield self._slot_pos((start + i) % self.nslots)
+
+    def _find(self, kb: bytes) -> Optional[Tuple[int, ...]]:
+        """
+        Return (slot_pos, seq, generation, fmt, pixel_start, width, height)
+        of a stable slot holding key bytes ``kb``; no lock taken. Slots
+        whose hash matches but whose stored key differs are skipped.
+        """
+        h = _bytes_hash(kb)
+        gen = self._generation()
+        for pos in self._probe(h):
+            seq, fmt, slot_hash, offset, width, height = _SLOT.unpack_from(self._mm, pos)
+            if slot_hash == 0:
+                return None
+            if slot_hash != h or seq & 1:
+                continue
+            start = self.data_offset + offset
+            if not self._holds_key(start, kb):
+                continue
+            return pos, seq, gen, fmt, start + _align(4 + len(kb)), width, height
+        return None
+
+    def _holds_key(self, start: int, kb: bytes) -> bool:
+        klen = _U32.unpack_from(self._mm, start)[0]
+        return klen == len(kb) and self._mm[start + 4:start + 4 + klen] == kb
+
+    def _still_valid(self, pos: int, seq: int, gen: int) -> bool:
+        return _SEQ.unpack_from(self._mm, pos)[0] == seq and self._generation() == gen
+
+    # -- public ------------------------------------------------------
+
+    def get_view(self, key: Tuple[Any, ...]) -> Optional[Tuple[np.ndarray, int]]:
+        """
+        Zero-copy lookup: ``(pixels (H, W, 4) uint8 view, qimage_format)``
+        or None. The view is only valid until the arena is reset.
+        """
+        found = self._find(key_bytes(key))
+        if found is None:
+            return None
+        pos, seq, gen, fmt, start, width, height = found
+        view = self._buf[start:start + width * height * 4].reshape((height, width, 4))
+        if not self._still_valid(pos, seq, gen):
+            return None
+        return view, fmt
+
+    def get(self, key: Tuple[Any, ...], reader: Optional[Callable[[np.ndarray, int], Any]] = None) -> Any:
+        """
+        Lookup that copies the entry out and validates the copy against
+        concurrent writers; updates the hit/miss counters.
+
+        ``reader(view, qimage_format)`` produces the copy (default: a NumPy
+        copy of the pixels), so callers can copy straight into their own
+        container. Returns None on a miss.
+        """
+        found = self._find(key_bytes(key))
+        if found is not None:
+            pos, seq, gen, fmt, start, width, height = found
+            view = self._buf[start:start + width * height * 4].reshape((height, width, 4))
+            value = reader(view, fmt) if reader is not None else view.copy()
+            if self._still_valid(pos, seq, gen):
+                self.hits += 1
+                return value
+        self.misses += 1
+        return None
+
+    def put(self, key: Tuple[Any, ...], pixels: np.ndarray, fmt: int) -> bool:
+        """
+        Store ``(H, W, 4)`` uint8 pixels. Returns False when the image is
+        larger than the whole data region.
+        """
+        pixels = np.ascontiguousarray(pixels, dtype=np.uint8)
+        height, width = pixels.shape[:2]
+        nbytes = pixels.nbytes
+        kb = key_bytes(key)
+        head = _align(4 + len(kb))
+        need = head + _align(nbytes)
+        if need > self.data_size:
+            return False
+
+        h = _bytes_hash(kb)
+        fcntl.flock(self._fd, fcntl.LOCK_EX)
+        try:
+            bump = _U64.unpack_from(self._mm, _BUMP_OFFSET)[0]
+            if bump + need > self.data_size:
+                self._reset_locked()
+                bump = 0
+
+            # an empty slot, or the one already holding this key
+            target = None
+            for pos in self._probe(h):
+                slot_hash, offset = struct.unpack_from("<QQ", self._mm, pos + 8)
+                if slot_hash == 0 or (
+                    slot_hash == h and self._holds_key(self.data_offset + offset, kb)
+                ):
+                    target = pos
+                    break
+            if target is None:
+                # probe window full: evict its first slot
+                target = next(self._probe(h))
+
+            seq = _SEQ.unpack_from(self._mm, target)[0]
+            _SEQ.pack_into(self._mm, target, seq | 1)
+            start = self.data_offset + bump
+            _U32.pack_into(self._mm, start, len(kb))
+            self._mm[start + 4:start + 4 + len(kb)] = kb
+            start += head
+            self._buf[start:start + nbytes] = pixels.reshape(-1)
+            _SLOT.pack_into(self._mm, target, seq | 1, int(fmt), h, bump, width, height)
+            _SEQ.pack_into(self._mm, target, (seq | 1) + 1)
+            _U64.pack_into(self._mm, _BUMP_OFFSET, bump + need)
+        finally:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+        self.stores += 1
+        return True
+
+    def _reset_locked(self) -> None:
+        gen = self._generation()
+        _U64.pack_into(self._mm, _GENERATION_OFFSET, gen + 1)
+        table = self._buf[_HEADER_SIZE:_HEADER_SIZE + self.nslots * _SLOT_SIZE]
+        table[:] = 0
+        _U64.pack_into(self._mm, _BUMP_OFFSET, 0)
+
+    def clear(self) -> None:
+        fcntl.flock(self._fd, fcntl.LOCK_EX)
+        try:
+            self._reset_locked()
+        finally:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+
+    def info(self) -> Dict[str, Any]:
+        used = _U64.unpack_from(self._mm, _BUMP_OFFSET)[0]
+        return {
+            "path": self.path,
+            "hits": self.hits,
+            "misses": self.misses,
+            "stores": self.stores,
+            "slots": self.nslots,
+            "bytes_used": used,
+            "bytes_total": self.data_size,
+            "generation": self._generation(),
+        }
+
+    def close(self) -> None:
+        if getattr(self, "_mm", None) is not None:
+            self._buf = None
+            try:
+                self._mm.close()
+            except BufferError:
+                # outstanding zero-copy views; the mapping goes with them
+                pass
+            self._mm = None
+        if getattr(self, "_fd", None) is not None:
+            os.close(self._fd)
+            self._fd = None
+
+
+def _is_current(fd: int, path: str) -> bool:
+    # the locked fd is still the file at ``path`` (not replaced meanwhile)
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return False
+    own = os.fstat(fd)
+    return (own.st_dev, own.st_ino) == (st.st_dev, st.st_ino)
+
+
+def _align(n: int) -> int:
+    return (n + _ALIGN - 1) // _ALIGN * _ALIGN
+
+
+__all__ = [
+    "SharedRenderCache",
+    "default_arena_path",
+    "key_bytes",
+    "key_hash",
+]
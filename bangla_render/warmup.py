@@ -0,0 +1,301 @@
+# bangla_render/warmup.py
+"""
+Render-cache warm-up.
+
+Pre-render a known label vocabulary (class names, month names, district
+names, numeric ranges) in every style a dashboard uses, so the first
+user-facing figure is served from the cache:
+
+    br.warm_render_cache(["জানুয়ারি", "ফেব্রুয়ারি"], styles=style_grid(font_size=[12, 16]))
+
+or, filling the cross-process tier that worker processes map (or a
+snapshot file to ship with a deployment, see load_render_cache()):
+
+    python -m bangla_render.warmup --file labels.txt --font-size 12 \\
+        --font-size 16 --shared-cache /dev/shm/labels.cache
+    python -m bangla_render.warmup --file labels.txt --save labels.brc
+"""
+from __future__ import annotations
+
+import argparse
+import csv
+import itertools
+import json
+import os
+import time
+from collections.abc import Mapping
+from concurrent.futures import FIRST_COMPLETED, wait
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Union
+
+
+# ---------------------------------------------------------------------
+# Inputs
+# ---------------------------------------------------------------------
+
+def load_vocabulary(
+    source: Union[str, "os.PathLike[str]", Iterable[Any]],
+    column: Optional[str] = None,
+) -> List[str]:
+    """
+    Unique labels, in first-seen order, from a list or other iterable (a
+    pandas Series works as-is), a pandas DataFrame ``column``, a text file
+    with one label per line, or a CSV file ``column``.
+
+    Blank lines and missing values (None / NaN) are skipped.
+    """
+    if isinstance(source, (str, os.PathLike)):
+        path = os.fspath(source)
+        with open(path, encoding="utf-8", newline="") as f:
+            if column is not None:
+                values = [row.get(column) for row in csv.DictReader(f)]
+            else:
+                values = [line.rstrip("\r\n") for line in f]
+    else:
+        values = source[column] if column is not None else source
+
+    seen = set()
+    texts: List[str] = []
+    for value in values:
+        if value is None or value != value:  # NaN
+            continue
+        text = str(value)
+        if not text.strip() or text in seen:
+            continue
+        seen.add(text)
+        texts.append(text)
+    return texts
+
+
+def style_grid(**options: Any) -> List[Dict[str, Any]]:
+    """
+    Every combination of the given render options; list values are the
+    alternatives, anything else is fixed:
+
+        style_grid(font_size=[12, 16], color=["black", "white"], padding=4)
+    """
+    names = list(options)
+    choices = [v if isinstance(v, list) else [v] for v in options.values()]
+    return [dict(zip(names, combo)) for combo in itertools.product(*choices)]
+
+
+# ---------------------------------------------------------------------
+# Warm-up
+# ---------------------------------------------------------------------
+
+def warm_render_cache(
+    texts: Union[str, "os.PathLike[str]", Iterable[Any]],
+    styles: Union[None, Mapping, Sequence[Mapping]] = None,
+    workers: Optional[int] = None,
+    grow_cache: bool = True,
+) -> Dict[str, Any]:
+    """
+    Render every text in every style into the render cache.
+
+    ``texts`` is anything load_vocabulary() accepts; ``styles`` is one
+    dict of render_text_qimage() keyword arguments, a list of them (see
+    style_grid()), or None for the render defaults. Renders run on a
+    RenderExecutor with at most a few batches in flight. With
+    ``grow_cache`` the LRU is enlarged to hold the whole vocabulary, so
+    warming does not evict its own entries.
+
+    Returns a report: ``requested`` (text x style pairs), ``unique``
+    (distinct cache entries after key canonicalization), ``rendered``,
+    ``already_cached``, ``failed`` (plus the first ``errors``),
+    ``coverage`` (fraction of pairs now resident), ``bytes`` (memory the
+    resident entries use) and ``seconds``.
+    """
+    from .engines import get_render_engine
+    from .executor import RenderExecutor
+    from .renderer import (
+        _probe_render_cache,
+        get_render_cache_info,
+        render_text_array,
+        render_text_qimage,
+        set_render_cache_maxsize,
+    )
+
+    texts = load_vocabulary(texts)
+    if styles is None:
+        styles = [{}]
+    elif isinstance(styles, Mapping):
+        styles = [dict(styles)]
+    else:
+        styles = [dict(s) for s in styles]
+
+    engine = get_render_engine()
+    engine.ensure_runtime()
+    render = render_text_qimage if engine.name == "qt" else render_text_array
+
+    t0 = time.perf_counter()
+    jobs = []
+    errors: List[Dict[str, Any]] = []
+    failed = 0
+    for style in styles:
+        for text in texts:
+            try:
+                key, nbytes = _probe_render_cache(text, **style)
+            except Exception as e:
+                failed += 1
+                if len(errors) < 10:
+                    errors.append({"text": text, "style": style, "error": repr(e)})
+                continue
+            jobs.append((text, style, key, nbytes is not None))
+
+    keys = {key for _, _, key, _ in jobs}
+    already = {key for _, _, key, hit in jobs if hit}
+    if grow_cache:
+        info = get_render_cache_info()
+        needed = info["size"] + len(keys - already)
+        if needed > info["maxsize"]:
+            set_render_cache_maxsize(needed)
+
+    # one render per distinct key; duplicates are hits once it is cached
+    todo = {}
+    for text, style, key, hit in jobs:
+        if not hit and key not in todo:
+            todo[key] = (text, style)
+
+    with RenderExecutor(workers=workers) as ex:
+        window = 4 * ex.workers
+        pending = {}
+        queue = iter(todo.values())
+        while True:
+            for text, style in itertools.islice(queue, window - len(pending)):
+                pending[ex.submit_call(render, text, **style)] = (text, style)
+            if not pending:
+                break
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                text, style = pending.pop(future)
+                try:
+                    future.result()
+                except Exception as e:
+                    failed += 1
+                    if len(errors) < 10:
+                        errors.append({"text": text, "style": style, "error": repr(e)})
+
+    resident = 0
+    resident_bytes = {}
+    for text, style, key, _ in jobs:
+        _, nbytes = _probe_render_cache(text, **style)
+        if nbytes is not None:
+            resident += 1
+            resident_bytes[key] = nbytes
+
+    requested = len(texts) * len(styles)
+    return {
+        "texts": len(texts),
+        "styles": len(styles),
+        "requested": requested,
+        "unique": len(keys),
+        "rendered": len(set(todo) & set(resident_bytes)),
+        "already_cached": len(already),
+        "failed": failed,
+        "coverage": resident / requested if requested else 1.0,
+        "bytes": sum(resident_bytes.values()),
+        "seconds": time.perf_counter() - t0,
+        "cache": get_render_cache_info(),
+        "errors": errors,
+    }
+
+
+# ---------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------
+
+def _parse_range(spec: str) -> range:
+    parts = [int(p) for p in spec.split(":")]
+    if not 1 <= len(parts) <= 3:
+        raise argparse.ArgumentTypeError(f"expected START:STOP[:STEP], got {spec!r}")
+    if len(parts) == 1:
+        return range(parts[0])
+    return range(*parts)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m bangla_render.warmup",
+        description="Pre-render a label vocabulary into the render cache.",
+    )
+    parser.add_argument("texts", nargs="*", help="labels to render")
+    parser.add_argument("--file", action="append", default=[], help="text file, one label per line (repeatable)")
+    parser.add_argument("--csv", default=None, help="CSV file to read labels from (with --column)")
+    parser.add_argument("--column", default=None, help="CSV column holding the labels")
+    parser.add_argument("--range", action="append", default=[], type=_parse_range,
+                        help="numeric labels START:STOP[:STEP] (repeatable)")
+    parser.add_argument("--bangla-digits", action="store_true", help="write --range numbers with Bengali digits")
+    parser.add_argument("--font", action="append", default=[], help="font file to register (repeatable)")
+    parser.add_argument("--font-family", action="append", default=[], help="font family (repeatable)")
+    parser.add_argument("--font-size", action="append", default=[], type=int, help="font size (repeatable)")
+    parser.add_argument("--color", action="append", default=[], help="text colour (repeatable)")
+    parser.add_argument("--bg", default=None, help="background colour")
+    parser.add_argument("--backend", default=None, help="render backend (qt, harfbuzz, pillow)")
+    parser.add_argument("--workers", type=int, default=None, help="render threads")
+    parser.add_argument("--shared-cache", default=None, help="also fill the shared render cache at this path")
+    parser.add_argument("--shared-size-mb", type=int, default=64, help="shared cache size")
+    parser.add_argument("--save", default=None, help="write the warmed cache to this snapshot file")
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    args = parser.parse_args(argv)
+
+    from .backend import init_renderer
+    from .fonts import register_fonts
+    from .mpl_support import to_bangla_numerals
+    from .renderer import enable_shared_render_cache, save_render_cache
+
+    texts: List[str] = list(args.texts)
+    for path in args.file:
+        texts.extend(load_vocabulary(path))
+    if args.csv:
+        if not args.column:
+            parser.error("--csv needs --column")
+        texts.extend(load_vocabulary(args.csv, column=args.column))
+    for numbers in args.range:
+        texts.extend(to_bangla_numerals(n) if args.bangla_digits else str(n) for n in numbers)
+    if not texts:
+        parser.error("no labels given")
+
+    init_renderer(headless=True, backend=args.backend)
+    if args.font:
+        register_fonts(args.font)
+    if args.shared_cache:
+        enable_shared_render_cache(args.shared_cache, size_mb=args.shared_size_mb)
+
+    options: Dict[str, Any] = {}
+    if args.font_family:
+        options["font_family"] = args.font_family
+    if args.font_size:
+        options["font_size"] = args.font_size
+    if args.color:
+        options["color"] = args.color
+    if args.bg is not None:
+        options["bg"] = args.bg
+
+    report = warm_render_cache(texts, style_grid(**options), workers=args.workers)
+    if args.save:
+        report["snapshot"] = save_render_cache(args.save)
+    if args.json:
+        print(json.dumps(report, ensure_ascii=False, indent=2, default=str))
+    else:
+        print(
+            f"warmed {report['unique']} entries ({report['requested']} label x style pairs) "
+            f"in {report['seconds']:.2f} s: coverage {report['coverage']:.1%}, "
+            f"{report['bytes'] / 1024:.1f} KiB, {report['failed']} failed",
+            flush=True,
+        )
+        for err in report["errors"]:
+            print(f"  {err['text']!r} {err['style']}: {err['error']}")
+        if args.save:
+            print(f"saved {report['snapshot']['entries']} entries to {args.save}", flush=True)
+    return 1 if report["failed"] else 0
+
+
+__all__ = [
+    "load_vocabulary",
+    "style_grid",
+    "warm_render_cache",
+    "main",
+]
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
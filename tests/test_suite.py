@@ -5,6 +5,7 @@ import json
 import time
 import statistics
 import platform
+import tempfile
 import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.patches import Rectangle
@@ -14,6 +15,9 @@ ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 if ROOT_DIR not in sys.path:
     sys.path.insert(0, ROOT_DIR)
 
+# persistent caches (font catalogue, validation memo) stay out of ~/.cache
+os.environ["BANGLA_RENDER_CACHE_DIR"] = tempfile.mkdtemp(prefix="bangla_render-tests-")
+
 import bangla_render as br
 from bangla_render.layout import get_layout_manager
 
@@ -172,6 +176,67 @@ def capture_debug_info(fig, ax, case_name):
 # BENCHMARK
 # ─────────────────────────────────────────────────────────────────────
 
+_IMPORT_PROBE = """
+import json, sys, time
+t0 = time.perf_counter()
+import bangla_render
+t1 = time.perf_counter()
+heavy = sorted({m.split(".")[0] for m in sys.modules} & {"PySide6", "matplotlib"})
+bangla_render.render_text_qimage
+t2 = time.perf_counter()
+print(json.dumps([(t1 - t0) * 1000.0, (t2 - t1) * 1000.0, heavy]))
+"""
+
+
+def measure_import_time(repeats=5):
+    """
+    Time ``import bangla_render`` and the first render-function lookup in
+    fresh interpreters, and list heavy modules pulled in by the bare import.
+    """
+    import subprocess
+
+    paths = [ROOT_DIR] + [p for p in os.environ.get("PYTHONPATH", "").split(os.pathsep) if p]
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(paths))
+    imports, first_use, heavy = [], [], set()
+    for _ in range(repeats):
+        out = subprocess.run([sys.executable, "-c", _IMPORT_PROBE], env=env,
+                             capture_output=True, text=True, check=True).stdout
+        t_import, t_first, mods = json.loads(out.strip().splitlines()[-1])
+        imports.append(t_import); first_use.append(t_first); heavy.update(mods)
+    return {"import_ms": round(statistics.median(imports), 2),
+            "first_render_lookup_ms": round(statistics.median(first_use), 2),
+            "heavy_modules": sorted(heavy)}
+
+
+def benchmark_engines(cases, font, measure=30):
+    """
+    Cold-cache and cache-hit render_text_array() latency per available
+    render backend, for the same (text, font_size) cases.
+    """
+    engines = [n for n, ok in br.available_render_engines().items() if ok]
+    previous = br.get_renderer_status()["backend"]
+    out = {}
+    try:
+        for name in engines:
+            br.init_renderer(backend=name)
+            cold, hit = [], []
+            for _label, text, fs in cases:
+                br.render_text_array(text, font_family=font, font_size=fs)
+                for _ in range(measure):
+                    br.clear_render_cache()
+                    t0 = time.perf_counter()
+                    br.render_text_array(text, font_family=font, font_size=fs)
+                    cold.append((time.perf_counter() - t0) * 1000.0)
+                    t0 = time.perf_counter()
+                    br.render_text_array(text, font_family=font, font_size=fs)
+                    hit.append((time.perf_counter() - t0) * 1000.0)
+            out[name] = {"cold_median_ms": round(statistics.median(cold), 3),
+                         "hit_median_ms": round(statistics.median(hit), 4)}
+    finally:
+        br.init_renderer(backend=previous)
+    return out
+
+
 def run_benchmark():
     print("\n" + "=" * 62)
     print("BENCHMARK: bangla-render render latency")
@@ -271,6 +336,9 @@ def run_benchmark():
     bmed = statistics.median(batch_times)
     pcell = bmed / len(hm_labels)
 
+    import_times = measure_import_time()
+    engine_times = benchmark_engines(cases, font)
+
     all_med  = [x["median_ms"] for x in results]
     sim_med  = [x["median_ms"] for x in results[:4]]
     cplx_med = [x["median_ms"] for x in results[4:8]]
@@ -283,6 +351,13 @@ def run_benchmark():
         f"Labels / titles     : {min(lbl_med):.2f} – {max(lbl_med):.2f} ms",
         f"Cache hit (median)  : sub-millisecond",
         f"6×6 heatmap batch   : {bmed:.1f} ms total / {pcell:.2f} ms per cell",
+        f"import bangla_render: {import_times['import_ms']:.1f} ms "
+        f"(+{import_times['first_render_lookup_ms']:.1f} ms to load Qt on first use)",
+    ] + [
+        f"Backend {name:<12}: {t['cold_median_ms']:.2f} ms cold / "
+        f"{t['hit_median_ms']:.3f} ms cached (median)"
+        for name, t in engine_times.items()
+    ] + [
         f"Reps per case       : {MEASURE} (cold cache, warmup={WARMUP})",
         f"Machine             : {platform.system()} {platform.release()}, "
         f"Python {platform.python_version()}",
@@ -318,6 +393,8 @@ def run_benchmark():
             "heatmap_batch": {"num_cells": len(hm_labels),
                               "total_median_ms": round(bmed, 2),
                               "per_cell_ms": round(pcell, 2)},
+            "import_time": import_times,
+            "backends": engine_times,
         }, f, ensure_ascii=False, indent=2)
 
     print(f"\nSaved: {txt_path}")
@@ -355,6 +432,827 @@ def test_paragraph():
     print("Rendered paragraph ->", p)
 
 
+def test_paragraph_cache():
+    para = ("বাংলা ভাষা বিশ্বের অন্যতম সমৃদ্ধ ও মধুর ভাষা। "
+            "মানুষ এই ভাষায় হাসি, দুঃখ, রাগ ও ভালোবাসা প্রকাশ করে।")
+    br.clear_render_cache()
+    first  = br.render_paragraph_qimage(para, width=500, font_size=24)
+    second = br.render_paragraph_qimage(para, width=500, font_size=24)
+    assert (first.width(), first.height()) == (second.width(), second.height())
+    assert br.get_render_cache_info()["paragraph_layouts"] == 1
+
+    narrow = br.render_paragraph_qimage(para, width=250, font_size=24)
+    assert narrow.height() > first.height()
+    assert br.get_render_cache_info()["paragraph_layouts"] == 2
+
+    # a word wider than the paragraph is clipped at its width when trimmed
+    word = "Supercalifragilisticexpialidocious"
+    for height in (None, 200):
+        wide = br.render_paragraph_qimage(word, width=150, height=height, font_size=24, trim=True)
+        assert wide.width() <= 150
+    print("Paragraph cache:", br.get_render_cache_info())
+
+
+def test_paragraph_tiles():
+    para = "বাংলা ভাষা বিশ্বের অন্যতম সমৃদ্ধ ও মধুর ভাষা। " * 40
+    full  = br.render_paragraph_qimage(para, width=500, font_size=24)
+    tiles = br.render_paragraph_tiles(para, width=500, font_size=24, tile_height=128)
+    assert (tiles.width, tiles.height) == (full.width(), full.height())
+    assert len(tiles) == -(-full.height() // 128)
+
+    stacked = np.concatenate([arr for _, arr in tiles.iter_arrays()], axis=0)
+    assert stacked.shape == (full.height(), full.width(), 4)
+    last = tiles[-1]
+    assert last.height() == full.height() - 128 * (len(tiles) - 1)
+    print("Paragraph tiles:", len(tiles), "x", tiles.tile_height, "px")
+
+
+def test_measure_texts():
+    words = ["আমি", "বাংলায়", "গান", "গাই"]
+    batch = br.measure_texts(words, font_size=32)
+    assert len(batch) == len(words)
+    for w, m in zip(words, batch):
+        single = br.measure_text(w, font_size=32)
+        assert m["text_width_px"] == single["text_width_px"]
+        assert m["image_height_px"] == single["image_height_px"]
+    assert br.get_font_pool_info()["size"] >= 1
+    print("Batch measure:", [m["text_width_px"] for m in batch])
+
+
+def test_render_executor():
+    words = ["আমি", "বাংলায়", "গান", "গাই"] * 25
+    br.clear_render_cache()
+    with br.RenderExecutor(workers=4) as ex:
+        images = ex.map(words, font_size=28)
+        para = ex.submit_paragraph("বাংলা ভাষা বিশ্বের অন্যতম সমৃদ্ধ ভাষা। " * 5,
+                                   width=400).result()
+    assert len(images) == len(words)
+    for w, img in zip(words[:4], images[:4]):
+        ref = br.render_text_qimage(w, font_size=28)
+        assert (img.width(), img.height()) == (ref.width(), ref.height())
+    assert para.width() > 0 and para.height() > 0
+    print("Threaded render:", len(images), "images,", br.get_render_cache_info())
+
+
+def _pool_job_figure(title, values):
+    fig, ax = plt.subplots(figsize=(4, 3))
+    ax.bar(range(len(values)), values)
+    br.set_bangla_title(ax, title, font_size=24, zoom=0.40)
+    br.apply_bangla_layout(fig, auto=True)
+    return fig
+
+
+def test_figure_pool():
+    titles = ["প্রথম চিত্র", "দ্বিতীয় চিত্র", "তৃতীয় চিত্র", "চতুর্থ চিত্র"]
+    jobs = [
+        br.FigureJob(
+            func=_pool_job_figure,
+            args=(t, [i + 1, 3, 2]),
+            output_path=os.path.join(OUT_DIR, f"pool_figure_{i}.png"),
+            savefig_kwargs={"dpi": 100},
+        )
+        for i, t in enumerate(titles)
+    ]
+    default_font = br.resolve_font()
+    for method in ("spawn", None):
+        with br.FigurePool(processes=2, default_font=default_font,
+                           start_method=method) as pool:
+            results = list(pool.imap(jobs))
+        assert [r.index for r in results] == list(range(len(jobs)))
+        assert all(r.ok for r in results), [r.error for r in results]
+        assert all(os.path.exists(r.output_path) for r in results)
+    print("Figure pool:", len(results), "figures from",
+          len({r.worker_pid for r in results}), "workers")
+
+
+def test_async_render():
+    import asyncio
+
+    words = ["আমি", "বাংলায়", "গান", "গাই"]
+
+    async def main():
+        before = br.get_async_render_stats()
+        same = await asyncio.gather(
+            *(br.render_text_async("একই লেখা", font_size=30) for _ in range(8))
+        )
+        many = await br.render_texts_async(words, font_size=28)
+        para = await br.render_paragraph_async("বাংলা ভাষা " * 20, width=300)
+        # spellings of one cache key share a render
+        mid = br.get_async_render_stats()
+        await asyncio.gather(
+            br.render_text_async("Key spelling", font_size=30, color="k"),
+            br.render_text_async("Key spelling", font_size=30, color=(0, 0, 0)),
+            br.render_text_async("Key spelling", font_size=30, color="#000000"),
+        )
+        return before, same, many, para, mid
+
+    br.clear_render_cache()
+    before, same, many, para, mid = asyncio.run(main())
+    stats = br.get_async_render_stats()
+    assert stats["coalesced"] - mid["coalesced"] == 2
+    assert stats["coalesced"] - before["coalesced"] >= 9
+    assert stats["in_flight"] == 0
+    assert len({(img.width(), img.height()) for img in same}) == 1
+    for w, img in zip(words, many):
+        ref = br.render_text_qimage(w, font_size=28)
+        assert (img.width(), img.height()) == (ref.width(), ref.height())
+    assert para.width() > 0 and para.height() > 0
+    print("Async render:", stats)
+
+
+def test_render_server():
+    import tempfile
+    import threading
+
+    sock_path = os.path.join(tempfile.mkdtemp(), "render.sock")
+    server = br.RenderServer(sock_path)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        words = ["আমি", "বাংলায়", "গান", "গাই"]
+        with br.RenderClient(sock_path) as client:
+            assert client.ping()
+            arrays = client.render_many(words, font_size=28, color=(200, 0, 0, 255))
+            mixed = client.render_many([{"text": "লাল", "color": "red"}, "কালো"])
+            masks = client.render_many(words[:2], font_size=28, mode="alpha")
+            try:
+                client.render_many(["x"], no_such_option=1)
+            except RuntimeError:
+                pass
+            else:
+                raise AssertionError("a failing render should be reported")
+            stats = client.stats()
+        with br.RenderClient(sock_path, arena_size=0) as inline_client:
+            inline = inline_client.render_many(words, font_size=28, color=(200, 0, 0, 255))
+        # a second server must not take over a live daemon's socket
+        try:
+            br.RenderServer(sock_path)
+        except RuntimeError:
+            pass
+        else:
+            raise AssertionError("a live server socket was replaced")
+        with br.RenderClient(sock_path, arena_size=0) as probe:
+            assert probe.ping()
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    # a stale socket file (nothing listening) is replaced
+    import socket
+    stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    stale.bind(sock_path)
+    stale.close()
+    br.RenderServer(sock_path).server_close()
+
+    for w, arr, arr2 in zip(words, arrays, inline):
+        ref = br.render_text_qimage(w, font_size=28, color=(200, 0, 0, 255))
+        assert arr.shape == (ref.height(), ref.width(), 4)
+        assert np.array_equal(arr, arr2)
+    ref = br.render_text_qimage("লাল", color="red")
+    assert len(mixed) == 2 and mixed[0].shape == (ref.height(), ref.width(), 4)
+    for w, mask in zip(words, masks):
+        assert np.array_equal(mask, br.render_text_array(w, font_size=28, mode="alpha"))
+    assert stats["items"] == len(words) + 4
+    assert stats["shm_batches"] >= 2
+    assert stats["errors"] == 1
+    print("Render server:", {k: stats[k] for k in ("requests", "items", "shm_batches")})
+
+
+
+def test_import_time():
+    stats = measure_import_time(repeats=3)
+    assert stats["heavy_modules"] == [], stats
+    # wall-clock time is only reported: it varies too much between machines
+    print("Import time:", stats)
+
+
+_APP_MODE_PROBE = """
+import json, sys
+import bangla_render as br
+br.init_renderer(headless=True)
+status = br.get_renderer_status()
+print(json.dumps([status["app_mode"], status["app_class"], "PySide6.QtWidgets" in sys.modules]))
+"""
+
+
+def test_lean_app_mode():
+    import subprocess
+
+    paths = [ROOT_DIR] + [p for p in os.environ.get("PYTHONPATH", "").split(os.pathsep) if p]
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(paths))
+    out = subprocess.run([sys.executable, "-c", _APP_MODE_PROBE], env=env,
+                         capture_output=True, text=True, check=True).stdout
+    mode, app_class, widgets_loaded = json.loads(out.strip().splitlines()[-1])
+    assert (mode, app_class, widgets_loaded) == ("gui", "QGuiApplication", False)
+
+    status = br.get_renderer_status()
+    assert status["app_mode"] in ("gui", "widgets")
+    print("Headless app mode:", mode, "| this process:", status["app_mode"])
+
+
+def test_harfbuzz_engine():
+    if not br.available_render_engines().get("harfbuzz"):
+        print("HarfBuzz engine: uharfbuzz/freetype-py not installed, skipped")
+        return
+
+    text = "বাংলা লেখা"
+    family = br.resolve_font()
+    qt_arr = br.render_text_array(text, font_family=family, font_size=32)
+    qt_metrics = br.measure_text(text, font_family=family, font_size=32)
+    try:
+        assert br.init_renderer(backend="harfbuzz") is None
+        assert br.get_renderer_status()["backend"] == "harfbuzz"
+        br.clear_render_cache()
+        arr = br.render_text_array(text, font_family=family, font_size=32)
+        again = br.render_text_array(text, font_family=family, font_size=32)
+        hb_metrics = br.measure_text(text, font_family=family, font_size=32)
+        glyphs = br.get_render_engine().shape(text, family, 32)
+        assert br.get_render_cache_info()["size"] == 1
+        qimg = br.render_text_qimage(text, font_family=family, font_size=32)
+    finally:
+        br.init_renderer(backend="qt")
+
+    assert arr.dtype == np.uint8 and arr.ndim == 3 and arr.shape[2] == 4
+    assert np.array_equal(arr, again)
+    assert (qimg.width(), qimg.height()) == (arr.shape[1], arr.shape[0])
+    assert set(hb_metrics) == set(qt_metrics)
+    assert abs(hb_metrics["ascent_px"] - qt_metrics["ascent_px"]) <= 2
+    if qt_arr[..., 3].any():
+        assert abs(arr.shape[0] - qt_arr.shape[0]) <= 4
+    assert len(glyphs) > 0
+    print("HarfBuzz engine:", arr.shape, "vs Qt", qt_arr.shape, "|", len(glyphs), "glyphs")
+
+
+def test_pillow_engine():
+    env = br.check_environment()
+    assert set(env["backends"]) >= {"qt", "harfbuzz", "pillow"}
+    assert env["backend"] == "qt"
+    if not env["backends"]["pillow"]:
+        print("Pillow engine: Pillow without libraqm, skipped")
+        return
+
+    text = "বাংলা লেখা"
+    family = br.resolve_font()
+    try:
+        br.init_renderer(backend="pillow")
+        br.clear_render_cache()
+        arr = br.render_text_array(text, font_family=family, font_size=32, color="#c00000")
+        again = br.render_text_array(text, font_family=family, font_size=32, color="#c00000")
+        metrics = br.measure_text(text, font_family=family, font_size=32)
+    finally:
+        br.init_renderer(backend="qt")
+    assert arr.dtype == np.uint8 and arr.shape[2] == 4 and arr[..., 3].any()
+    assert np.array_equal(arr, again)
+    assert metrics["text_width_px"] > 0
+    print("Pillow engine:", arr.shape)
+
+
+def test_font_fallback():
+    import matplotlib
+    from bangla_render.coverage import parse_cmap, read_font_table
+
+    cmr10 = os.path.join(matplotlib.get_data_path(), "fonts", "ttf", "cmr10.ttf")
+    coverage = parse_cmap(read_font_table(cmr10, "cmap"))
+    assert ord("A") in coverage and ord("⇒") not in coverage
+
+    br.init_renderer()
+    # family lookups are cached until a font is registered, and so are
+    # labels whose fallback runs the new font may change
+    br.render_text_array("Hello ⇒", font_size=20)
+    assert br.get_render_cache_info()["size"] > 0
+    cmb10 = os.path.join(matplotlib.get_data_path(), "fonts", "ttf", "cmb10.ttf")
+    assert "cmb10" not in br.list_available_fonts()
+    br.register_font(cmb10)
+    assert "cmb10" in br.list_available_fonts() and br.resolve_font("CMB10") == "cmb10"
+    assert br.get_render_cache_info()["size"] == 0
+
+    family = br.register_font(cmr10)[0]
+    fallback = br.get_render_engine().find_family("DejaVu Sans")
+    if fallback is None:
+        print("Font fallback: DejaVu Sans not installed, skipped")
+        return
+
+    text = "Hello ⇒ World"
+    runs = br.segment_text(text, font_family=family)
+    assert "".join(sub for sub, _f in runs) == text
+    assert [f for _s, f in runs] == [family, fallback, family]
+    # a combining mark stays with its base character
+    assert len(br.segment_text("e\u0301", font_family=family)) == 1
+
+    arr = br.render_text_array(text, font_family=family, font_size=32, trim=False)
+    m = br.measure_text(text, font_family=family, font_size=32)
+    assert arr.shape[:2] == (m["image_height_px"], m["image_width_px"])
+    assert arr[..., 3].any()
+
+    try:
+        br.set_fallback_fonts(enabled=False)
+        assert br.segment_text(text, font_family=family) == [(text, family)]
+    finally:
+        br.set_fallback_fonts()
+    print("Font fallback:", runs)
+
+
+def test_font_catalog():
+    import shutil
+    import tempfile
+    import matplotlib
+    from bangla_render.font_catalog import FontCatalog
+
+    src = os.path.join(matplotlib.get_data_path(), "fonts", "ttf")
+    with tempfile.TemporaryDirectory() as tmp:
+        font_dir = os.path.join(tmp, "fonts", "ttf")
+        os.makedirs(font_dir)
+        for name in ("DejaVuSans.ttf", "cmr10.ttf"):
+            shutil.copy(os.path.join(src, name), font_dir)
+        path = os.path.join(tmp, "catalog.json")
+
+        first = FontCatalog(path=path, dirs=[os.path.join(tmp, "fonts")])
+        assert first.refresh() is True
+        assert first.families() == ["DejaVu Sans", "cmr10"]
+        assert first.lookup("dejavu sans") == "DejaVu Sans"
+        assert first.bengali_families() == []
+        face = first.faces("cmr10")[0]
+        assert face["path"].endswith("cmr10.ttf") and face["fingerprint"]
+
+        # a second process loads the file and does not rescan
+        second = FontCatalog(path=path, dirs=[os.path.join(tmp, "fonts")])
+        assert second.refresh() is False
+        assert second.families() == first.families()
+        assert second.info()["loaded"] and second.info()["files_read"] == 0
+
+        # a new file changes the directory mtime; only that file is read
+        shutil.copy(os.path.join(src, "STIXGeneral.ttf"), font_dir)
+        third = FontCatalog(path=path, dirs=[os.path.join(tmp, "fonts")])
+        assert third.refresh() is True
+        assert third.info()["files_read"] == 1
+        assert "STIXGeneral" in third.families()
+
+        try:
+            catalog = br.set_font_catalog(path=path, dirs=[os.path.join(tmp, "fonts")])
+            assert br.get_font_catalog_info()["families"] == 3
+            assert catalog.lookup("CMR10") == "cmr10"
+            # listing still comes from Qt, which sees more than the catalogue
+            registered = {f for families in br.list_registered_fonts().values() for f in families}
+            assert registered <= set(br.list_available_fonts())
+        finally:
+            br.set_font_catalog(enabled=False)
+    print("Font catalogue:", third.info()["faces"], "faces")
+
+
+def test_font_validation_cache():
+    import tempfile
+
+    family = br.resolve_font()
+    sample = "বাংলা validation probe"
+    br.clear_font_validation_cache(family)
+    with tempfile.TemporaryDirectory() as tmp:
+        store = os.path.join(tmp, "validation.json")
+        try:
+            br.set_font_validation_cache(persist=True, path=store)
+            first = br.validate_font(family, sample_text=sample)
+            second = br.validate_font(family, sample_text=sample)
+            assert not first["cached"] and second["cached"]
+            assert first["ok"] == second["ok"]
+            assert second["fingerprint"] == first["fingerprint"]
+
+            info = br.font_info(family)
+            assert any(v["sample_text"] == sample for v in info["validation"])
+
+            with open(store, encoding="utf-8") as f:
+                persisted = json.load(f)["results"]
+            if first["fingerprint"]:
+                assert any(r["sample_text"] == sample for r in persisted)
+
+            assert br.clear_font_validation_cache(family) >= 1
+            assert not br.validate_font(family, sample_text=sample)["cached"]
+
+            # a system family with no registered file is re-validated on registration
+            import matplotlib
+            ghost = "DejaVu Sans Mono"
+            assert br.validate_font(ghost, sample_text=sample)["fingerprint"] is None
+            assert br.validate_font(ghost, sample_text=sample)["cached"]
+            br.register_font(os.path.join(matplotlib.get_data_path(), "fonts", "ttf", "cmr10.ttf"))
+            assert not br.validate_font(ghost, sample_text=sample)["cached"]
+        finally:
+            br.set_font_validation_cache(persist=False)
+    print("Font validation cache:", first["fingerprint"])
+
+
+def test_register_font_directory():
+    import shutil
+    import tempfile
+    import matplotlib
+
+    src = os.path.join(matplotlib.get_data_path(), "fonts", "ttf")
+    br.init_renderer()
+    with tempfile.TemporaryDirectory() as tmp:
+        nested = os.path.join(tmp, "a", "b")
+        os.makedirs(nested)
+        shutil.copy(os.path.join(src, "cmr10.ttf"), tmp)
+        shutil.copy(os.path.join(src, "cmss10.ttf"), nested)
+        # same bytes under another name: skipped by fingerprint
+        shutil.copy(os.path.join(src, "cmss10.ttf"), os.path.join(nested, "copy.TTF"))
+        with open(os.path.join(tmp, "notes.txt"), "w") as f:
+            f.write("not a font")
+
+        flat = br.register_font_directory(tmp, recursive=False, workers=2)
+        assert flat["stats"]["files"] == 1
+        assert flat["families"] == {"cmr10": [os.path.join(tmp, "cmr10.ttf")]}
+
+        result = br.register_font_directory(tmp, workers=2, from_data=True)
+        stats = result["stats"]
+        assert stats["files"] == 3 and stats["failed"] == 0
+        assert stats["registered"] == 1 and stats["skipped"] == 2
+        assert sorted(result["families"]["cmss10"]) == sorted(
+            [os.path.join(nested, "cmss10.ttf"), os.path.join(nested, "copy.TTF")]
+        )
+        assert any("cmss10" in fams for fams in br.list_registered_fonts().values())
+        assert stats["total_s"] >= stats["register_s"] >= 0
+    print("Font directory:", stats)
+
+
+def test_cache_key_canonicalization():
+    br.init_renderer()
+    br.clear_render_cache()
+    for color in ("black", "#000000", "k", (0, 0, 0)):
+        br.render_text_qimage("বাংলা", color=color, font_size=24)
+    assert br.get_render_cache_info()["size"] == 1
+
+    red = br.render_text_array("Red", color=(1.0, 0.0, 0.0), font_size=24)
+    ink = red[..., 3] > 200
+    assert ink.any() and (red[ink][:, 0] > 200).all()
+    br.render_text_array("Red", color="r", font_size=24)
+    br.render_text_array("Red", color="#ff0000", font_size=12, scale=2.0)
+
+    # precomposed U+09DF is a composition exclusion: NFC is য + nukta
+    nfc = br.render_text_array("\u09df", font_size=24)
+    nfd = br.render_text_array("\u09af\u09bc", font_size=24)
+    assert np.array_equal(nfc, nfd)
+
+    info = br.get_render_cache_info()
+    assert info["size"] == 3
+    assert info["duplicates_avoided"] == 3 + 2 + 1
+    br.clear_render_cache()
+    assert br.get_render_cache_info()["duplicates_avoided"] == 0
+    print("Cache key canonicalization:", info)
+
+
+def test_warm_render_cache():
+    import tempfile
+    from bangla_render.warmup import main as warmup_main
+
+    br.init_renderer()
+    br.clear_render_cache()
+    vocab = ["জানুয়ারি", "ফেব্রুয়ারি", None, "মার্চ", "মার্চ", "Red"]
+    assert br.load_vocabulary(vocab) == ["জানুয়ারি", "ফেব্রুয়ারি", "মার্চ", "Red"]
+
+    styles = br.style_grid(font_size=[12, 16], color=["black", "k"])
+    assert len(styles) == 4
+    report = br.warm_render_cache(vocab, styles=styles, workers=2)
+    assert report["requested"] == 16 and report["unique"] == 8
+    assert report["rendered"] == 8 and report["failed"] == 0
+    assert report["coverage"] == 1.0 and report["bytes"] > 0
+    assert br.get_render_cache_info()["size"] == 8
+
+    again = br.warm_render_cache(vocab, styles={"font_size": 12})
+    assert again["already_cached"] == 4 and again["rendered"] == 0
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "labels.txt")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("এক\nদুই\n\nএক\n")
+        assert br.load_vocabulary(path) == ["এক", "দুই"]
+        assert warmup_main([
+            "--file", path, "--range", "1:4", "--bangla-digits",
+            "--font-family", br.resolve_font(), "--font-size", "20",
+        ]) == 0
+    assert br.get_render_cache_info()["size"] == 8 + 5
+    print("Warm render cache:", {k: report[k] for k in ("unique", "coverage", "bytes")})
+
+
+def test_render_cache_snapshot():
+    import re
+    import shutil
+    import tempfile
+    import matplotlib
+
+    br.init_renderer()
+    br.clear_render_cache()
+    with tempfile.TemporaryDirectory() as tmp:
+        font = os.path.join(tmp, "cmss10.ttf")
+        shutil.copy(os.path.join(matplotlib.get_data_path(), "fonts", "ttf", "cmss10.ttf"), font)
+        # first, since registering a new font file clears the render cache
+        br.render_text_array("Own font", font_path=font, font_size=22)
+        labels = ["এক", "দুই", "তিন", "Snapshot"]
+        expected = [br.render_text_array(t, font_size=22) for t in labels]
+        br.render_paragraph_qimage("অনুচ্ছেদ " * 20, width=180)
+
+        # snapshots are stamped with __version__, so it must track the package
+        with open(os.path.join(os.path.dirname(__file__), os.pardir, "pyproject.toml"), encoding="utf-8") as f:
+            assert f'version = "{br.__version__}"' in f.read()
+
+        path = os.path.join(tmp, "labels.brc")
+        saved = br.save_render_cache(path)
+        assert saved["entries"] == len(labels) + 2
+
+        br.clear_render_cache()
+        with open(font, "ab") as f:
+            f.write(b"\0" * 64)  # the font file changed since the snapshot
+        loaded = br.load_render_cache(path)
+        assert loaded["loaded"] == len(labels) + 1 and loaded["stale"] == 1
+        assert br.get_render_cache_info()["size"] == len(labels) + 1
+        for text, arr in zip(labels, expected):
+            assert np.array_equal(br.render_text_array(text, font_size=22), arr)
+        assert br.get_render_cache_info()["size"] == len(labels) + 1
+        assert br.load_render_cache(path)["already_cached"] == len(labels) + 1
+
+        if os.path.exists("/proc/self/maps"):
+            import gc
+
+            def mapped():
+                with open("/proc/self/maps") as f:
+                    return path in f.read()
+
+            assert mapped()
+            br.clear_render_cache()
+            gc.collect()
+            assert not mapped()
+
+        bogus = os.path.join(tmp, "bogus.brc")
+        with open(bogus, "wb") as f:
+            f.write(b"not a snapshot")
+        with open(path, "rb") as f:
+            other_layout = re.sub(rb'"key_layout":\d,', b'"key_layout":9,', f.read(), count=1)
+        with open(os.path.join(tmp, "layout.brc"), "wb") as f:
+            f.write(other_layout)
+        for name in (bogus, os.path.join(tmp, "layout.brc")):
+            try:
+                br.load_render_cache(name)
+            except ValueError:
+                pass
+            else:
+                raise AssertionError(f"loading {name} should fail")
+    print("Render cache snapshot:", saved)
+
+
+def test_render_cache_cold_tier():
+    from bangla_render.cold_cache import ColdTier, pack_pixels, unpack_pixels
+
+    # an update too large for the tier still drops the entry it replaces
+    tier = ColdTier(4096, "zlib")
+    assert tier.put(("k",), np.zeros((8, 8, 4), np.uint8)) == []
+    noise = np.random.default_rng(0).integers(0, 256, (64, 64, 4), dtype=np.uint8)
+    assert tier.put(("k",), noise) == [("k",)]
+    assert ("k",) not in tier and tier.info()["bytes"] == 0
+
+    br.init_renderer()
+    br.clear_render_cache()
+    try:
+        br.set_render_cache_maxsize(4)
+        br.set_render_cache_cold_tier(max_mb=4, codec="zlib")
+        labels = [f"Label {i}" for i in range(12)]
+        first = [br.render_text_array(t, font_size=20, color="#3366cc") for t in labels]
+        boxed = br.render_text_array("Boxed", font_size=20, color="white", bg="navy")
+
+        info = br.get_render_cache_info()
+        cold = info["cold"]
+        assert info["size"] == 4 and cold["entries"] == 9
+        assert cold["alpha"] == 9 and cold["bytes"] * 4 < cold["raw_bytes"]
+
+        # promotion restores bit-identical pixels
+        for text, arr in zip(labels, first):
+            assert np.array_equal(br.render_text_array(text, font_size=20, color="#3366cc"), arr)
+        assert br.get_render_cache_info()["cold"]["promotions"] >= 8
+
+        for codec in ("rle", "zlib"):
+            entry = pack_pixels(boxed, codec)
+            assert entry.mode == "planes"
+            assert np.array_equal(unpack_pixels(entry), boxed)
+
+        assert br.set_render_cache_cold_tier(max_mb=0) is None
+        br.render_text_array("আরও", font_size=20)
+        assert br.get_render_cache_info()["cold"] is None
+    finally:
+        br.set_render_cache_cold_tier(max_mb=0)
+        br.set_render_cache_maxsize(256)
+        br.clear_render_cache()
+    print("Render cache cold tier:", cold)
+
+
+def test_alpha_render_mode():
+    from PySide6.QtGui import QImage
+
+    br.init_renderer()
+    br.clear_render_cache()
+    try:
+        for engine in ("qt", "harfbuzz"):
+            if not br.available_render_engines().get(engine):
+                continue
+            br.set_render_engine(engine)
+            rgba = br.render_text_array("Alpha mask", font_size=24, color="black")
+            mask = br.render_text_array("Alpha mask", font_size=24, color="red", mode="alpha")
+            assert mask.dtype == np.uint8 and mask.shape == rgba.shape[:2]
+            assert np.array_equal(mask, rgba[..., 3])
+            # one cached mask serves every colour
+            before = br.get_render_cache_info()["size"]
+            br.render_text_array("Alpha mask", font_size=24, color="navy", mode="alpha")
+            assert br.get_render_cache_info()["size"] == before
+            qimg = br.render_text_qimage("Alpha mask", font_size=24, mode="alpha")
+            assert qimg.format() == QImage.Format.Format_Alpha8
+    finally:
+        br.set_render_engine("qt")
+
+    cmap = br.text_colormap("#3366cc")
+    assert np.allclose(cmap(255), (0.2, 0.4, 0.8, 1.0)) and cmap(0)[3] == 0.0
+
+    try:
+        br.render_text_array("x", mode="grey")
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("unknown modes should be rejected")
+
+    fig, ax = plt.subplots()
+    br.set_bangla_title(ax, "শিরোনাম", color="#3366cc")
+    fig.canvas.draw()
+    plt.close(fig)
+    print("Alpha render mode:", mask.shape, mask.nbytes, "bytes vs", rgba.nbytes)
+
+
+def test_render_into_buffer():
+    br.init_renderer()
+    try:
+        for engine in ("qt", "harfbuzz"):
+            if not br.available_render_engines().get(engine):
+                continue
+            br.set_render_engine(engine)
+            label = br.render_text_array("Into", font_size=24, color="red")
+            h, w = label.shape[:2]
+
+            canvas = np.zeros((80, 120, 4), np.uint8)
+            view = br.render_text_array("Into", font_size=24, color="red", out=canvas, offset=(7, 5), blend="copy")
+            assert view.base is not None and np.shares_memory(view, canvas)
+            assert np.array_equal(canvas[5:5 + h, 7:7 + w], label)
+            assert canvas.sum() == view.sum()
+
+            # source-over onto an empty canvas matches wherever there is ink
+            canvas[:] = 0
+            br.render_text_array("Into", font_size=24, color="red", out=canvas, offset=(7, 5))
+            diff = np.abs(canvas[5:5 + h, 7:7 + w].astype(int) - label)
+            assert diff[..., 3].max() <= 1 and diff[label[..., 3] > 0].max() <= 1
+
+            # clipped at the canvas edge, views of larger arrays work
+            big = np.zeros((60, 200, 4), np.uint8)
+            view = br.render_text_array("Into", font_size=24, color="red", out=big[10:, 20:], offset=(-3, -2), blend="copy")
+            assert np.array_equal(view, label[2:, 3:])
+            assert np.array_equal(big[10:10 + h - 2, 20:20 + w - 3], label[2:, 3:])
+            assert br.render_text_array("Into", out=big, offset=(500, 0)).size == 0
+
+            mask = br.render_text_array("Into", font_size=24, mode="alpha")
+            plane = np.zeros((40, 100), np.uint8)
+            br.render_text_array("Into", font_size=24, mode="alpha", out=plane, offset=(1, 2))
+            assert np.array_equal(plane[2:2 + mask.shape[0], 1:1 + mask.shape[1]], mask)
+    finally:
+        br.set_render_engine("qt")
+
+    for kwargs in ({"out": np.zeros((5, 5), np.uint8)}, {"out": np.zeros((5, 5, 4))},
+                   {"out": np.zeros((5, 5, 4), np.uint8), "blend": "add"}):
+        try:
+            br.render_text_array("x", **kwargs)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError(f"render_text_array should reject {kwargs}")
+    print("Render into buffer:", canvas.shape, "label", label.shape)
+
+
+def test_iter_render():
+    br.init_renderer()
+    texts = ["Stream", "chunk", "Stream", "label 3", "chunk"]
+    consumed = []
+
+    def source():
+        for t in texts:
+            consumed.append(t)
+            yield t
+
+    stream = br.iter_render(source(), chunk_size=2, font_size=20, color="navy")
+    index, first, metrics = next(stream)
+    assert index == 0 and len(consumed) == 2  # one chunk read at a time
+    assert np.array_equal(first, br.render_text_array("Stream", font_size=20, color="navy"))
+    assert metrics["font_size"] == 20 and metrics["text_width_px"] > 0
+    rest = list(stream)
+    assert [i for i, _, _ in rest] == [1, 2, 3, 4]
+    assert np.array_equal(rest[1][1], first) and rest[1][1] is not first
+
+    # repeats within a chunk are measured once and get their own metrics
+    same = list(br.iter_render(["Twice", "Twice"], chunk_size=2, font_size=20))
+    assert same[0][2] == same[1][2] and same[0][2] is not same[1][2]
+    # arrays are the caller's: editing one does not reach later repeats
+    edited = []
+    for _, arr, _ in br.iter_render(["ab", "cd", "ab", "ab"], chunk_size=4, with_metrics=False, font_size=20):
+        edited.append(arr.any())
+        arr[...] = 0
+    assert all(edited)
+
+    # prefetching on workers keeps input order and the same pixels
+    parallel = list(br.iter_render(texts * 20, chunk_size=16, workers=3, with_metrics=False,
+                                   font_size=20, color="navy"))
+    assert [i for i, _, _ in parallel] == list(range(len(texts) * 20))
+    assert all(m is None for _, _, m in parallel)
+    assert np.array_equal(parallel[2][1], first)
+    assert list(br.iter_render([], workers=2)) == []
+
+    try:
+        next(br.iter_render(texts, chunk_size=0))
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("chunk_size=0 should be rejected")
+    print("iter_render:", len(parallel), "labels")
+
+
+def _shared_cache_child(path, text, font_family):
+    import bangla_render as child_br
+
+    child_br.init_renderer(headless=True)
+    child_br.enable_shared_render_cache(path, size_mb=4)
+    img = child_br.render_text_qimage(text, font_family=font_family, font_size=36)
+    info = child_br.get_shared_render_cache_info()
+    child_br.disable_shared_render_cache()
+    return info["hits"], img.width(), img.height()
+
+
+def test_shared_render_cache():
+    import multiprocessing
+    import tempfile
+
+    path = os.path.join(tempfile.mkdtemp(), "render.cache")
+    family = br.resolve_font()
+    text = "ভাগ করা লেবেল"
+    try:
+        br.enable_shared_render_cache(path, size_mb=4)
+        br.clear_render_cache()
+        first = br.render_text_qimage(text, font_family=family, font_size=36)
+        assert br.get_shared_render_cache_info()["stores"] >= 1
+
+        # a fresh process maps the same arena and hits without rendering
+        ctx = multiprocessing.get_context("spawn")
+        with ctx.Pool(1) as pool:
+            hits, w, h = pool.apply(_shared_cache_child, (path, text, family))
+        assert hits == 1 and (w, h) == (first.width(), first.height())
+
+        # re-mapping in this process: served from the arena, same pixels
+        br.enable_shared_render_cache(path, size_mb=4)
+        br.clear_render_cache()
+        again = br.render_text_qimage(text, font_family=family, font_size=36)
+        info = br.get_shared_render_cache_info()
+        assert info["hits"] == 1 and again == first
+    finally:
+        br.disable_shared_render_cache()
+    print("Shared render cache:", info)
+
+
+def test_shared_render_cache_integrity():
+    import mmap
+    import tempfile
+
+    from bangla_render import shm_cache
+
+    path = os.path.join(tempfile.mkdtemp(), "render.cache")
+    cache = shm_cache.SharedRenderCache(path, size_bytes=1 << 20, slots=64)
+    first = np.full((3, 5, 4), 7, np.uint8)
+    second = np.full((3, 5, 4), 9, np.uint8)
+    real_hash = shm_cache._bytes_hash
+    shm_cache._bytes_hash = lambda kb: 42  # every key collides
+    try:
+        cache.put(("first",), first, 0)
+        assert cache.get(("second",)) is None
+        cache.put(("second",), second, 0)
+        assert np.array_equal(cache.get(("first",)), first)
+        assert np.array_equal(cache.get(("second",)), second)
+    finally:
+        shm_cache._bytes_hash = real_hash
+        cache.close()
+
+    # an outdated arena is replaced, not truncated under a live mapping
+    with open(path, "wb") as f:
+        f.write(b"BRSC" + (1).to_bytes(4, "little") + bytes(4096))
+    fd = os.open(path, os.O_RDONLY)
+    live = mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+    try:
+        fresh = shm_cache.SharedRenderCache(path, size_bytes=1 << 20, slots=64)
+        assert len(live) == 4104 and live[:4] == b"BRSC"
+        assert os.fstat(fd).st_ino != os.stat(path).st_ino
+        fresh.put(("first",), first, 0)
+        assert np.array_equal(fresh.get(("first",)), first)
+        fresh.close()
+    finally:
+        live.close()
+        os.close(fd)
+    print("Shared render cache integrity: ok")
+
+
 # ─────────────────────────────────────────────────────────────────────
 # VISUAL TESTS
 # ─────────────────────────────────────────────────────────────────────
@@ -725,6 +1623,26 @@ def test_numeric_ticks():
     print("Saved numeric ticks ->", p)
 
 
+def test_bangla_number_formatting():
+    data = np.array([[1234567.891, -1234.5], [0.5, 1234567.891]])
+    lakh = br.format_bangla_numbers(data, decimals=2, grouping="lakh")
+    assert lakh.shape == data.shape
+    assert lakh[0, 0] == "১২,৩৪,৫৬৭.৮৯"
+    assert lakh[0, 1] == "-১,২৩৪.৫০"
+    assert lakh[0, 0] == lakh[1, 1]
+
+    thousands = br.format_bangla_numbers([1234567], grouping="thousands")
+    assert thousands[0] == "১,২৩৪,৫৬৭"
+
+    pct = br.format_bangla_numbers([0.125, 0.5], percent=True, decimals=1)
+    assert list(pct) == ["১২.৫%", "৫০.০%"]
+
+    labels, inverse = br.format_bangla_numbers(data, decimals=0, return_inverse=True)
+    assert len(labels) == 3
+    assert (labels[inverse] == br.format_bangla_numbers(data, decimals=0)).all()
+    print("Bangla number formatting OK:", lakh.tolist())
+
+
 def test_font_validation_snapshot():
     p = os.path.join(OUT_DIR, "font_validation_report.txt")
     lines = ["bangla_render font validation snapshot\n", "=" * 50 + "\n",
@@ -771,6 +1689,30 @@ def run_all_tests():
     test_basic_words()
     test_complex_words()
     test_paragraph()
+    test_paragraph_cache()
+    test_paragraph_tiles()
+    test_measure_texts()
+    test_render_executor()
+    test_figure_pool()
+    test_async_render()
+    test_render_server()
+    test_shared_render_cache()
+    test_shared_render_cache_integrity()
+    test_import_time()
+    test_lean_app_mode()
+    test_harfbuzz_engine()
+    test_pillow_engine()
+    test_font_fallback()
+    test_font_catalog()
+    test_font_validation_cache()
+    test_register_font_directory()
+    test_cache_key_canonicalization()
+    test_warm_render_cache()
+    test_render_cache_snapshot()
+    test_render_cache_cold_tier()
+    test_alpha_render_mode()
+    test_render_into_buffer()
+    test_iter_render()
 
     # single-subplot
     test_mpl_line_plot()
@@ -786,6 +1728,7 @@ def run_all_tests():
 
     # numeric / misc
     test_numeric_ticks()
+    test_bangla_number_formatting()
 
     # reports
     test_font_validation_snapshot()